@@ -0,0 +1,247 @@
+"""
+Офлайн-бенчмарк пути сравнения скриншотов.
+
+Работает на скриншотах из screenshots/ и screenshots/actual/ без браузера и сети. Пакетное
+сравнение выполняется на копиях пар во временной директории, поэтому файлы различий не попадают
+в репозиторий. Параметры движка берутся из config/config.ini (с переопределениями AUTOTESTS_<NAME>),
+как в тестах. Запуск из директории project:
+
+    python -m benchmarks.bench_comparison                    # сравнить с baseline.json
+    python -m benchmarks.bench_comparison --update-baseline  # сохранить текущие результаты как baseline.json
+
+При регрессии относительно сохраненного baseline.json процесс завершается с кодом 1.
+"""
+import argparse
+import glob
+import io
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import imagehash
+from PIL import Image
+
+from data.screenshot_masks import screenshot_masks
+from utils.baseline_index import BaselineRef
+from utils.comparison_engine import TieredComparisonEngine
+from utils.image_metrics import apply_masks, mask_image, tile_hashes, to_grayscale_array
+from utils.screenshot_comparer import ScreenshotComparer
+from utils.settings import load_settings
+
+SCREENSHOT_DIR = "screenshots"
+ACTUAL_SCREENSHOT_DIR = os.path.join("screenshots", "actual")
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def screenshot_pairs():
+    """
+    Возвращает имена скриншотов, для которых есть и эталон, и актуальный скриншот.
+    """
+    names = []
+    for path in sorted(glob.glob(os.path.join(ACTUAL_SCREENSHOT_DIR, "**", "*.png"), recursive=True)):
+        name = os.path.relpath(path, ACTUAL_SCREENSHOT_DIR).replace(os.sep, "/")
+        if not name.endswith("_diff.png") and os.path.exists(os.path.join(SCREENSHOT_DIR, name)):
+            names.append(name)
+    return names
+
+
+def read_bytes(path):
+    """
+    Читает файл целиком.
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def measure(fn, repeats):
+    """
+    Возвращает медиану времени выполнения fn в миллисекундах.
+    """
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def decode(data):
+    """
+    Декодирует PNG из байтов.
+    """
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        return image
+
+
+def hash_image(image, masks, grid):
+    """
+    Вычисляет хеши, которые считает движок: aHash изображения с масками или, при сетке, хеши плиток.
+    """
+    if grid:
+        tile_hashes(apply_masks(to_grayscale_array(image), masks), *grid)
+    else:
+        imagehash.average_hash(mask_image(image, masks))
+
+
+def engine_options(settings):
+    """
+    Возвращает параметры движка сравнения из настроек тестов.
+    """
+    return {"threshold": settings.threshold, "ambiguous_band": settings.ambiguous_band,
+            "ssim_threshold": settings.ssim_threshold, "tile_grid": settings.tile_grid,
+            "tile_threshold": settings.tile_threshold}
+
+
+def copy_pairs(names, target_dir):
+    """
+    Копирует эталоны и актуальные скриншоты в target_dir. Возвращает директории эталонов и актуальных скриншотов.
+    """
+    screenshot_dir = os.path.join(target_dir, "screenshots")
+    actual_screenshot_dir = os.path.join(screenshot_dir, "actual")
+    for name in names:
+        for source_dir, copy_dir in ((SCREENSHOT_DIR, screenshot_dir), (ACTUAL_SCREENSHOT_DIR, actual_screenshot_dir)):
+            os.makedirs(os.path.dirname(os.path.join(copy_dir, name)), exist_ok=True)
+            shutil.copyfile(os.path.join(source_dir, name), os.path.join(copy_dir, name))
+    return screenshot_dir, actual_screenshot_dir
+
+
+def run_batch(names, options, trace_memory=False):
+    """
+    Сравнивает все пары через ScreenshotComparer, как это делают тесты в дисковом режиме,
+    на копиях во временной директории. Возвращает время сравнения в миллисекундах, число совпавших пар
+    и пиковую память сравнения в байтах (при trace_memory).
+    """
+    with tempfile.TemporaryDirectory(prefix="bench_comparison_") as temp_dir:
+        comparer = ScreenshotComparer(*copy_pairs(names, temp_dir), **options)
+        if trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        passed = sum(comparer.compare_screenshots(name) for name in names)
+        elapsed = (time.perf_counter() - started) * 1000
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+    return elapsed, passed, peak
+
+
+def run(repeats):
+    """
+    Выполняет бенчмарк и возвращает метрики: время на изображение, на пакет, изображений в секунду, пиковую память.
+    """
+    names = screenshot_pairs()
+    if not names:
+        raise RuntimeError(f"Не найдены пары скриншотов в {SCREENSHOT_DIR} и {ACTUAL_SCREENSHOT_DIR}")
+    options = engine_options(load_settings())
+    engine = TieredComparisonEngine(**options)
+    grid = options["tile_grid"]
+
+    per_image = {}
+    for name in names:
+        actual = read_bytes(os.path.join(ACTUAL_SCREENSHOT_DIR, name))
+        expected_path = os.path.join(SCREENSHOT_DIR, name)
+        masks = tuple(screenshot_masks.get(name, ()))
+        image = decode(actual)
+        per_image[name] = {
+            "decode_ms": measure(lambda: decode(actual), repeats),
+            "hash_ms": measure(lambda: hash_image(image, masks, grid), repeats),
+            "compare_cold_ms": measure(lambda: engine.compare(actual, BaselineRef(expected_path, name), masks), repeats),
+        }
+        warm_baseline = engine.prepare(BaselineRef(expected_path, name), masks)
+        per_image[name]["compare_warm_ms"] = measure(lambda: engine.compare(actual, warm_baseline, masks), repeats)
+
+    batch_ms = statistics.median(run_batch(names, options)[0] for _ in range(repeats))
+    _, passed, peak = run_batch(names, options, trace_memory=True)
+
+    totals = {key: round(sum(image[key] for image in per_image.values()), 3) for key in next(iter(per_image.values()))}
+    return {
+        "images": len(names),
+        "passed": passed,
+        "batch_ms": round(batch_ms, 3),
+        "images_per_second": round(len(names) / (batch_ms / 1000), 2),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2),
+        "totals": totals,
+        "per_image": {name: {key: round(value, 3) for key, value in metrics.items()}
+                      for name, metrics in per_image.items()},
+        "platform": f"{platform.system()} {platform.machine()} Python {platform.python_version()}",
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """
+    Возвращает список регрессий: метрики, которые хуже сохраненных больше чем на tolerance.
+    """
+    found = []
+    checks = [("batch_ms", results["batch_ms"], baseline["batch_ms"]),
+              ("peak_memory_mb", results["peak_memory_mb"], baseline["peak_memory_mb"])]
+    checks += [(f"totals.{key}", value, baseline["totals"][key])
+               for key, value in results["totals"].items() if key in baseline["totals"]]
+    for metric, value, expected in checks:
+        if value > expected * (1 + tolerance):
+            found.append(f"{metric}: {value} > {expected} (+{(value / expected - 1) * 100:.0f}%)")
+    if results["passed"] < baseline["passed"]:
+        found.append(f"passed: {results['passed']} < {baseline['passed']}")
+    return found
+
+
+def print_results(results):
+    """
+    Печатает таблицу результатов.
+    """
+    print(f"{'Скриншот':<55} {'decode':>8} {'hash':>8} {'cold':>8} {'warm':>8}  мс")
+    for name, metrics in results["per_image"].items():
+        print(f"{name:<55} {metrics['decode_ms']:>8.2f} {metrics['hash_ms']:>8.2f} "
+              f"{metrics['compare_cold_ms']:>8.2f} {metrics['compare_warm_ms']:>8.2f}")
+    totals = results["totals"]
+    print(f"{'Итого':<55} {totals['decode_ms']:>8.2f} {totals['hash_ms']:>8.2f} "
+          f"{totals['compare_cold_ms']:>8.2f} {totals['compare_warm_ms']:>8.2f}")
+    print(f"Пакет: {results['images']} изображений за {results['batch_ms']:.1f} мс "
+          f"({results['images_per_second']} изобр./с), совпали: {results['passed']}, "
+          f"пиковая память: {results['peak_memory_mb']} МБ")
+
+
+def main(argv=None):
+    """
+    Точка входа: выполняет бенчмарк и сверяет результаты с baseline.
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк сравнения скриншотов")
+    parser.add_argument("--repeats", type=int, default=5, help="Число повторов каждого замера (берется медиана)")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Допустимое ухудшение относительно baseline.json")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Путь к сохраненным результатам")
+    parser.add_argument("--update-baseline", action="store_true", help="Сохранить текущие результаты как baseline")
+    args = parser.parse_args(argv)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    results = run(args.repeats)
+    print_results(results)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=1, ensure_ascii=False)
+        print(f"Baseline сохранен: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"Baseline не найден: {args.baseline}. Запустите с --update-baseline.")
+        return 1
+    with open(args.baseline, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    found = regressions(results, baseline, args.tolerance)
+    if found:
+        print(f"РЕГРЕССИЯ производительности относительно {args.baseline} (допуск {args.tolerance:.0%}):")
+        for regression in found:
+            print(f"  {regression}")
+        return 1
+    print("Регрессий не обнаружено")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+# Каталог локального магазина-заменителя (utils/local_shop.py).
+# Названия, ссылки и цены товаров из тестовых данных совпадают с demowebshop.
+
+categories = {
+    "books": "Books",
+    "computers": "Computers",
+    "electronics": "Electronics",
+    "apparel-shoes": "Apparel & Shoes",
+    "digital-downloads": "Digital downloads",
+    "jewelry": "Jewelry",
+    "gift-cards": "Gift Cards",
+}
+
+products = {
+    "computing-and-internet": {"name": "Computing and Internet", "price": "10.00", "category": "books"},
+    "fiction": {"name": "Fiction", "price": "24.00", "category": "books"},
+    "health-book": {"name": "Health Book", "price": "10.00", "category": "books"},
+    "141-inch-laptop": {"name": "14.1-inch Laptop", "price": "1590.00", "category": "computers"},
+    "smartphone": {"name": "Smartphone", "price": "100.00", "category": "electronics"},
+    "used-phone": {"name": "Used phone", "price": "5.00", "category": "electronics"},
+    "blue-jeans": {"name": "Blue Jeans", "price": "1.00", "category": "apparel-shoes"},
+    "music-2": {"name": "Music 2", "price": "10.00", "category": "digital-downloads"},
+    "black-white-diamond-heart": {"name": "Black & White Diamond Heart", "price": "130.00", "category": "jewelry"},
+    "25-virtual-gift-card": {"name": "$25 Virtual Gift Card", "price": "25.00", "category": "gift-cards"},
+}
+
+countries = ["United States", "Canada", "Germany", "Russia"]
+
+# Пользователь из data/user.py, существующий с момента запуска сервера
+seed_customers = [
+    {"email": "emailemailemail@gmail.com", "password": "123456", "first_name": "first_name",
+     "last_name": "last_name", "gender": "M"},
+]
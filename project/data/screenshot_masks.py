@@ -0,0 +1,32 @@
+# Области скриншотов (x, y, width, height), которые не участвуют в сравнении.
+
+# Email пользователя и счетчики корзины/списка желаний в шапке
+header_account_links = (660, 55, 450, 40)
+# Случайные имя и фамилия в форме профиля
+profile_name_fields = (535, 332, 185, 48)
+# Случайные имена и город в списке адресов
+address_list = (385, 280, 710, 160)
+# Анимированный индикатор загрузки фильтра по цене на странице категории
+price_filter_spinner = (630, 350, 120, 110)
+
+screenshot_masks = {
+    "login_page/login_page_success.png": [header_account_links],
+    "cart_page/cart_add_from_product_page.png": [header_account_links],
+    "cart_page/cart_add_from_category_page.png": [header_account_links, price_filter_spinner],
+    "cart_page/cart_remove_item.png": [header_account_links],
+    "category_page/category_page_products_list.png": [price_filter_spinner],
+    "wishlist_page/wishlist_add_from_product_page.png": [header_account_links],
+    "wishlist_page/add_to_cart_from_wishlist.png": [header_account_links],
+    "wishlist_page/wishlist_remove_item.png": [header_account_links],
+    "checkout/successful_checkout.png": [header_account_links],
+    "checkout/successful_order_page.png": [header_account_links],
+    "profile_management/edit_profile_success.png": [header_account_links, profile_name_fields],
+    "profile_management/edit_profile_empty.png": [header_account_links],
+    "profile_management/edit_invalid_email.png": [header_account_links],
+    "profile_management/add_new_address.png": [header_account_links, address_list],
+    "profile_management/edit_existing_address.png": [header_account_links, address_list],
+    "profile_management/delete_existing_address.png": [header_account_links, address_list],
+    "profile_management/change_password.png": [header_account_links],
+    "profile_management/change_password_invalid.png": [header_account_links],
+    "profile_management/change_password_mismatched.png": [header_account_links],
+}
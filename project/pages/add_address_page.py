@@ -1,39 +1,39 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 from utils.logger import logger
 
 class AddAddressPage(BasePage):
     """
     Класс, представляющий страницу добавления адреса.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.first_name_field = "#Address_FirstName"
-        self.last_name_field = "#Address_LastName"
-        self.email_field = "#Address_Email"
-        self.country_dropdown = "#Address_CountryId"
-        self.city_field = "#Address_City"
-        self.address1_field = "#Address_Address1"
-        self.zip_code_field = "#Address_ZipPostalCode"
-        self.phone_number_field = "#Address_PhoneNumber"
-        self.save_button = "input.button-1.save-address-button"
-        self.address_list = "div.address-list"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "#Address_FirstName"
+
+    first_name_field = "#Address_FirstName"
+    last_name_field = "#Address_LastName"
+    email_field = "#Address_Email"
+    country_dropdown = "#Address_CountryId"
+    city_field = "#Address_City"
+    address1_field = "#Address_Address1"
+    zip_code_field = "#Address_ZipPostalCode"
+    phone_number_field = "#Address_PhoneNumber"
+    save_button = "input.button-1.save-address-button"
+    address_list = "div.address-list"
 
     def fill_address_form(self, first_name, last_name, email, country, city, address1, zip_code, phone_number):
         """
         Заполняет форму добавления адреса.
         """
         try:
-            self.page.fill(self.first_name_field, first_name)
-            self.page.fill(self.last_name_field, last_name)
-            self.page.fill(self.email_field, email)
-            self.page.select_option(self.country_dropdown, country)
-            self.page.fill(self.city_field, city)
-            self.page.fill(self.address1_field, address1)
-            self.page.fill(self.zip_code_field, zip_code)
-            self.page.fill(self.phone_number_field, phone_number)
+            self.locator(self.first_name_field).fill(first_name)
+            self.locator(self.last_name_field).fill(last_name)
+            self.locator(self.email_field).fill(email)
+            self.locator(self.country_dropdown).select_option(country)
+            self.locator(self.city_field).fill(city)
+            self.locator(self.address1_field).fill(address1)
+            self.locator(self.zip_code_field).fill(zip_code)
+            self.locator(self.phone_number_field).fill(phone_number)
         except Exception as e:
             logger.error(f"Ошибка при заполнении формы адреса: {e}")
             raise
@@ -53,7 +53,7 @@ class AddAddressPage(BasePage):
         Проверяет, что адрес отображается на странице.
         """
         try:
-            expect(self.page.locator(self.address_list)).to_contain_text(expected_city)
+            expect(self.locator(self.address_list)).to_contain_text(expected_city)
         except Exception as e:
             logger.error(f"Ошибка при проверке отображения адреса: {e}")
             raise
@@ -1,26 +1,28 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from pages.add_address_page import AddAddressPage
+from pages.records import ADDRESS_ITEMS_SCRIPT, AddressRecord
 from utils.logger import logger
 
 class AddressesPage(BasePage):
     """
     Класс, представляющий страницу управления адресами.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.add_new_address_button = "input.button-1.add-address-button"
-        self.address_list = "div.address-list"
-        self.edit_address_button = "input.button-2.edit-address-button"
-        self.delete_address_button = "input.button-2.delete-address-button"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "input.button-1.add-address-button"
+
+    add_new_address_button = "input.button-1.add-address-button"
+    address_list = "div.address-list"
+    edit_address_button = "input.button-2.edit-address-button"
+    delete_address_button = "input.button-2.delete-address-button"
+    address_items = "div.address-list div.address-item"
 
     def goto_add_new_address(self):
         """
         Переходит на страницу добавления нового адреса.
         """
         try:
-            self.click(self.add_new_address_button, "Add new address button")
+            self.navigate(self.add_new_address_button, AddAddressPage, "Add new address button")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу добавления адреса: {e}")
             raise
@@ -30,17 +32,28 @@ class AddressesPage(BasePage):
         Возвращает количество адресов в списке.
         """
         try:
-            return len(self.page.locator(self.address_list).locator("div.address-item").all())
+            return self.locator(self.address_items).count()
         except Exception as e:
             logger.error(f"Ошибка при получении количества адресов: {e}")
             raise
 
+    def get_addresses(self):
+        """
+        Возвращает все адреса списка одним вызовом в браузер.
+        """
+        try:
+            return [AddressRecord.from_dom(item)
+                    for item in self.locator(self.address_items).evaluate_all(ADDRESS_ITEMS_SCRIPT)]
+        except Exception as e:
+            logger.error(f"Ошибка при получении списка адресов: {e}")
+            raise
+
     def click_first_edit_address_button(self):
         """
         Нажимает на кнопку редактирования адреса.
         """
         try:
-            self.page.locator(self.edit_address_button).first.click()
+            self.locator(self.edit_address_button).first.click()
         except Exception as e:
             logger.error(f"Ошибка при нажатии на кнопку редактирования адреса: {e}")
             raise
@@ -50,7 +63,7 @@ class AddressesPage(BasePage):
         Нажимает на кнопку удаления первого адреса.
         """
         try:
-            self.page.locator(self.delete_address_button).first.click()
+            self.locator(self.delete_address_button).first.click()
         except Exception as e:
             logger.error(f"Ошибка при нажатии на кнопку удаления адреса: {e}")
             raise
@@ -0,0 +1,48 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.add_address_page import AddAddressPage
+from playwright.async_api import expect
+from utils.logger import logger
+
+class AsyncAddAddressPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы добавления адреса.
+    """
+    __slots__ = ()
+    sync_page = AddAddressPage
+
+    async def fill_address_form(self, first_name, last_name, email, country, city, address1, zip_code, phone_number):
+        """
+        Заполняет форму добавления адреса.
+        """
+        try:
+            await self.locator(self.first_name_field).fill(first_name)
+            await self.locator(self.last_name_field).fill(last_name)
+            await self.locator(self.email_field).fill(email)
+            await self.locator(self.country_dropdown).select_option(country)
+            await self.locator(self.city_field).fill(city)
+            await self.locator(self.address1_field).fill(address1)
+            await self.locator(self.zip_code_field).fill(zip_code)
+            await self.locator(self.phone_number_field).fill(phone_number)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении формы адреса: {e}")
+            raise
+
+    async def save_address(self):
+        """
+        Сохраняет адрес.
+        """
+        try:
+            await self.click(self.save_button)
+        except Exception as e:
+            logger.error(f"Ошибка при сохранении адреса: {e}")
+            raise
+
+    async def verify_address_displayed(self, expected_city):
+        """
+        Проверяет, что адрес отображается на странице.
+        """
+        try:
+            await expect(self.locator(self.address_list)).to_contain_text(expected_city)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке отображения адреса: {e}")
+            raise
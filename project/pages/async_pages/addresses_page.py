@@ -0,0 +1,63 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.addresses_page import AddressesPage
+from pages.add_address_page import AddAddressPage
+from pages.records import ADDRESS_ITEMS_SCRIPT, AddressRecord
+from utils.logger import logger
+
+class AsyncAddressesPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы управления адресами.
+    """
+    __slots__ = ()
+    sync_page = AddressesPage
+
+    async def goto_add_new_address(self):
+        """
+        Переходит на страницу добавления нового адреса.
+        """
+        try:
+            await self.navigate(self.add_new_address_button, AddAddressPage, "Add new address button")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу добавления адреса: {e}")
+            raise
+
+    async def get_address_count(self):
+        """
+        Возвращает количество адресов в списке.
+        """
+        try:
+            return await self.locator(self.address_items).count()
+        except Exception as e:
+            logger.error(f"Ошибка при получении количества адресов: {e}")
+            raise
+
+    async def get_addresses(self):
+        """
+        Возвращает все адреса списка одним вызовом в браузер.
+        """
+        try:
+            items = await self.locator(self.address_items).evaluate_all(ADDRESS_ITEMS_SCRIPT)
+            return [AddressRecord.from_dom(item) for item in items]
+        except Exception as e:
+            logger.error(f"Ошибка при получении списка адресов: {e}")
+            raise
+
+    async def click_first_edit_address_button(self):
+        """
+        Нажимает на кнопку редактирования адреса.
+        """
+        try:
+            await self.locator(self.edit_address_button).first.click()
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии на кнопку редактирования адреса: {e}")
+            raise
+
+    async def click_first_delete_address_button(self):
+        """
+        Нажимает на кнопку удаления первого адреса.
+        """
+        try:
+            await self.locator(self.delete_address_button).first.click()
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии на кнопку удаления адреса: {e}")
+            raise
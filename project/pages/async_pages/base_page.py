@@ -0,0 +1,171 @@
+from playwright.async_api import expect
+from pages.base_page import EXPECT_TIMEOUT, IMAGES_LOADED_SCRIPT, BasePage, PageObject
+from utils.logger import logger
+from utils.screenshot_buffer import screenshot_buffer
+from utils.capture_profile import capture_options
+from utils.wait_policy import wait_policy
+import os
+
+class AsyncBasePage(PageObject):
+    """
+    Базовый класс асинхронных страниц (playwright.async_api).
+
+    Асинхронная страница — двойник синхронной страницы sync_page: селекторы читаются
+    из атрибутов класса sync_page, поэтому описаны в одном месте, а методы повторяют
+    синхронные как корутины. Синхронные методы не наследуются, чтобы вызов без await
+    не мог незаметно вернуть синхронный результат.
+    """
+    __slots__ = ()
+    sync_page = BasePage
+
+    def __getattr__(self, name):
+        value = getattr(self.sync_page, name, None)
+        if isinstance(value, str):
+            return value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def waiting(self, action, locator, fallback=None):
+        """
+        Возвращает контекстный менеджер ожидания с адаптивным таймаутом (общая с синхронными страницами история).
+        """
+        return wait_policy.measure(self.wait_scope, action, locator, fallback)
+
+    async def goto(self, path=""):
+        """
+        Переходит по указанному пути
+        """
+        try:
+            url = f"{self.base_url}/{path}"
+            logger.info(f"Переход по: {url}")
+            with self.waiting("goto", f"/{path}") as timeout:
+                await self.page.goto(url, wait_until=self.sync_page.wait_until, timeout=timeout)
+            if self.sync_page.ready_selector:
+                await self.wait_visible(self.sync_page.ready_selector, f"{self.sync_page.__name__} ready", fallback=None)
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу: {e}")
+            raise
+
+    async def wait_ready(self, page_class=None):
+        """
+        Ожидает готовности страницы page_class (синхронного класса страницы, по умолчанию sync_page):
+        ключевого селектора и состояния загрузки wait_until.
+        """
+        page_class = page_class or self.sync_page
+        try:
+            if page_class.ready_selector:
+                await self.wait_visible(page_class.ready_selector, f"{page_class.__name__} ready", fallback=None)
+            if page_class.wait_until != "commit":
+                with self.waiting("load_state", page_class.wait_until) as timeout:
+                    await self.page.wait_for_load_state(page_class.wait_until, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Страница {page_class.__name__} не готова: {e}")
+            raise
+
+    async def navigate(self, locator, page_class, description=None):
+        """
+        Кликает на элемент, ведущий на страницу page_class, и ожидает ее готовности
+        после начала навигации.
+        """
+        with self.waiting("navigation", page_class.__name__) as timeout:
+            async with self.page.expect_navigation(wait_until="commit", timeout=timeout):
+                await self.click(locator, description)
+        await self.wait_ready(page_class)
+
+    async def wait_settled(self):
+        """
+        Ожидает полной загрузки страницы перед скриншотом: события load и загрузки всех изображений.
+        """
+        try:
+            with self.waiting("load_state", "load") as timeout:
+                await self.page.wait_for_load_state("load", timeout=timeout)
+            with self.waiting("images_loaded", "img") as timeout:
+                await self.page.wait_for_function(IMAGES_LOADED_SCRIPT, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Страница не загрузилась полностью: {e}")
+            raise
+
+    async def click(self, locator, description=None):
+        """
+        Кликает на элемент.
+        """
+        try:
+            logger.info(f"Клик на элемент: {description or locator}")
+            with self.waiting("click", locator) as timeout:
+                await self.locator(locator).click(timeout=timeout)
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии на элемент '{description or locator}': {e}")
+            raise
+
+    async def fill(self, locator, text, description=None):
+        """
+        Заполняет текстовое поле.
+        """
+        try:
+            logger.info(f"Заполнен '{description or locator}' текстом: {text}")
+            with self.waiting("fill", locator) as timeout:
+                await self.locator(locator).fill(text, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении поля '{description or locator}': {e}")
+            raise
+
+    async def get_text(self, locator, description=None):
+        """
+        Возвращает текст элемента.
+        """
+        try:
+            with self.waiting("inner_text", locator) as timeout:
+                text = await self.locator(locator).inner_text(timeout=timeout)
+            logger.info(f"Получить текст '{description or locator}': {text}")
+            return text
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста из '{description or locator}': {e}")
+            raise
+
+    async def wait_visible(self, locator, description=None, fallback=EXPECT_TIMEOUT):
+        """
+        Ожидает появления элемента с адаптивным таймаутом (без истории — fallback, как проверка expect).
+        """
+        try:
+            with self.waiting("to_be_visible", locator, fallback) as timeout:
+                await expect(self.locator(locator)).to_be_visible(timeout=timeout)
+        except Exception as e:
+            logger.error(f"Элемент '{description or locator}' не появился: {e}")
+            raise
+
+    async def is_visible(self, locator, description=None):
+        """
+        Проверяет видимость элемента.
+        """
+        try:
+            logger.info(f"Проверка видимости элемента: {description or locator}")
+            return await self.locator(locator).is_visible()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости элемента '{description or locator}': {e}")
+            raise
+
+    async def take_screenshot(self, screenshot_name, profile=None):
+        """
+        Делает скриншот полностью загруженной страницы и сохраняет его в указанную директорию.
+        При screenshot_storage = memory скриншот остаётся в памяти до сравнения.
+        profile — профиль захвата из config.ini, по умолчанию capture_profile из [DEFAULT].
+        """
+        try:
+            screenshot_path = os.path.join(self.actual_screenshot_dir, screenshot_name)
+            options = capture_options(self.config, profile or self.capture_profile)
+            await self.wait_settled()
+            if self.screenshot_storage == "memory":
+                logger.info(f"Получен скриншот (в памяти): {screenshot_name}")
+                screenshot_buffer.put(screenshot_name, await self.page.screenshot(**options))
+                return screenshot_path
+
+            os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
+            # Прежний файл может быть ссылкой на блоб хранилища: удаляем его, а не перезаписываем
+            if os.path.exists(screenshot_path):
+                os.remove(screenshot_path)
+
+            logger.info(f"Получен скриншот: {screenshot_path}")
+            await self.page.screenshot(path=screenshot_path, **options)
+            return screenshot_path
+        except Exception as e:
+            logger.error(f"Ошибка при создании скриншота: {e}")
+            raise
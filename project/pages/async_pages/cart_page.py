@@ -0,0 +1,74 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.records import CART_ROWS_SCRIPT, CartRow
+from utils.logger import logger
+
+class AsyncCartPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы корзины.
+    """
+    __slots__ = ()
+    sync_page = CartPage
+
+    async def goto_checkout(self):
+        """
+        Переходит на страницу оформления заказа.
+        """
+        try:
+            await self.navigate(self.checkout_button, CheckoutPage)
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу оформления заказа: {e}")
+            raise
+
+    async def accept_term_of_service(self):
+        """
+        Принимает условия обслуживания.
+        """
+        try:
+            await self.locator(self.termsofservice_checkbox).check()
+        except Exception as e:
+            logger.error(f"Ошибка при принятии условий обслуживания: {e}")
+            raise
+
+    async def remove_from_cart(self, index=1):
+        """
+        Удаляет товар из корзины.
+        """
+        try:
+            await self.locator(self.remove_checkbox).nth(index - 1).check()
+        except Exception as e:
+            logger.error(f"Ошибка при удалении товара из корзины: {e}")
+            raise
+
+    async def update_cart(self):
+        """
+        Обновляет корзину.
+        """
+        try:
+            await self.locator(self.update_cart_button).click()
+        except Exception as e:
+            logger.error(f"Ошибка при обновлении корзины: {e}")
+            raise
+
+    async def is_cart_empty(self):
+        """
+        Проверяет, пуста ли корзина.
+        """
+        try:
+            await self.wait_visible(self.cart_content)
+            return "Your Shopping Cart is empty!" in await self.locator(self.cart_content).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке, пуста ли корзина: {e}")
+            raise
+
+    async def get_rows(self):
+        """
+        Возвращает все строки корзины одним вызовом в браузер.
+        """
+        try:
+            rows = await self.locator(self.cart_table_row).evaluate_all(CART_ROWS_SCRIPT)
+            return [CartRow.from_dom(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Ошибка при получении строк корзины: {e}")
+            raise
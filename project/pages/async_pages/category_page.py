@@ -0,0 +1,54 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.category_page import CategoryPage
+from pages.records import PRODUCT_CARDS_SCRIPT, ProductCard
+from utils.logger import logger
+
+class AsyncCategoryPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы категории товаров.
+    """
+    __slots__ = ()
+    sync_page = CategoryPage
+
+    async def get_product_count(self):
+        """
+        Возвращает количество товаров в категории.
+        """
+        try:
+            return await self.locator(self.product_items).count()
+        except Exception as e:
+            logger.error(f"Ошибка при получении количества товаров в категории: {e}")
+            raise
+
+    async def get_products(self):
+        """
+        Возвращает все карточки товаров категории одним вызовом в браузер.
+        """
+        try:
+            items = await self.locator(self.product_items).evaluate_all(PRODUCT_CARDS_SCRIPT)
+            products = [ProductCard.from_dom(item) for item in items]
+            logger.info(f"Получены карточки товаров категории: {len(products)}")
+            return products
+        except Exception as e:
+            logger.error(f"Ошибка при получении карточек товаров категории: {e}")
+            raise
+
+    async def get_product_name(self, index):
+        """
+        Возвращает имя товара по указанному индексу.
+        """
+        try:
+            return (await self.get_products())[index].name
+        except Exception as e:
+            logger.error(f"Ошибка при получении имени товара по индексу {index}: {e}")
+            raise
+
+    async def goto(self, path):
+        """
+        Переходит по указанному пути.
+        """
+        try:
+            await super().goto(path)
+        except Exception as e:
+            logger.error(f"Ошибка при переходе по пути '{path}': {e}")
+            raise
@@ -0,0 +1,63 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.change_password_page import ChangePasswordPage
+from playwright.async_api import expect
+from utils.logger import logger
+
+class AsyncChangePasswordPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы изменения пароля.
+    """
+    __slots__ = ()
+    sync_page = ChangePasswordPage
+
+    async def change_password(self, old_password, new_password, confirm_new_password):
+        """
+        Заполняет поля для изменения пароля.
+        """
+        try:
+            await self.locator(self.old_password_field).fill(old_password)
+            await self.locator(self.new_password_field).fill(new_password)
+            await self.locator(self.confirm_new_password_field).fill(confirm_new_password)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении полей изменения пароля: {e}")
+            raise
+
+    async def save_password_changes(self):
+        """
+        Сохраняет изменения пароля.
+        """
+        try:
+            await self.click(self.change_password_button, "Change password button")
+        except Exception as e:
+            logger.error(f"Ошибка при сохранении изменений пароля: {e}")
+            raise
+
+    async def verify_success_message(self, expected_message="Password was changed"):
+        """
+        Проверяет отображение сообщения об успешном изменении пароля.
+        """
+        try:
+            await expect(self.locator(self.success_message_locator).first).to_have_text(expected_message)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке сообщения об успехе: {e}")
+            raise
+
+    async def verify_old_password_error(self, expected_error="Old password doesn't match"):
+        """
+        Проверяет отображение сообщения об ошибке при вводе неверного пароля.
+        """
+        try:
+            await expect(self.locator(self.old_password_error_locator).first).to_have_text(expected_error)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке сообщения об ошибке для старого пароля: {e}")
+            raise
+
+    async def verify_new_password_mismatch_error(self, expected_error="The new password and confirmation password do not match."):
+        """
+        Проверяет отображение сообщения об ошибке при неудачном подтверждении пароля.
+        """
+        try:
+            await expect(self.locator(self.new_password_mismatch_locator).first).to_have_text(expected_error)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке сообщения о неудачном подтверждении пароля: {e}")
+            raise
@@ -0,0 +1,113 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.checkout_page import CheckoutPage
+from utils.logger import logger
+
+class AsyncCheckoutPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы оформления заказа.
+    """
+    __slots__ = ()
+    sync_page = CheckoutPage
+
+    async def fill_billing_address(self, country, city, address1, zip_code, phone_number):
+        """
+        Заполняет форму адреса для выставления счета.
+        """
+        try:
+            await self.locator(self.billing_country_dropdown).select_option(country)
+            await self.locator(self.billing_city_field).fill(city)
+            await self.locator(self.billing_address1_field).fill(address1)
+            await self.locator(self.billing_zip_code_field).fill(zip_code)
+            await self.locator(self.billing_phone_number_field).fill(phone_number)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении адреса для выставления счета: {e}")
+            raise
+
+    async def fill_shipping_address(self, country, city, address1, zip_code, phone_number):
+        """
+        Заполняет форму адреса доставки.
+        """
+        try:
+            await self.locator(self.shipping_country_dropdown).select_option(country)
+            await self.locator(self.shipping_city_field).fill(city)
+            await self.locator(self.shipping_address1_field).fill(address1)
+            await self.locator(self.shipping_zip_code_field).fill(zip_code)
+            await self.locator(self.shipping_phone_number_field).fill(phone_number)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении адреса доставки: {e}")
+            raise
+
+    async def click_continue_billing(self):
+        """
+        Нажимает кнопку следующего шага на шаге выставления счета.
+        """
+        try:
+            await self.locator(self.continue_billing_button).click()
+            await self.wait_visible("#opc-shipping")
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии кнопки следующего шага на шаге выставления счета: {e}")
+            raise
+
+    async def click_continue_shipping(self):
+        """
+        Нажимает кнопку следующего шага на шаге доставки.
+        """
+        try:
+            await self.locator(self.continue_shipping_button).click()
+            await self.wait_visible("#opc-shipping_method")
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии кнопки следующего шага на шаге доставки: {e}")
+            raise
+
+    async def click_shipping_method_next_step(self):
+        """
+        Нажимает кнопку следующего шага на шаге выбора способа доставки.
+        """
+        try:
+            await self.locator(self.shipping_method_next_step).click()
+            await self.wait_visible("#opc-payment_method")
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии кнопки следующего шага на шаге выбора способа доставки: {e}")
+            raise
+
+    async def click_payment_method_next_step(self):
+        """
+        Нажимает кнопку следующего шага на шаге выбора способа оплаты.
+        """
+        try:
+            await self.locator(self.payment_method_next_step).click()
+            await self.wait_visible("#opc-payment_info")
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии кнопки следующего шага на шаге выбора способа оплаты: {e}")
+            raise
+
+    async def click_payment_info_next_step(self):
+        """
+        Нажимает кнопку следующего шага на шаге ввода информации об оплате.
+        """
+        try:
+            await self.locator(self.payment_info_next_step).click()
+            await self.wait_visible("#opc-confirm_order")
+        except Exception as e:
+            logger.error(f"Ошибка при нажатии кнопки следующего шага на шаге ввода информации об оплате: {e}")
+            raise
+
+    async def click_confirm_order(self):
+        """
+        Подтверждает заказ.
+        """
+        try:
+            await self.locator(self.confirm_order_button).click()
+        except Exception as e:
+            logger.error(f"Ошибка при подтверждении заказа: {e}")
+            raise
+
+    async def get_order_success_message(self):
+        """
+        Возвращает сообщение об успешном оформлении заказа.
+        """
+        try:
+            return await self.locator(self.order_success_message).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при получении сообщения об успешном оформлении заказа: {e}")
+            raise
@@ -0,0 +1,120 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.home_page import HomePage
+from pages.cart_page import CartPage
+from pages.category_page import CategoryPage
+from pages.login_page import LoginPage
+from pages.my_account_page import MyAccountPage
+from pages.register_page import RegisterPage
+from pages.search_results_page import SearchResultsPage
+from pages.wishlist_page import WishlistPage
+from utils.logger import logger
+
+class AsyncHomePage(AsyncBasePage):
+    """
+    Асинхронный двойник главной страницы.
+    """
+    __slots__ = ()
+    sync_page = HomePage
+
+    async def goto(self):
+        """
+        Переходит на главную страницу.
+        """
+        try:
+            await super().goto()
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на главную страницу: {e}")
+            raise
+
+    async def goto_register_page(self):
+        """
+        Переходит на страницу регистрации.
+        """
+        try:
+            await self.navigate(self.register_link, RegisterPage, "Register link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу регистрации: {e}")
+            raise
+
+    async def goto_login_page(self):
+        """
+        Переходит на страницу входа.
+        """
+        try:
+            await self.navigate(self.login_link, LoginPage, "Login link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу входа: {e}")
+            raise
+
+    async def is_logged_in(self):
+        """
+        Проверяет, залогинен ли пользователь.
+        """
+        try:
+            return await self.is_visible(self.logout_link)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке, залогинен ли пользователь: {e}")
+            raise
+
+    async def logout(self):
+        """
+        Выходит из системы.
+        """
+        try:
+            await self.click(self.logout_link, "Logout link")
+        except Exception as e:
+            logger.error(f"Ошибка при выходе из системы: {e}")
+            raise
+
+    async def goto_account_page(self, email):
+        """
+        Переходит на страницу аккаунта пользователя.
+        """
+        try:
+            account = f'{self.account_link}:text("{email}")'
+            await self.navigate(account, MyAccountPage, 'Account link with email')
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу аккаунта: {e}")
+            raise
+
+    async def search(self, term):
+        """
+        Выполняет поиск товара.
+        """
+        try:
+            await self.fill(self.search_field, term, "Search field")
+            await self.navigate(self.search_button, SearchResultsPage, "Search button")
+        except Exception as e:
+            logger.error(f"Ошибка при выполнении поиска: {e}")
+            raise
+
+    async def goto_cart(self):
+        """
+        Переходит в корзину.
+        """
+        try:
+            await self.navigate(self.ico_cart, CartPage, "Cart link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе в корзину: {e}")
+            raise
+
+    async def goto_wishlist(self):
+        """
+        Переходит в список желаний.
+        """
+        try:
+            await self.navigate(self.ico_wishlist, WishlistPage, "Wishlist link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе в список желаний: {e}")
+            raise
+
+    async def click_category(self, category_name: str):
+        """
+        Переходит в указанную категорию.
+        """
+        try:
+            selector = self.category.format(category_name=category_name)
+            await self.navigate(selector, CategoryPage, f"{category_name} category link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе в категорию '{category_name}': {e}")
+            raise
@@ -0,0 +1,42 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+from utils.logger import logger
+
+class AsyncLoginPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы входа в систему.
+    """
+    __slots__ = ()
+    sync_page = LoginPage
+
+    async def login(self, email, password):
+        """
+        Выполняет вход в систему с указанным email и паролем.
+        """
+        try:
+            await self.fill(self.email_field, email, "Email field")
+            await self.fill(self.password_field, password, "Password field")
+            await self.click(self.login_button, "Login button")
+        except Exception as e:
+            logger.error(f"Ошибка при попытке входа в систему: {e}")
+            raise
+
+    async def get_error_message_text(self):
+        """
+        Возвращает текст сообщения об ошибке.
+        """
+        try:
+            return await self.get_text(self.error_message, "Error message")
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста сообщения об ошибке: {e}")
+            raise
+
+    async def is_error_message_visible(self):
+        """
+        Проверяет, отображается ли сообщение об ошибке.
+        """
+        try:
+            return await self.is_visible(self.error_message, "Error message")
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости сообщения об ошибке: {e}")
+            raise
@@ -0,0 +1,92 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.my_account_page import MyAccountPage
+from pages.addresses_page import AddressesPage
+from pages.change_password_page import ChangePasswordPage
+from pages.orders_page import OrdersPage
+from playwright.async_api import expect
+from utils.logger import logger
+
+class AsyncMyAccountPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы аккаунта пользователя.
+    """
+    __slots__ = ()
+    sync_page = MyAccountPage
+
+    async def goto_change_password(self):
+        """
+        Переходит на страницу изменения пароля.
+        """
+        try:
+            await self.navigate(self.change_password_link, ChangePasswordPage, "Change password link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу изменения пароля: {e}")
+            raise
+
+    async def goto_orders(self):
+        """
+        Переходит на страницу заказов.
+        """
+        try:
+            await self.navigate(self.orders_link, OrdersPage, "Orders link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу заказов: {e}")
+            raise
+
+    async def goto_addresses(self):
+        """
+        Переходит на страницу адресов.
+        """
+        try:
+            await self.navigate(self.addresses_link, AddressesPage, "Addresses link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу адресов: {e}")
+            raise
+
+    async def save_profile_changes(self):
+        """
+        Сохраняет изменения профиля.
+        """
+        try:
+            await self.click(self.save_button, "Save profile button")
+        except Exception as e:
+            logger.error(f"Ошибка при сохранении изменений профиля: {e}")
+            raise
+
+    async def fill_profile_information(self, first_name="", last_name="", email=""):
+        """
+        Заполняет информацию профиля.
+        """
+        try:
+            if first_name:
+                await self.locator(self.first_name_field).fill(first_name)
+            if last_name:
+                await self.locator(self.last_name_field).fill(last_name)
+            if email:
+                await self.locator(self.email_field).fill(email)
+        except Exception as e:
+            logger.error(f"Ошибка при заполнении информации профиля: {e}")
+            raise
+
+    async def verify_profile_information(self, expected_first_name, expected_last_name):
+        """
+        Проверяет, что информация профиля соответствует ожидаемой.
+        """
+        try:
+            await expect(self.locator(self.first_name_field)).to_have_value(expected_first_name)
+            await expect(self.locator(self.last_name_field)).to_have_value(expected_last_name)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке информации профиля: {e}")
+            raise
+
+    async def verify_error_messages_visibility(self):
+        """
+        Проверяет видимость сообщений об ошибках для обязательных полей.
+        """
+        try:
+            await expect(self.locator(self.first_name_error_message)).to_be_visible()
+            await expect(self.locator(self.last_name_error_message)).to_be_visible()
+            await expect(self.locator(self.email_error_message)).to_be_visible()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости сообщений об ошибках: {e}")
+            raise
@@ -0,0 +1,40 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.orders_page import OrdersPage
+from utils.logger import logger
+
+class AsyncOrdersPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы заказов пользователя.
+    """
+    __slots__ = ()
+    sync_page = OrdersPage
+
+    async def has_orders(self):
+        """
+        Проверяет, есть ли у пользователя заказы.
+        """
+        try:
+            return "No orders" not in await self.locator(self.order_list).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке наличия заказов: {e}")
+            raise
+
+    async def view_order_details(self):
+        """
+        Переходит к просмотру деталей первого заказа.
+        """
+        try:
+            await self.locator(self.order_details_button).first.click()
+        except Exception as e:
+            logger.error(f"Ошибка при переходе к деталям заказа: {e}")
+            raise
+
+    async def goto_orders(self):
+        """
+        Переходит на страницу заказов.
+        """
+        try:
+            await self.navigate(self.orders_link, OrdersPage, "Orders link")
+        except Exception as e:
+            logger.error(f"Ошибка при переходе на страницу заказов: {e}")
+            raise
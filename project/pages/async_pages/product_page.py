@@ -0,0 +1,70 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.product_page import ProductPage
+from utils.logger import logger
+
+class AsyncProductPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы товара.
+    """
+    __slots__ = ()
+    sync_page = ProductPage
+
+    async def add_to_cart(self):
+        """
+        Добавляет товар в корзину.
+        """
+        try:
+            await self.locator(self.add_to_cart_button).click()
+        except Exception as e:
+            logger.error(f"Ошибка при добавлении товара в корзину: {e}")
+            raise
+
+    async def add_to_wishlist(self):
+        """
+        Добавляет товар в список желаний.
+        """
+        try:
+            await self.locator(self.add_to_wishlist_button).click()
+        except Exception as e:
+            logger.error(f"Ошибка при добавлении товара в список желаний: {e}")
+            raise
+
+    async def is_success_notification_visible(self):
+        """
+        Проверяет, отображается ли уведомление об успехе.
+        """
+        try:
+            return await self.locator(self.success_notification).is_visible()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости уведомления об успехе: {e}")
+            raise
+
+    async def get_success_notification_text(self):
+        """
+        Возвращает текст уведомления об успехе.
+        """
+        try:
+            return await self.locator(self.success_notification).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста уведомления об успехе: {e}")
+            raise
+
+    async def get_product_name(self):
+        """
+        Возвращает имя товара.
+        """
+        try:
+            return await self.locator(self.product_name_locator).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при получении имени товара: {e}")
+            raise
+
+    async def get_product_price(self):
+        """
+        Возвращает цену товара.
+        """
+        try:
+            return await self.locator(self.product_price_locator).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при получении цены товара: {e}")
+            raise
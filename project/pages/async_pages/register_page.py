@@ -0,0 +1,83 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.register_page import RegisterPage
+from utils.logger import logger
+
+class AsyncRegisterPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы регистрации пользователя.
+    """
+    __slots__ = ()
+    sync_page = RegisterPage
+
+    async def register(self, gender, first_name, last_name, email, password, confirm_password):
+        """
+        Регистрирует нового пользователя.
+        """
+        try:
+            if gender == "male":
+                await self.click(self.gender_male_radio, "Male radio")
+            elif gender == "female":
+                await self.click(self.gender_female_radio, "Female radio")
+            await self.fill(self.first_name_field, first_name, "First Name field")
+            await self.fill(self.last_name_field, last_name, "Last Name field")
+            await self.fill(self.email_field, email, "Email field")
+            await self.fill(self.password_field, password, "Password field")
+            await self.fill(self.confirm_password_field, confirm_password, "Confirm Password field")
+            await self.click(self.register_button, "Register button")
+        except Exception as e:
+            logger.error(f"Ошибка при регистрации пользователя: {e}")
+            raise
+
+    async def get_success_message_text(self):
+        """
+        Возвращает текст сообщения об успешной регистрации.
+        """
+        try:
+            return await self.get_text(self.success_message, "Success message")
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста сообщения об успехе: {e}")
+            raise
+
+    async def is_success_message_visible(self):
+        """
+        Проверяет, отображается ли сообщение об успешной регистрации.
+        """
+        try:
+            return await self.is_visible(self.success_message)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости сообщения об успехе: {e}")
+            raise
+
+    async def get_error_message_text(self, field):
+        """
+        Возвращает текст сообщения об ошибке для указанного поля.
+        """
+        try:
+            locator = f"span.field-validation-error[data-valmsg-for='{field}']"
+            await self.wait_visible(locator)
+            if await self.locator(locator).count() > 0:
+                return await self.get_text(locator, f"Error message for {field}")
+            return ""
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста сообщения об ошибке для поля '{field}': {e}")
+            raise
+
+    async def is_error_message_visible(self):
+        """
+        Проверяет, отображается ли контейнер с общими сообщениями об ошибках.
+        """
+        try:
+            return await self.is_visible(self.error_message_container)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости контейнера с сообщениями об ошибках: {e}")
+            raise
+
+    async def get_specific_error_text(self):
+        """
+        Получает текст из общего контейнера с ошибками.
+        """
+        try:
+            return await self.get_text("div.validation-summary-errors ul li", "Specific error message")
+        except Exception as e:
+            logger.error(f"Ошибка при получении текста из общего контейнера с ошибками: {e}")
+            raise
@@ -0,0 +1,40 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.search_results_page import SearchResultsPage
+from utils.logger import logger
+
+class AsyncSearchResultsPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы результатов поиска.
+    """
+    __slots__ = ()
+    sync_page = SearchResultsPage
+
+    async def has_results(self):
+        """
+        Проверяет, есть ли результаты поиска.
+        """
+        try:
+            return await self.is_visible(self.search_results)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке наличия результатов поиска: {e}")
+            raise
+
+    async def get_no_results_message(self):
+        """
+        Возвращает сообщение об отсутствии результатов поиска.
+        """
+        try:
+            return await self.get_text(self.no_results_message, "No results message")
+        except Exception as e:
+            logger.error(f"Ошибка при получении сообщения об отсутствии результатов: {e}")
+            raise
+
+    async def is_no_results_message_visible(self):
+        """
+        Проверяет, отображается ли сообщение об отсутствии результатов поиска.
+        """
+        try:
+            return await self.is_visible(self.no_results_message)
+        except Exception as e:
+            logger.error(f"Ошибка при проверке видимости сообщения об отсутствии результатов: {e}")
+            raise
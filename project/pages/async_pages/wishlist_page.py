@@ -0,0 +1,64 @@
+from pages.async_pages.base_page import AsyncBasePage
+from pages.wishlist_page import WishlistPage
+from pages.records import CART_ROWS_SCRIPT, CartRow
+from utils.logger import logger
+
+class AsyncWishlistPage(AsyncBasePage):
+    """
+    Асинхронный двойник страницы списка желаний.
+    """
+    __slots__ = ()
+    sync_page = WishlistPage
+
+    async def remove_from_wishlist(self, index=1):
+        """
+        Удаляет товар из списка желаний.
+        """
+        try:
+            await self.locator(self.remove_checkbox).nth(index - 1).check()
+        except Exception as e:
+            logger.error(f"Ошибка при удалении товара из списка желаний: {e}")
+            raise
+
+    async def update_wishlist(self):
+        """
+        Обновляет список желаний.
+        """
+        try:
+            await self.locator(self.update_wishlist_button).click()
+        except Exception as e:
+            logger.error(f"Ошибка при обновлении списка желаний: {e}")
+            raise
+
+    async def is_wishlist_empty(self):
+        """
+        Проверяет, пуст ли список желаний.
+        """
+        try:
+            await self.wait_visible(self.wishlist_content)
+            return "The wishlist is empty!" in await self.locator(self.wishlist_content).inner_text()
+        except Exception as e:
+            logger.error(f"Ошибка при проверке, пуст ли список желаний: {e}")
+            raise
+
+    async def add_to_cart_from_wishlist(self, index=1):
+        """
+        Добавляет товар из списка желаний в корзину.
+        """
+        try:
+            await self.locator(self.add_to_cart_checkbox).nth(index - 1).check()
+            await self.locator("input[name='addtocartbutton']").click()
+        except Exception as e:
+            logger.error(f"Ошибка при добавлении товара из списка желаний в корзину: {e}")
+            raise
+
+    async def get_rows(self):
+        """
+        Возвращает все строки списка желаний одним вызовом в браузер.
+        """
+        try:
+            rows = await self.locator(self.wishlist_rows).evaluate_all(CART_ROWS_SCRIPT)
+            return [CartRow.from_dom(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Ошибка при получении строк списка желаний: {e}")
+            raise
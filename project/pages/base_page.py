@@ -1,17 +1,119 @@
-from playwright.sync_api import Page
+from playwright.sync_api import expect
+from urllib.parse import urlsplit
 from utils.logger import logger
+from utils.screenshot_buffer import screenshot_buffer
+from utils.capture_profile import capture_options
+from utils.wait_policy import wait_policy
 import os
 
-class BasePage:
+# Таймаут проверок expect в Playwright по умолчанию: с ним ждут видимости элементов, пока нет истории ожиданий
+EXPECT_TIMEOUT = 5000
+# Изображения, вставленные после события load (ленивая подгрузка, AJAX), тоже должны догрузиться
+IMAGES_LOADED_SCRIPT = "() => Array.from(document.images).every(image => image.complete)"
+
+
+class PageSettings:
     """
-    Базовый класс для всех страниц.
+    Настройки страниц из [DEFAULT] конфигурации. Читаются один раз на объект конфигурации
+    и разделяются всеми страницами, созданными с ним.
     """
-    def __init__(self, page: Page, config):
-        self.page = page
-        self.config = config
+    __slots__ = ("base_url", "screenshot_dir", "actual_screenshot_dir", "screenshot_storage", "capture_profile",
+                 "wait_scope")
+
+    def __init__(self, config):
         self.base_url = config.get("DEFAULT", "base_url")
         self.screenshot_dir = config.get("DEFAULT", "screenshot_dir")
-        self.actual_screenshot_dir = config.get("DEFAULT", "actual_screenshot_dir") 
+        self.actual_screenshot_dir = config.get("DEFAULT", "actual_screenshot_dir")
+        self.screenshot_storage = config.get("DEFAULT", "screenshot_storage", fallback="disk")
+        self.capture_profile = config.get("DEFAULT", "capture_profile", fallback="default")
+        self.wait_scope = f"{config.get('DEFAULT', 'browser')}@{urlsplit(self.base_url).netloc}"
+
+
+# ConfigParser не хешируется: настройки кешируются по id, объект конфигурации хранится рядом для проверки
+_settings_cache = {}
+
+
+def page_settings(config):
+    """
+    Возвращает настройки страниц для конфигурации, создавая их при первом обращении.
+    """
+    cached = _settings_cache.get(id(config))
+    if cached is None or cached[0] is not config:
+        cached = _settings_cache[id(config)] = (config, PageSettings(config))
+    return cached[1]
+
+
+class PageObject:
+    """
+    Общая часть синхронных и асинхронных страниц: ссылка на страницу браузера, настройки
+    и кеш локаторов. Селекторы объявляются строками на уровне класса страницы, экземпляры
+    используют __slots__, поэтому создание страницы почти ничего не стоит. Локатор
+    для селектора создается при первом обращении и переиспользуется страницей.
+    """
+    __slots__ = ("page", "config", "settings", "_locators")
+
+    def __init__(self, page, config):
+        self.page = page
+        self.config = config
+        self.settings = page_settings(config)
+        self._locators = {}
+
+    def locator(self, selector):
+        """
+        Возвращает закешированный локатор селектора.
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
+
+    @property
+    def base_url(self):
+        return self.settings.base_url
+
+    @property
+    def screenshot_dir(self):
+        return self.settings.screenshot_dir
+
+    @property
+    def actual_screenshot_dir(self):
+        return self.settings.actual_screenshot_dir
+
+    @property
+    def screenshot_storage(self):
+        return self.settings.screenshot_storage
+
+    @property
+    def capture_profile(self):
+        return self.settings.capture_profile
+
+    @property
+    def wait_scope(self):
+        return self.settings.wait_scope
+
+
+class BasePage(PageObject):
+    """
+    Базовый класс для всех страниц.
+    Таймауты ожиданий берутся из политики wait_policy по истории задержек
+    отдельно для каждого браузера и сайта (wait_scope).
+
+    Страница объявляет условие готовности: состояние загрузки wait_until и ключевой
+    селектор ready_selector, который есть только на этой странице. Переход goto и переходы
+    кликом (navigate) ждут только этого условия, а не загрузки всех изображений и ресурсов.
+    Без ready_selector страница ждет события load, как page.goto по умолчанию.
+    """
+    __slots__ = ()
+    wait_until = "load"
+    ready_selector = None
+
+    def waiting(self, action, locator, fallback=None):
+        """
+        Возвращает контекстный менеджер ожидания с адаптивным таймаутом:
+        with page_object.waiting("to_have_text", locator) as timeout: ...
+        fallback — таймаут без истории ожиданий, по умолчанию настроенный timeout.
+        """
+        return wait_policy.measure(self.wait_scope, action, locator, fallback)
 
     def goto(self, path=""):
         """
@@ -20,18 +122,64 @@ class BasePage:
         try:
             url = f"{self.base_url}/{path}"
             logger.info(f"Переход по: {url}")
-            self.page.goto(url)
+            with self.waiting("goto", f"/{path}") as timeout:
+                self.page.goto(url, wait_until=self.wait_until, timeout=timeout)
+            if self.ready_selector:
+                self.wait_visible(self.ready_selector, f"{type(self).__name__} ready", fallback=None)
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу: {e}")
             raise
 
+    def wait_ready(self, page_class=None):
+        """
+        Ожидает готовности страницы page_class (по умолчанию текущей): ключевого селектора
+        и состояния загрузки wait_until.
+        """
+        page_class = page_class or type(self)
+        try:
+            if page_class.ready_selector:
+                self.wait_visible(page_class.ready_selector, f"{page_class.__name__} ready", fallback=None)
+            if page_class.wait_until != "commit":
+                with self.waiting("load_state", page_class.wait_until) as timeout:
+                    self.page.wait_for_load_state(page_class.wait_until, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Страница {page_class.__name__} не готова: {e}")
+            raise
+
+    def navigate(self, locator, page_class, description=None):
+        """
+        Кликает на элемент, ведущий на страницу page_class, и ожидает ее готовности.
+        Готовность проверяется только после начала навигации: иначе проверка могла бы пройти
+        на прежнем документе, который уже загружен.
+        """
+        with self.waiting("navigation", page_class.__name__) as timeout:
+            with self.page.expect_navigation(wait_until="commit", timeout=timeout):
+                self.click(locator, description)
+        self.wait_ready(page_class)
+
+    def wait_settled(self):
+        """
+        Ожидает полной загрузки страницы перед скриншотом: события load и загрузки всех изображений.
+        Готовность по wait_until и ready_selector достаточна для действий, но не для сравнения
+        с эталонами, снятыми после load.
+        """
+        try:
+            with self.waiting("load_state", "load") as timeout:
+                self.page.wait_for_load_state("load", timeout=timeout)
+            with self.waiting("images_loaded", "img") as timeout:
+                self.page.wait_for_function(IMAGES_LOADED_SCRIPT, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Страница не загрузилась полностью: {e}")
+            raise
+
     def click(self, locator, description=None):
         """
         Кликает на элемент.
         """
         try:
             logger.info(f"Клик на элемент: {description or locator}")
-            self.page.locator(locator).click()
+            with self.waiting("click", locator) as timeout:
+                self.locator(locator).click(timeout=timeout)
         except Exception as e:
             logger.error(f"Ошибка при нажатии на элемент '{description or locator}': {e}")
             raise
@@ -42,7 +190,8 @@ class BasePage:
         """
         try:
             logger.info(f"Заполнен '{description or locator}' текстом: {text}")
-            self.page.locator(locator).fill(text)
+            with self.waiting("fill", locator) as timeout:
+                self.locator(locator).fill(text, timeout=timeout)
         except Exception as e:
             logger.error(f"Ошибка при заполнении поля '{description or locator}': {e}")
             raise
@@ -52,34 +201,59 @@ class BasePage:
         Возвращает текст элемента.
         """
         try:
-            text = self.page.locator(locator).inner_text()
+            with self.waiting("inner_text", locator) as timeout:
+                text = self.locator(locator).inner_text(timeout=timeout)
             logger.info(f"Получить текст '{description or locator}': {text}")
             return text
         except Exception as e:
             logger.error(f"Ошибка при получении текста из '{description or locator}': {e}")
             raise
 
+    def wait_visible(self, locator, description=None, fallback=EXPECT_TIMEOUT):
+        """
+        Ожидает появления элемента с адаптивным таймаутом. Без истории ожидание длится fallback,
+        как проверка expect; готовность страницы ждется с настроенным timeout (fallback=None).
+        """
+        try:
+            with self.waiting("to_be_visible", locator, fallback) as timeout:
+                expect(self.locator(locator)).to_be_visible(timeout=timeout)
+        except Exception as e:
+            logger.error(f"Элемент '{description or locator}' не появился: {e}")
+            raise
+
     def is_visible(self, locator, description=None):
         """
         Проверяет видимость элемента.
         """
         try:
             logger.info(f"Проверка видимости элемента: {description or locator}")
-            return self.page.locator(locator).is_visible()
+            return self.locator(locator).is_visible()
         except Exception as e:
             logger.error(f"Ошибка при проверке видимости элемента '{description or locator}': {e}")
             raise
 
-    def take_screenshot(self, screenshot_name):
+    def take_screenshot(self, screenshot_name, profile=None):
         """
-        Делает скриншот страницы и сохраняет его в указанную директорию.
+        Делает скриншот полностью загруженной страницы и сохраняет его в указанную директорию.
+        При screenshot_storage = memory скриншот остаётся в памяти до сравнения.
+        profile — профиль захвата из config.ini, по умолчанию capture_profile из [DEFAULT].
         """
         try:
             screenshot_path = os.path.join(self.actual_screenshot_dir, screenshot_name)
+            options = capture_options(self.config, profile or self.capture_profile)
+            self.wait_settled()
+            if self.screenshot_storage == "memory":
+                logger.info(f"Получен скриншот (в памяти): {screenshot_name}")
+                screenshot_buffer.put(screenshot_name, self.page.screenshot(**options))
+                return screenshot_path
+
             os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
+            # Прежний файл может быть ссылкой на блоб хранилища: удаляем его, а не перезаписываем
+            if os.path.exists(screenshot_path):
+                os.remove(screenshot_path)
 
             logger.info(f"Получен скриншот: {screenshot_path}")
-            self.page.screenshot(path=screenshot_path)
+            self.page.screenshot(path=screenshot_path, **options)
             return screenshot_path
         except Exception as e:
             logger.error(f"Ошибка при создании скриншота: {e}")
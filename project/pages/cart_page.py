@@ -1,27 +1,30 @@
 from pages.base_page import BasePage
-from playwright.sync_api import expect
+from pages.checkout_page import CheckoutPage
+from pages.records import CART_ROWS_SCRIPT, CartRow
 from utils.logger import logger
 
 class CartPage(BasePage):
     """
     Класс, представляющий страницу корзины.
     """
-    def __init__(self, page, config):
-        super().__init__(page, config)
-        self.checkout_button = "button[name='checkout']"
-        self.termsofservice_checkbox = "#termsofservice"
-        self.update_cart_button = "input[name='updatecart']"
-        self.remove_checkbox = "input[name='removefromcart']"
-        self.cart_content = "div.order-summary-content"
-        self.cart_table_row = "table.cart tbody tr.cart-item-row"
-        self.counter = ".header-links .cart-qty"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.order-summary-content"
+
+    checkout_button = "button[name='checkout']"
+    termsofservice_checkbox = "#termsofservice"
+    update_cart_button = "input[name='updatecart']"
+    remove_checkbox = "input[name='removefromcart']"
+    cart_content = "div.order-summary-content"
+    cart_table_row = "table.cart tbody tr.cart-item-row"
+    counter = ".header-links .cart-qty"
 
     def goto_checkout(self):
         """
         Переходит на страницу оформления заказа.
         """
         try:
-            self.click(self.checkout_button)
+            self.navigate(self.checkout_button, CheckoutPage)
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу оформления заказа: {e}")
             raise
@@ -31,7 +34,7 @@ class CartPage(BasePage):
         Принимает условия обслуживания.
         """
         try:
-            self.page.check(self.termsofservice_checkbox)
+            self.locator(self.termsofservice_checkbox).check()
         except Exception as e:
             logger.error(f"Ошибка при принятии условий обслуживания: {e}")
             raise
@@ -41,7 +44,7 @@ class CartPage(BasePage):
         Удаляет товар из корзины.
         """
         try:
-            remove_checkbox = self.page.locator(self.remove_checkbox).nth(index - 1)
+            remove_checkbox = self.locator(self.remove_checkbox).nth(index - 1)
             remove_checkbox.check()
         except Exception as e:
             logger.error(f"Ошибка при удалении товара из корзины: {e}")
@@ -52,7 +55,7 @@ class CartPage(BasePage):
         Обновляет корзину.
         """
         try:
-            self.page.click(self.update_cart_button)
+            self.locator(self.update_cart_button).click()
         except Exception as e:
             logger.error(f"Ошибка при обновлении корзины: {e}")
             raise
@@ -62,8 +65,18 @@ class CartPage(BasePage):
         Проверяет, пуста ли корзина.
         """
         try:
-            expect(self.page.locator(self.cart_content)).to_be_visible(timeout=5000)
-            return "Your Shopping Cart is empty!" in self.page.locator(self.cart_content).inner_text()
+            self.wait_visible(self.cart_content)
+            return "Your Shopping Cart is empty!" in self.locator(self.cart_content).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при проверке, пуста ли корзина: {e}")
             raise
+
+    def get_rows(self):
+        """
+        Возвращает все строки корзины одним вызовом в браузер.
+        """
+        try:
+            return [CartRow.from_dom(row) for row in self.locator(self.cart_table_row).evaluate_all(CART_ROWS_SCRIPT)]
+        except Exception as e:
+            logger.error(f"Ошибка при получении строк корзины: {e}")
+            raise
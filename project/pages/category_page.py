@@ -1,37 +1,49 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from pages.records import PRODUCT_CARDS_SCRIPT, ProductCard
 from utils.logger import logger
 
 class CategoryPage(BasePage):
     """
     Класс, представляющий страницу категории товаров.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.product_grid = "div.product-grid"
-        self.product_items = "div.item-box"
-        self.success_notification ="#bar-notification"
-        self.add_to_cart = "input.button-2.product-box-add-to-cart-button"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.category-page"
+
+    product_grid = "div.product-grid"
+    product_items = "div.item-box"
+    success_notification = "#bar-notification"
+    add_to_cart = "input.button-2.product-box-add-to-cart-button"
 
     def get_product_count(self):
         """
         Возвращает количество товаров в категории.
         """
         try:
-            return self.page.locator(self.product_items).count()
+            return self.locator(self.product_items).count()
         except Exception as e:
             logger.error(f"Ошибка при получении количества товаров в категории: {e}")
             raise
     
+    def get_products(self):
+        """
+        Возвращает все карточки товаров категории одним вызовом в браузер.
+        """
+        try:
+            products = [ProductCard.from_dom(item)
+                        for item in self.locator(self.product_items).evaluate_all(PRODUCT_CARDS_SCRIPT)]
+            logger.info(f"Получены карточки товаров категории: {len(products)}")
+            return products
+        except Exception as e:
+            logger.error(f"Ошибка при получении карточек товаров категории: {e}")
+            raise
+
     def get_product_name(self, index):
         """
         Возвращает имя товара по указанному индексу.
         """
         try:
-            locator = f"{self.product_items}:nth-child({index + 1}) h2.product-title a"
-            return self.get_text(locator, f"Product Name at index {index}")
+            return self.get_products()[index].name
         except Exception as e:
             logger.error(f"Ошибка при получении имени товара по индексу {index}: {e}")
             raise
@@ -1,31 +1,31 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page, expect
+from playwright.sync_api import expect
 from utils.logger import logger
 
 class ChangePasswordPage(BasePage):
     """
     Класс, представляющий страницу изменения пароля.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.old_password_field = "#OldPassword"
-        self.new_password_field = "#NewPassword"
-        self.confirm_new_password_field = "#ConfirmNewPassword"
-        self.change_password_button = "input.button-1.change-password-button"
-        self.success_message_locator = ".result"
-        self.old_password_error_locator = ".validation-summary-errors li"
-        self.new_password_mismatch_locator = "span.field-validation-error span"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "#OldPassword"
+
+    old_password_field = "#OldPassword"
+    new_password_field = "#NewPassword"
+    confirm_new_password_field = "#ConfirmNewPassword"
+    change_password_button = "input.button-1.change-password-button"
+    success_message_locator = ".result"
+    old_password_error_locator = ".validation-summary-errors li"
+    new_password_mismatch_locator = "span.field-validation-error span"
 
     def change_password(self, old_password, new_password, confirm_new_password):
         """
         Заполняет поля для изменения пароля.
         """
         try:
-            self.page.fill(self.old_password_field, old_password)
-            self.page.fill(self.new_password_field, new_password)
-            self.page.fill(self.confirm_new_password_field, confirm_new_password)
+            self.locator(self.old_password_field).fill(old_password)
+            self.locator(self.new_password_field).fill(new_password)
+            self.locator(self.confirm_new_password_field).fill(confirm_new_password)
         except Exception as e:
             logger.error(f"Ошибка при заполнении полей изменения пароля: {e}")
             raise
@@ -45,7 +45,7 @@ class ChangePasswordPage(BasePage):
         Проверяет отображение сообщения об успешном изменении пароля.
         """
         try:
-            expect(self.page.locator(self.success_message_locator).first).to_have_text(expected_message)
+            expect(self.locator(self.success_message_locator).first).to_have_text(expected_message)
         except Exception as e:
             logger.error(f"Ошибка при проверке сообщения об успехе: {e}")
             raise
@@ -55,7 +55,7 @@ class ChangePasswordPage(BasePage):
         Проверяет отображение сообщения об ошибке при вводе неверного пароля.
         """
         try:
-            expect(self.page.locator(self.old_password_error_locator).first).to_have_text(expected_error)
+            expect(self.locator(self.old_password_error_locator).first).to_have_text(expected_error)
         except Exception as e:
             logger.error(f"Ошибка при проверке сообщения об ошибке для старого пароля: {e}")
             raise
@@ -65,7 +65,7 @@ class ChangePasswordPage(BasePage):
         Проверяет отображение сообщения об ошибке при неудачном подтверждении пароля.
         """
         try:
-            expect(self.page.locator(self.new_password_mismatch_locator).first).to_have_text(expected_error)
+            expect(self.locator(self.new_password_mismatch_locator).first).to_have_text(expected_error)
         except Exception as e:
             logger.error(f"Ошибка при проверке сообщения о неудачном подтверждении пароля: {e}")
             raise
@@ -1,24 +1,30 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
+from pages.cart_page import CartPage
+from pages.category_page import CategoryPage
+from pages.login_page import LoginPage
+from pages.my_account_page import MyAccountPage
+from pages.register_page import RegisterPage
+from pages.search_results_page import SearchResultsPage
+from pages.wishlist_page import WishlistPage
 from utils.logger import logger
 
 class HomePage(BasePage):
     """
     Класс, представляющий главную страницу.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.register_link = "a.ico-register"
-        self.login_link = "a.ico-login"
-        self.logout_link = "a.ico-logout"
-        self.account_link = "a[href='/customer/info']"
-        self.search_field = "#small-searchterms"
-        self.search_button = "input.button-1.search-box-button"
-        self.ico_cart = "#topcartlink a.ico-cart"
-        self.ico_wishlist = "a.ico-wishlist"
-        self.category = "ul.top-menu > li > a[href='/{category_name}']"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.home-page"
+
+    register_link = "a.ico-register"
+    login_link = "a.ico-login"
+    logout_link = "a.ico-logout"
+    account_link = "a[href='/customer/info']"
+    search_field = "#small-searchterms"
+    search_button = "input.button-1.search-box-button"
+    ico_cart = "#topcartlink a.ico-cart"
+    ico_wishlist = "a.ico-wishlist"
+    category = "ul.top-menu > li > a[href='/{category_name}']"
 
     def goto(self):
         """
@@ -35,7 +41,7 @@ class HomePage(BasePage):
         Переходит на страницу регистрации.
         """
         try:
-            self.click(self.register_link, "Register link")
+            self.navigate(self.register_link, RegisterPage, "Register link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу регистрации: {e}")
             raise
@@ -45,7 +51,7 @@ class HomePage(BasePage):
         Переходит на страницу входа.
         """
         try:
-            self.click(self.login_link, "Login link")
+            self.navigate(self.login_link, LoginPage, "Login link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу входа: {e}")
             raise
@@ -76,7 +82,7 @@ class HomePage(BasePage):
         """
         try:
             account = f'{self.account_link}:text("{email}")'
-            self.click(account, 'Account link with email')
+            self.navigate(account, MyAccountPage, 'Account link with email')
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу аккаунта: {e}")
             raise
@@ -87,7 +93,7 @@ class HomePage(BasePage):
         """
         try:
             self.fill(self.search_field, term, "Search field")
-            self.click(self.search_button, "Search button")
+            self.navigate(self.search_button, SearchResultsPage, "Search button")
         except Exception as e:
             logger.error(f"Ошибка при выполнении поиска: {e}")
             raise
@@ -97,7 +103,7 @@ class HomePage(BasePage):
         Переходит в корзину.
         """
         try:
-            self.click(self.ico_cart, "Cart link")
+            self.navigate(self.ico_cart, CartPage, "Cart link")
         except Exception as e:
             logger.error(f"Ошибка при переходе в корзину: {e}")
             raise
@@ -107,7 +113,7 @@ class HomePage(BasePage):
         Переходит в список желаний.
         """
         try:
-            self.click(self.ico_wishlist, "Wishlist link")
+            self.navigate(self.ico_wishlist, WishlistPage, "Wishlist link")
         except Exception as e:
             logger.error(f"Ошибка при переходе в список желаний: {e}")
             raise
@@ -118,7 +124,7 @@ class HomePage(BasePage):
         """
         try:
             selector = self.category.format(category_name=category_name)
-            self.click(selector, f"{category_name} category link")
+            self.navigate(selector, CategoryPage, f"{category_name} category link")
         except Exception as e:
             logger.error(f"Ошибка при переходе в категорию '{category_name}': {e}")
             raise
@@ -1,20 +1,18 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
 from utils.logger import logger
 
 class LoginPage(BasePage):
     """
     Класс, представляющий страницу входа в систему.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.email_field = "#Email"
-        self.password_field = "#Password"
-        self.login_button = "input.button-1.login-button"
-        self.error_message = "div.message-error"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "#Email"
 
+    email_field = "#Email"
+    password_field = "#Password"
+    login_button = "input.button-1.login-button"
+    error_message = "div.message-error"
 
     def login(self, email, password):
         """
@@ -1,33 +1,36 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page, expect
+from pages.addresses_page import AddressesPage
+from pages.change_password_page import ChangePasswordPage
+from pages.orders_page import OrdersPage
+from playwright.sync_api import expect
 from utils.logger import logger
 
 class MyAccountPage(BasePage):
     """
     Класс, представляющий страницу аккаунта пользователя.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.change_password_link = "a[href='/customer/changepassword']"
-        self.orders_link = "a[href='/customer/orders']"
-        self.addresses_link = "div.block.block-account-navigation a[href='/customer/addresses']"
-        self.addresses_list = "div.address-list"
-        self.save_button = "input[value=Save]"
-        self.first_name_field = "#FirstName"
-        self.last_name_field = "#LastName"
-        self.email_field = "#Email"
-        self.first_name_error_message = "span[data-valmsg-for='FirstName']"
-        self.last_name_error_message = "span[data-valmsg-for='LastName']"
-        self.email_error_message = "span[data-valmsg-for='Email']"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "a.active[href='/customer/info']"
+
+    change_password_link = "a[href='/customer/changepassword']"
+    orders_link = "a[href='/customer/orders']"
+    addresses_link = "div.block.block-account-navigation a[href='/customer/addresses']"
+    addresses_list = "div.address-list"
+    save_button = "input[value=Save]"
+    first_name_field = "#FirstName"
+    last_name_field = "#LastName"
+    email_field = "#Email"
+    first_name_error_message = "span[data-valmsg-for='FirstName']"
+    last_name_error_message = "span[data-valmsg-for='LastName']"
+    email_error_message = "span[data-valmsg-for='Email']"
 
     def goto_change_password(self):
         """
         Переходит на страницу изменения пароля.
         """
         try:
-            self.click(self.change_password_link, "Change password link")
+            self.navigate(self.change_password_link, ChangePasswordPage, "Change password link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу изменения пароля: {e}")
             raise
@@ -37,7 +40,7 @@ class MyAccountPage(BasePage):
         Переходит на страницу заказов.
         """
         try:
-            self.click(self.orders_link, "Orders link")
+            self.navigate(self.orders_link, OrdersPage, "Orders link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу заказов: {e}")
             raise
@@ -47,7 +50,7 @@ class MyAccountPage(BasePage):
         Переходит на страницу адресов.
         """
         try:
-            self.click(self.addresses_link, "Addresses link")
+            self.navigate(self.addresses_link, AddressesPage, "Addresses link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу адресов: {e}")
             raise
@@ -68,11 +71,11 @@ class MyAccountPage(BasePage):
         """
         try:
             if first_name:
-                self.page.fill(self.first_name_field, first_name)
+                self.locator(self.first_name_field).fill(first_name)
             if last_name:
-                self.page.fill(self.last_name_field, last_name)
+                self.locator(self.last_name_field).fill(last_name)
             if email:
-                self.page.fill(self.email_field, email)
+                self.locator(self.email_field).fill(email)
         except Exception as e:
             logger.error(f"Ошибка при заполнении информации профиля: {e}")
             raise
@@ -82,8 +85,8 @@ class MyAccountPage(BasePage):
         Проверяет, что информация профиля соответствует ожидаемой.
         """
         try:
-            expect(self.page.locator(self.first_name_field)).to_have_value(expected_first_name)
-            expect(self.page.locator(self.last_name_field)).to_have_value(expected_last_name)
+            expect(self.locator(self.first_name_field)).to_have_value(expected_first_name)
+            expect(self.locator(self.last_name_field)).to_have_value(expected_last_name)
         except Exception as e:
             logger.error(f"Ошибка при проверке информации профиля: {e}")
             raise
@@ -93,9 +96,9 @@ class MyAccountPage(BasePage):
         Проверяет видимость сообщений об ошибках для обязательных полей.
         """
         try:
-            expect(self.page.locator(self.first_name_error_message)).to_be_visible()
-            expect(self.page.locator(self.last_name_error_message)).to_be_visible()
-            expect(self.page.locator(self.email_error_message)).to_be_visible()
+            expect(self.locator(self.first_name_error_message)).to_be_visible()
+            expect(self.locator(self.last_name_error_message)).to_be_visible()
+            expect(self.locator(self.email_error_message)).to_be_visible()
         except Exception as e:
             logger.error(f"Ошибка при проверке видимости сообщений об ошибках: {e}")
             raise
@@ -1,23 +1,24 @@
 from pages.base_page import BasePage
-from playwright.sync_api import expect
 from utils.logger import logger
 
 class OrdersPage(BasePage):
     """
     Класс, представляющий страницу заказов пользователя.
     """
-    def __init__(self, page, config):
-        super().__init__(page, config)
-        self.order_list = "div.order-list"
-        self.order_details_button = "input.button-2.order-details-button"
-        self.orders_link = "a.inactive[href='/customer/orders']"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "a.active[href='/customer/orders']"
+
+    order_list = "div.order-list"
+    order_details_button = "input.button-2.order-details-button"
+    orders_link = "a.inactive[href='/customer/orders']"
 
     def has_orders(self):
         """
         Проверяет, есть ли у пользователя заказы.
         """
         try:
-            return "No orders" not in self.page.locator(self.order_list).inner_text()
+            return "No orders" not in self.locator(self.order_list).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при проверке наличия заказов: {e}")
             raise
@@ -27,7 +28,7 @@ class OrdersPage(BasePage):
         Переходит к просмотру деталей первого заказа.
         """
         try:
-            self.page.click(self.order_details_button)
+            self.locator(self.order_details_button).first.click()
         except Exception as e:
             logger.error(f"Ошибка при переходе к деталям заказа: {e}")
             raise
@@ -37,7 +38,7 @@ class OrdersPage(BasePage):
         Переходит на страницу заказов.
         """
         try:
-            self.click(self.orders_link, "Orders link")
+            self.navigate(self.orders_link, OrdersPage, "Orders link")
         except Exception as e:
             logger.error(f"Ошибка при переходе на страницу заказов: {e}")
             raise
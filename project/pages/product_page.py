@@ -1,25 +1,26 @@
 from pages.base_page import BasePage
-from playwright.sync_api import expect
 from utils.logger import logger
 
 class ProductPage(BasePage):
     """
     Класс, представляющий страницу товара.
     """
-    def __init__(self, page, config):
-        super().__init__(page, config)
-        self.add_to_cart_button = "input.button-1.add-to-cart-button"
-        self.add_to_wishlist_button = "input.button-2.add-to-wishlist-button"
-        self.success_notification = "#bar-notification"
-        self.product_name_locator = "div.product-name h1"
-        self.product_price_locator = "div.product-price span"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.product-name h1"
+
+    add_to_cart_button = "input.button-1.add-to-cart-button"
+    add_to_wishlist_button = "input.button-2.add-to-wishlist-button"
+    success_notification = "#bar-notification"
+    product_name_locator = "div.product-name h1"
+    product_price_locator = "div.product-price span"
 
     def add_to_cart(self):
         """
         Добавляет товар в корзину.
         """
         try:
-            self.page.click(self.add_to_cart_button)
+            self.locator(self.add_to_cart_button).click()
         except Exception as e:
             logger.error(f"Ошибка при добавлении товара в корзину: {e}")
             raise
@@ -29,7 +30,7 @@ class ProductPage(BasePage):
         Добавляет товар в список желаний.
         """
         try:
-            self.page.click(self.add_to_wishlist_button)
+            self.locator(self.add_to_wishlist_button).click()
         except Exception as e:
             logger.error(f"Ошибка при добавлении товара в список желаний: {e}")
             raise
@@ -39,7 +40,7 @@ class ProductPage(BasePage):
         Проверяет, отображается ли уведомление об успехе.
         """
         try:
-            return self.page.locator(self.success_notification).is_visible()
+            return self.locator(self.success_notification).is_visible()
         except Exception as e:
             logger.error(f"Ошибка при проверке видимости уведомления об успехе: {e}")
             raise
@@ -49,7 +50,7 @@ class ProductPage(BasePage):
         Возвращает текст уведомления об успехе.
         """
         try:
-            return self.page.locator(self.success_notification).inner_text()
+            return self.locator(self.success_notification).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при получении текста уведомления об успехе: {e}")
             raise
@@ -59,7 +60,7 @@ class ProductPage(BasePage):
         Возвращает имя товара.
         """
         try:
-            return self.page.locator(self.product_name_locator).inner_text()
+            return self.locator(self.product_name_locator).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при получении имени товара: {e}")
             raise
@@ -69,7 +70,7 @@ class ProductPage(BasePage):
         Возвращает цену товара.
         """
         try:
-            return self.page.locator(self.product_price_locator).inner_text()
+            return self.locator(self.product_price_locator).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при получении цены товара: {e}")
             raise
@@ -0,0 +1,106 @@
+import re
+from dataclasses import dataclass
+
+# Скрипты locator.evaluate_all: один вызов возвращает поля всех найденных элементов списка.
+# Поля читаются относительно элемента, отсутствующие — пустая строка.
+PRODUCT_CARDS_SCRIPT = """
+items => items.map(item => {
+    const link = item.querySelector('h2.product-title a');
+    return {
+        name: link ? link.textContent.trim() : '',
+        url: link ? link.href : '',
+        price: (item.querySelector('.prices .actual-price') || {textContent: ''}).textContent.trim(),
+        can_add_to_cart: !!item.querySelector('input.product-box-add-to-cart-button'),
+    };
+})
+"""
+
+ADDRESS_ITEMS_SCRIPT = """
+items => items.map(item => {
+    const text = selector => (item.querySelector(selector) || {textContent: ''}).textContent.trim();
+    const value = selector => text(selector).replace(/^[^:]*:\\s*/, '');
+    const button = item.querySelector('input.delete-address-button, input.edit-address-button');
+    const id = ((button && button.getAttribute('onclick')) || '').match(/(\\d+)/);
+    return {
+        address_id: id ? id[1] : '',
+        name: text('div.title strong'),
+        email: value('li.email'),
+        phone: value('li.phone'),
+        address1: text('li.address1'),
+        city: text('li.city-state-zip'),
+        country: text('li.country'),
+    };
+})
+"""
+
+CART_ROWS_SCRIPT = """
+rows => rows.map(row => {
+    const link = row.querySelector('a.product-name');
+    const remove = row.querySelector("input[name='removefromcart']");
+    return {
+        item_id: remove ? remove.value : '',
+        name: link ? link.textContent.trim() : '',
+        url: link ? link.href : '',
+        unit_price: (row.querySelector('.product-unit-price') || {textContent: ''}).textContent.trim(),
+        quantity: (row.querySelector('input.qty-input') || {value: ''}).value,
+    };
+})
+"""
+
+
+def parse_number(text, cast=float):
+    """
+    Разбирает число из текста цены или количества ("1,590.00" -> 1590.0). Пустой текст — None.
+    """
+    cleaned = re.sub(r"[^\d.]", "", text or "")
+    return cast(cleaned) if cleaned else None
+
+
+@dataclass
+class ProductCard:
+    """
+    Карточка товара в списке категории или результатов поиска.
+    """
+    name: str
+    url: str
+    price: float
+    can_add_to_cart: bool
+
+    @classmethod
+    def from_dom(cls, item):
+        return cls(item["name"], item["url"], parse_number(item["price"]), item["can_add_to_cart"])
+
+
+@dataclass
+class AddressRecord:
+    """
+    Адрес из списка адресов покупателя.
+    """
+    address_id: int
+    name: str
+    email: str
+    phone: str
+    address1: str
+    city: str
+    country: str
+
+    @classmethod
+    def from_dom(cls, item):
+        return cls(**dict(item, address_id=parse_number(item["address_id"], int)))
+
+
+@dataclass
+class CartRow:
+    """
+    Строка таблицы корзины или списка желаний.
+    """
+    item_id: int
+    name: str
+    url: str
+    unit_price: float
+    quantity: int
+
+    @classmethod
+    def from_dom(cls, row):
+        return cls(parse_number(row["item_id"], int), row["name"], row["url"],
+                   parse_number(row["unit_price"]), parse_number(row["quantity"], int))
@@ -1,26 +1,25 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page, expect
 from utils.logger import logger
 
 class RegisterPage(BasePage):
     """
     Класс, представляющий страницу регистрации пользователя.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.gender_male_radio = "#gender-male"
-        self.gender_female_radio = "#gender-female"
-        self.first_name_field = "#FirstName"
-        self.last_name_field = "#LastName"
-        self.email_field = "#Email"
-        self.password_field = "#Password"
-        self.confirm_password_field = "#ConfirmPassword"
-        self.register_button = "input.button-1.register-next-step-button"
-        self.success_message = "div.result"
-        self.error_message_container = "div.validation-summary-errors"
-        self.error_message ="span.field-validation-error"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "#FirstName"
+
+    gender_male_radio = "#gender-male"
+    gender_female_radio = "#gender-female"
+    first_name_field = "#FirstName"
+    last_name_field = "#LastName"
+    email_field = "#Email"
+    password_field = "#Password"
+    confirm_password_field = "#ConfirmPassword"
+    register_button = "input.button-1.register-next-step-button"
+    success_message = "div.result"
+    error_message_container = "div.validation-summary-errors"
+    error_message = "span.field-validation-error"
 
     def register(self, gender, first_name, last_name, email, password, confirm_password):
         """
@@ -67,8 +66,8 @@ class RegisterPage(BasePage):
         """
         try:
             locator = f"span.field-validation-error[data-valmsg-for='{field}']"
-            expect(self.page.locator(locator)).to_be_visible(timeout=5000)
-            if self.page.locator(locator).count() > 0:
+            self.wait_visible(locator)
+            if self.locator(locator).count() > 0:
                 return self.get_text(locator, f"Error message for {field}")
             else:
                 return ""
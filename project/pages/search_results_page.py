@@ -1,17 +1,16 @@
 from pages.base_page import BasePage
-from playwright.sync_api import Page
 from utils.logger import logger
 
 class SearchResultsPage(BasePage):
     """
     Класс, представляющий страницу результатов поиска.
     """
-    def __init__(self, page: Page, config):
-        super().__init__(page, config)
-        self.page = page
-        self.config = config
-        self.search_results = "div.product-grid"
-        self.no_results_message = "strong.result"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.search-results"
+
+    search_results = "div.product-grid"
+    no_results_message = "strong.result"
 
     def has_results(self):
         """
@@ -1,26 +1,29 @@
 from pages.base_page import BasePage
-from playwright.sync_api import expect
+from pages.records import CART_ROWS_SCRIPT, CartRow
 from utils.logger import logger
 
 class WishlistPage(BasePage):
     """
     Класс, представляющий страницу списка желаний.
     """
-    def __init__(self, page, config):
-        super().__init__(page, config)
-        self.remove_checkbox = "input[name='removefromcart']"
-        self.update_wishlist_button = "input[name='updatecart']"
-        self.wishlist_content = "div.wishlist-content"
-        self.wishlist_table = "table.cart"
-        self.add_to_cart_checkbox = "input[name='addtocart']"
-        self.counter = ".header-links .wishlist-qty"
+    __slots__ = ()
+    wait_until = "domcontentloaded"
+    ready_selector = "div.wishlist-content"
+
+    remove_checkbox = "input[name='removefromcart']"
+    update_wishlist_button = "input[name='updatecart']"
+    wishlist_content = "div.wishlist-content"
+    wishlist_table = "table.cart"
+    wishlist_rows = "table.cart tbody tr.cart-item-row"
+    add_to_cart_checkbox = "input[name='addtocart']"
+    counter = ".header-links .wishlist-qty"
 
     def remove_from_wishlist(self, index=1):
         """
         Удаляет товар из списка желаний.
         """
         try:
-            remove_checkbox = self.page.locator(self.remove_checkbox).nth(index - 1)
+            remove_checkbox = self.locator(self.remove_checkbox).nth(index - 1)
             remove_checkbox.check()
         except Exception as e:
             logger.error(f"Ошибка при удалении товара из списка желаний: {e}")
@@ -31,7 +34,7 @@ class WishlistPage(BasePage):
         Обновляет список желаний.
         """
         try:
-            self.page.click(self.update_wishlist_button)
+            self.locator(self.update_wishlist_button).click()
         except Exception as e:
             logger.error(f"Ошибка при обновлении списка желаний: {e}")
             raise
@@ -41,8 +44,8 @@ class WishlistPage(BasePage):
         Проверяет, пуст ли список желаний.
         """
         try:
-            expect(self.page.locator(self.wishlist_content)).to_be_visible(timeout=5000)
-            return "The wishlist is empty!" in self.page.locator(self.wishlist_content).inner_text()
+            self.wait_visible(self.wishlist_content)
+            return "The wishlist is empty!" in self.locator(self.wishlist_content).inner_text()
         except Exception as e:
             logger.error(f"Ошибка при проверке, пуст ли список желаний: {e}")
             raise
@@ -52,9 +55,19 @@ class WishlistPage(BasePage):
         Добавляет товар из списка желаний в корзину.
         """
         try:
-            add_to_cart_checkbox = self.page.locator(self.add_to_cart_checkbox).nth(index - 1)
+            add_to_cart_checkbox = self.locator(self.add_to_cart_checkbox).nth(index - 1)
             add_to_cart_checkbox.check()
-            self.page.click("input[name='addtocartbutton']")
+            self.locator("input[name='addtocartbutton']").click()
         except Exception as e:
             logger.error(f"Ошибка при добавлении товара из списка желаний в корзину: {e}")
             raise
+
+    def get_rows(self):
+        """
+        Возвращает все строки списка желаний одним вызовом в браузер.
+        """
+        try:
+            return [CartRow.from_dom(row) for row in self.locator(self.wishlist_rows).evaluate_all(CART_ROWS_SCRIPT)]
+        except Exception as e:
+            logger.error(f"Ошибка при получении строк списка желаний: {e}")
+            raise
@@ -1,10 +1,29 @@
 import os
 import pytest
+import pytest_asyncio
 import base64
 from playwright.sync_api import sync_playwright, Page
-from configparser import ConfigParser
-from utils.screenshot_comparer import ScreenshotComparer
+from playwright.async_api import async_playwright
+from utils.screenshot_comparer import ScreenshotComparer, diff_screenshot_path
+from utils.baseline_index import BaselineHashIndex
+from utils.blob_store import BlobStore
+from utils.context_pool import BrowserContextPool
+from utils.auth_state import AuthStateCache
+from utils.account_provisioning import AccountProvisioner
+from utils.account_pool import AccountPool, create_accounts_concurrently
+from utils.async_runner import AsyncScenarioRunner
+from utils.asset_cache import ASSET_TYPES, AssetCache, cache_summary, empty_stats, parse_hosts
+from utils.har_recorder import HAR_POLICIES, HarSession
+from utils.browser_matrix import MatrixResults, apply_engine, matrix_key
+from utils.local_shop import LocalShopServer, apply_local_shop
+from utils.capture_profile import image_mime_type
+from utils.deferred_comparer import DeferredComparisonQueue
+from utils.screenshot_buffer import screenshot_buffer
 from utils.logger import logger
+from utils.wait_policy import configure_wait_policy, wait_policy
+from utils.settings import Settings, load_settings, parse_override
+from configparser import ConfigParser
+from utils.parallel import is_xdist_controller, merge_worker_dirs, merge_worker_logs, worker_id
 from pages.home_page import HomePage
 from pages.login_page import LoginPage
 from pages.register_page import RegisterPage
@@ -14,6 +33,32 @@ import logging
 from data.user import user_data, registration_data
 from utils.helper import generate_random_email, generate_random_string
 
+def screenshot_extra(pytest_html, screenshot_path):
+    """ Возвращает HTML-вложение со скриншотом для отчета или None """
+    if not os.path.exists(screenshot_path):
+        logger.warning(f"Скриншот не найден: {screenshot_path}")
+        return None
+    try:
+        with open(screenshot_path, "rb") as image_file:
+            data = image_file.read()
+        encoded_string = base64.b64encode(data).decode("utf-8")
+
+        return pytest_html.extras.html(
+            f'<div><img src="data:{image_mime_type(data)};base64,{encoded_string}" alt="screenshot" style="width:300px;height:200px;" onclick="window.open(this.src)" align="right"/></div>'
+        )
+    except Exception as e:
+        logger.error(f"Ошибка при чтении файла скриншота: {e}")
+        return None
+
+
+def comparison_extras(pytest_html, screenshot_path):
+    """ Возвращает HTML-вложения с актуальным скриншотом и изображением различий, если оно построено """
+    paths = [screenshot_path]
+    if os.path.exists(diff_screenshot_path(screenshot_path)):
+        paths.append(diff_screenshot_path(screenshot_path))
+    return [extra for extra in (screenshot_extra(pytest_html, path) for path in paths) if extra is not None]
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """ Хук pytest для добавления информации о тесте в отчет HTML """
@@ -23,34 +68,36 @@ def pytest_runtest_makereport(item, call):
     report.description = str(item.function.__doc__)
     extra = getattr(report, "extras", [])
 
+    # Отложенные сравнения теста дожидаются до публикации отчета: несовпадение роняет сам тест
+    deferred_failures = []
+    queue = getattr(item.config, "deferred_queue", None)
+    if queue is not None and report.when == "call":
+        deferred_failures = queue.resolve(item.nodeid)
+        if deferred_failures and report.passed:
+            report.outcome = "failed"
+            report.longrepr = "\n".join(f"{name}: {message}" for name, message in deferred_failures)
+
     if report.when == "call" or report.when == "setup":
-        if report.failed:
-            config = item.funcargs['config']
-            actual_screenshot_dir = config.get("DEFAULT", "actual_screenshot_dir")
+        if report.failed and 'settings' in item.funcargs:
+            actual_screenshot_dir = item.funcargs['settings'].actual_screenshot_dir
 
-            # Получаем имя файла скриншота из атрибута item 
-            screenshot_name = getattr(item, "screenshot_name", None)
+            # Получаем имя файла скриншота из атрибута item или из несовпавших отложенных сравнений
+            screenshot_names = [name for name, _ in deferred_failures]
+            if not screenshot_names and getattr(item, "screenshot_name", None):
+                screenshot_names = [item.screenshot_name]
 
-            if screenshot_name:
+            for screenshot_name in screenshot_names:
                 screenshot_path = os.path.join(actual_screenshot_dir, screenshot_name)
-
-                if os.path.exists(screenshot_path):
-                    try:
-                        with open(screenshot_path, "rb") as image_file:
-                            encoded_string = base64.b64encode(image_file.read()).decode("utf-8")
-
-                        extra.append(pytest_html.extras.html(
-                            f'<div><img src="data:image/png;base64,{encoded_string}" alt="screenshot" style="width:300px;height:200px;" onclick="window.open(this.src)" align="right"/></div>'
-                        ))
-                    except Exception as e:
-                        logger.error(f"Ошибка при чтении файла скриншота: {e}")
-                else:
-                    logger.warning(f"Скриншот не найден: {screenshot_path}")
-            else:
+                # Скриншот, снятый в память и не дошедший до сравнения, записываем для отчета
+                screenshot_buffer.write(screenshot_name, screenshot_path)
+                extra.extend(comparison_extras(pytest_html, screenshot_path))
+            if not screenshot_names:
                 logger.warning("Имя скриншота не задано в тесте.")
 
         report.extras = extra
 
+    if report.when == "teardown":
+        screenshot_buffer.clear()
 
 
 def pytest_html_results_table_header(cells):
@@ -65,30 +112,162 @@ def pytest_html_results_table_row(report, cells):
 
 
 @pytest.hookimpl(optionalhook=True) 
-def pytest_html_results_summary(prefix):
+def pytest_html_results_summary(prefix, postfix, session):
     prefix.extend(["Optional Summary sentence"])
+    # Результаты движков кросс-браузерного прогона — рядом, строка на тест
+    matrix_results = getattr(session.config, "matrix_results", None)
+    if matrix_results is not None:
+        postfix.append(matrix_results.html())
 
 
 def pytest_configure(config):
     log_level_str = config.getini('log_level') or 'INFO'
     log_level = getattr(logging, log_level_str.upper(), logging.INFO)
     logger.setLevel(log_level) 
+    # Управляющий процесс xdist тесты не выполняет: пул сравнений нужен только воркерам
+    if config.getoption("--deferred-compare") and not is_xdist_controller(config):
+        config.deferred_queue = DeferredComparisonQueue(config.getoption("--compare-workers"))
+    if config.getoption("--update-snapshots"):
+        config.snapshot_updates = {}
+    config.asset_cache_stats = empty_stats()
+    if config.getoption("--har-record") and config.getoption("--har-replay"):
+        raise pytest.UsageError("--har-record and --har-replay are mutually exclusive")
+    try:
+        config.settings = load_settings(overrides=cli_overrides(config))
+    except (OSError, ValueError) as e:
+        raise pytest.UsageError(f"Ошибка в настройках: {e}")
+    configure_wait_policy(wait_policy, config.settings)
+    config.browser_engines = list(config.settings.browsers)
+    # Метка регистрируется и без pytest-xdist, чтобы прогон матрицы в одном процессе шел без предупреждений
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the group in the same xdist worker")
+    if config.browser_engines:
+        config.matrix_results = MatrixResults(config.browser_engines)
+        config.pluginmanager.register(config.matrix_results, "browser_matrix")
+    # Управляющий процесс xdist браузер не запускает: магазин нужен только процессам с тестами
+    if config.getoption("--local-shop") and not is_xdist_controller(config):
+        config.local_shop = LocalShopServer()
+        config.local_shop_url = config.local_shop.start()
+
+
+def pytest_generate_tests(metafunc):
+    """ Хук pytest: в кросс-браузерном режиме тесты с браузером параметризуются движками матрицы """
+    engines = getattr(metafunc.config, "browser_engines", None)
+    if engines and "browser_engine" in metafunc.fixturenames:
+        metafunc.parametrize("browser_engine", engines, indirect=True, scope="session")
+
+
+def pytest_collection_modifyitems(config, items):
+    """ Хук pytest: тесты одного движка объединяются в группу xdist, чтобы движок запускался одним воркером """
+    for item in items:
+        engine = getattr(item, "callspec", None) and item.callspec.params.get("browser_engine")
+        if engine:
+            item.add_marker(pytest.mark.xdist_group(engine))
+            item.user_properties.extend([("browser_engine", engine), ("matrix_key", matrix_key(item))])
+
+
+def pytest_sessionfinish(session):
+    """
+    Хук pytest: история ожиданий дополняется замерами процесса, воркер передает сводку обновления эталонов,
+    управляющий процесс объединяет результаты воркеров.
+    В кросс-браузерном режиме неиспользуемые блобы удаляются здесь, когда манифесты всех движков сохранены.
+    """
+    config = session.config
+    wait_policy.save()
+    if hasattr(config, "workeroutput"):
+        config.workeroutput["snapshot_updates"] = getattr(config, "snapshot_updates", None)
+        config.workeroutput["asset_cache_stats"] = config.asset_cache_stats
+        return
+    if not is_xdist_controller(config) and not config.browser_engines:
+        return
+    moved = merge_worker_dirs(config.settings.actual_screenshot_dir)
+    merged = merge_worker_logs("logs", "test.log")
+    if config.settings.blob_store_dir:
+        BlobStore(config.settings.blob_store_dir).prune()
+    logger.info(f"Результаты воркеров объединены: логов {merged}, скриншотов {moved}")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """ Хук pytest-xdist: добавляет сводку обновления эталонов и счетчики кеша ресурсов воркера к общим """
+    for name, value in getattr(node, "workeroutput", {}).get("asset_cache_stats", {}).items():
+        node.config.asset_cache_stats[name] += value
+    snapshot_updates = getattr(node.config, "snapshot_updates", None)
+    worker_updates = getattr(node, "workeroutput", {}).get("snapshot_updates")
+    if snapshot_updates is None or not worker_updates:
+        return
+    for status, names in worker_updates.items():
+        snapshot_updates.setdefault(status, []).extend(names)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Хук pytest, выводящий отчет кеша статических ресурсов, сводку кросс-браузерного прогона
+    и сводку обновления эталонов при --update-snapshots
+    """
+    stats = config.asset_cache_stats
+    if stats["hits"] + stats["misses"] + stats["blocked"]:
+        terminalreporter.write_sep("-", "Кеш статических ресурсов")
+        terminalreporter.write_line(cache_summary(stats))
+
+    matrix_results = getattr(config, "matrix_results", None)
+    if matrix_results is not None:
+        terminalreporter.write_sep("-", "Кросс-браузерная матрица")
+        width = max([len(key) for key, _ in matrix_results.rows()] + [4])
+        terminalreporter.write_line("Test".ljust(width) + "".join(f"  {engine:<9}" for engine in matrix_results.engines))
+        for key, outcomes in matrix_results.rows():
+            terminalreporter.write_line(key.ljust(width) + "".join(f"  {outcome:<9}" for outcome in outcomes))
+
+    snapshot_updates = getattr(config, "snapshot_updates", None)
+    if snapshot_updates is None:
+        return
+    terminalreporter.write_sep("-", "Обновление эталонных скриншотов")
+    for status, title in (("added", "Добавлено"), ("changed", "Изменено"), ("unchanged", "Без изменений")):
+        names = snapshot_updates.get(status, [])
+        terminalreporter.write_line(f"{title}: {len(names)}")
+        if status != "unchanged":
+            for name in names:
+                terminalreporter.write_line(f"  {name}")
+
+
+def pytest_unconfigure(config):
+    queue = getattr(config, "deferred_queue", None)
+    if queue is not None:
+        queue.shutdown()
+    local_shop = getattr(config, "local_shop", None)
+    if local_shop is not None:
+        local_shop.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_engine(request):
+    """ Фикстура движка кросс-браузерного прогона: параметр матрицы или None, если матрица выключена """
+    return getattr(request, "param", None)
 
 
 @pytest.fixture(scope="session")
-def config():
-    """  Фикстура для чтения конфигурации """
-    config = ConfigParser()
-    config.read("config/config.ini")
-    return config
+def settings(pytestconfig, browser_engine) -> Settings:
+    """ Фикстура типизированных настроек процесса (в кросс-браузерном режиме — на каждый движок) """
+    settings = pytestconfig.settings.for_worker()
+    local_shop_url = getattr(pytestconfig, "local_shop_url", None)
+    if local_shop_url:
+        settings = settings.derive(apply_local_shop, local_shop_url)
+    if browser_engine:
+        settings = settings.derive(apply_engine, browser_engine)
+    return settings
 
 
 @pytest.fixture(scope="session")
-def playwright(config):
+def config(settings):
+    """  Фикстура конфигурации для страниц: копия ConfigParser тех же настроек """
+    return settings.config_parser()
+
+
+@pytest.fixture(scope="session")
+def playwright(settings):
     """  Фикстура для инициализации Playwright """
     with sync_playwright() as p:
-        browser_type = config.get("DEFAULT", "browser")
-        headless = config.getboolean("DEFAULT", "headless")
+        browser_type = settings.browser
+        headless = settings.headless
         if browser_type == "chromium":
             browser = p.chromium.launch(headless=headless)
         elif browser_type == "firefox":
@@ -101,34 +280,176 @@ def playwright(config):
         browser.close()
 
 
+@pytest.fixture(scope="session")
+def asset_cache(settings, pytestconfig):
+    """ Фикстура для кеша статических ресурсов и блокировки сторонних хостов (None, если кеш отключен) """
+    cache_dir = settings.asset_cache_dir
+    blocked_hosts = parse_hosts(settings.blocked_hosts)
+    if not cache_dir and not blocked_hosts:
+        yield None
+        return
+    # Без директории кеша ресурсы не кешируются, но блокировка хостов работает
+    cache = AssetCache(cache_dir, blocked_hosts, settings.asset_cache_max_age,
+                       asset_types=ASSET_TYPES if cache_dir else (), stats=pytestconfig.asset_cache_stats)
+    yield cache
+    logger.info(f"Кеш статических ресурсов: {cache_summary(cache.stats)}")
+
+
+@pytest.fixture(scope="session")
+def har_session(settings, pytestconfig):
+    """ Фикстура для записи (--har-record) или воспроизведения (--har-replay) трафика тестов (None вне этих режимов) """
+    mode = "record" if pytestconfig.getoption("--har-record") else "replay" if pytestconfig.getoption("--har-replay") else None
+    if mode is None:
+        return None
+    return HarSession(settings.har_dir, mode, settings.har_unmatched)
+
+
+@pytest.fixture(scope="session")
+def context_pool(playwright, settings, asset_cache, har_session):
+    """ Фикстура для пула контекстов браузера (на процесс) """
+    size = settings.context_pool_size
+    prepare = asset_cache.install if asset_cache is not None else None
+    if har_session is not None and har_session.mode == "record":
+        # HAR сохраняется при закрытии контекста: контекст на тест, трафик пишется без кеша ресурсов
+        size, prepare = 0, None
+    pool = BrowserContextPool(playwright, size, settings.context_max_uses, prepare=prepare)
+    yield pool
+    pool.close()
+
+
 @pytest.fixture
-def page(playwright, config, request):
+def page(context_pool, settings, request, har_session):
     """ Фикстура для создания страницы """
-    browser = playwright
-    page = browser.new_page()
-    page.set_default_timeout(float(config.get("DEFAULT", "timeout", fallback="10"))) 
+    context, page = context_pool.acquire()
+    page.set_default_timeout(settings.timeout)
+    unmatched = har_session.attach(context, request.node.nodeid) if har_session is not None else []
     yield page
-    page.close()
+    context_pool.release(context, page)
+    if har_session is not None:
+        har_session.check(unmatched, request.node.nodeid)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_browser(settings):
+    """  Фикстура для асинхронного Playwright: браузер на цикле событий сессии """
+    async with async_playwright() as p:
+        browser = await getattr(p, settings.browser).launch(headless=settings.headless)
+        yield browser
+        await browser.close()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_page(async_browser, settings):
+    """ Фикстура для создания асинхронной страницы в отдельном контексте """
+    context = await async_browser.new_context()
+    page = await context.new_page()
+    page.set_default_timeout(settings.timeout)
+    yield page
+    await context.close()
+
 
 @pytest.fixture
-def screenshot_comparer(config, pytestconfig):  
-    """ Фикстура для ScreenshotComparer """
-    screenshot_dir = config.get("DEFAULT", "screenshot_dir")
-    actual_screenshot_dir = config.get("DEFAULT", "actual_screenshot_dir") 
-    threshold = int(config.get("DEFAULT", "threshold"))
-    update_snapshots = pytestconfig.getoption("--update-snapshots") 
+def async_scenarios(async_browser, settings):
+    """ Фикстура для конкурентного запуска независимых асинхронных сценариев """
+    return AsyncScenarioRunner(async_browser, settings.async_concurrency, timeout=settings.timeout)
+
+@pytest.fixture(scope="session")
+def baseline_index(settings):
+    """ Фикстура для индекса хешей эталонных скриншотов """
+    index = BaselineHashIndex(settings.screenshot_dir, settings.baseline_index_file)
+    yield index
+    index.save()
+
 
-    return ScreenshotComparer(screenshot_dir, actual_screenshot_dir, threshold, update_snapshots)
+@pytest.fixture(scope="session")
+def blob_store(settings, browser_engine):
+    """ Фикстура для контентно-адресуемого хранилища скриншотов (None, если хранилище отключено) """
+    if not settings.blob_store_dir:
+        yield None
+        return
+    store = BlobStore(settings.blob_store_dir)
+    yield store
+    store.save()
+    # Воркер xdist и движок матрицы не удаляют блобы: манифесты других воркеров и движков еще могут быть не сохранены
+    if worker_id() is None and not browser_engine:
+        store.prune()
+
+
+@pytest.fixture
+def screenshot_comparer(settings, pytestconfig, baseline_index, blob_store, request):
+    """ Фикстура для ScreenshotComparer """
+    update_snapshots = pytestconfig.getoption("--update-snapshots")
+    deferred_queue = getattr(pytestconfig, "deferred_queue", None)
+
+    return ScreenshotComparer(settings.screenshot_dir, settings.actual_screenshot_dir, settings.threshold,
+                              update_snapshots, baseline_index, deferred_queue, request.node.nodeid,
+                              settings.keep_actual_screenshots,
+                              ambiguous_band=settings.ambiguous_band, ssim_threshold=settings.ssim_threshold,
+                              tile_grid=settings.tile_grid, tile_threshold=settings.tile_threshold,
+                              blob_store=blob_store,
+                              snapshot_updates=getattr(pytestconfig, "snapshot_updates", None),
+                              namespace=settings.screenshot_namespace)
 
 def pytest_addoption(parser):
     parser.addoption(
         "--update-snapshots", action="store_true", help="Update baseline screenshots."
     )
+    parser.addoption(
+        "--deferred-compare", action="store_true",
+        help="Compare screenshots in a process pool and report mismatches once hashing is done."
+    )
+    parser.addoption(
+        "--compare-workers", type=int, default=None,
+        help="Number of processes for --deferred-compare (default: number of CPUs)."
+    )
+    parser.addoption(
+        "--keep-screenshots", action="store_true",
+        help="Always write actual screenshots to actual_screenshot_dir, even when they match."
+    )
+    parser.addoption(
+        "--browsers", default=None,
+        help="Comma-separated engines for a cross-browser run (chromium,firefox,webkit). "
+             "Run with -n <engines> --dist loadgroup to drive each engine in its own worker."
+    )
+    parser.addoption(
+        "--har-record", action="store_true", help="Record the network traffic of each test into har_dir."
+    )
+    parser.addoption(
+        "--har-replay", action="store_true", help="Serve the network traffic of each test from its HAR recording."
+    )
+    parser.addoption(
+        "--har-unmatched", choices=HAR_POLICIES, default=None,
+        help="Replay policy for requests missing from the recording: fail, fallthrough or stub "
+             "(default: har_unmatched from config.ini)."
+    )
+    parser.addoption(
+        "--local-shop", action="store_true",
+        help="Run against the bundled local stand-in shop instead of base_url. "
+             "Its screenshots differ from the real site: record baselines with --update-snapshots."
+    )
+    parser.addoption(
+        "--capture-profile", default=None,
+        help="Capture profile from config.ini for all screenshots (default, fast, archival)."
+    )
+    parser.addoption(
+        "--setting", action="append", default=[], metavar="NAME=VALUE",
+        help="Override a [DEFAULT] value from config.ini, e.g. --setting timeout=10000 (repeatable). "
+             "Environment variables AUTOTESTS_<NAME> override config.ini too; --setting wins over them."
+    )
 
-@pytest.fixture
-def logged_in_page(page: Page, config: ConfigParser):
+
+def cli_overrides(config):
+    """ Возвращает переопределения настроек из командной строки: --setting и опции-псевдонимы настроек """
+    overrides = [parse_override(value) for value in config.getoption("--setting")]
+    aliases = (("browsers", config.getoption("--browsers")), ("har_unmatched", config.getoption("--har-unmatched")),
+               ("capture_profile", config.getoption("--capture-profile")),
+               ("keep_actual_screenshots", config.getoption("--keep-screenshots") or None))
+    overrides.extend((name, str(value)) for name, value in aliases if value is not None)
+    return tuple(overrides)
+
+def login_via_ui(page: Page, config: ConfigParser):
     """
-    Фикстура для автоматического логина пользователя.
+    Выполняет вход пользователя через интерфейс.
     """
     home_page = HomePage(page, config)
     login_page = LoginPage(page, config)
@@ -140,22 +461,97 @@ def logged_in_page(page: Page, config: ConfigParser):
     expect(home_page.page.locator(home_page.logout_link)).to_be_visible(timeout=5000) 
     assert home_page.is_logged_in(), "Ошибка входа"
     logger.info("Успешный вход")
+
+
+@pytest.fixture(scope="session")
+def auth_state(config):
+    """ Фикстура для кеша состояния авторизации на сессию (на воркер) """
+    return AuthStateCache(lambda page: login_via_ui(page, config))
+
+
+def register_accounts(base_url, count):
+    """
+    Регистрирует count аккаунтов через HTTP. Выполняется в отдельном потоке со своим экземпляром Playwright.
+    """
+    accounts = []
+    with sync_playwright() as p:
+        for _ in range(count):
+            request_context = p.request.new_context()
+            try:
+                email = generate_random_email()
+                password = generate_random_string(10)
+                AccountProvisioner(request_context, base_url).register(
+                    registration_data["gender"], registration_data["first_name"],
+                    registration_data["last_name"], email, password)
+                accounts.append((email, password))
+            finally:
+                request_context.dispose()
+    return accounts
+
+
+@pytest.fixture(scope="session")
+def account_pool(settings):
+    """ Фикстура для пула тестовых аккаунтов (None, если пул отключен) """
+    if settings.account_pool_size <= 0:
+        return None
+    pool = AccountPool(settings.account_pool_file,
+                       lambda count: create_accounts_concurrently(
+                           count, lambda batch: register_accounts(settings.base_url, batch),
+                           settings.account_pool_workers))
+    pool.fill(settings.account_pool_size)
+    return pool
+
+
+@pytest.fixture
+def logged_in_page(page: Page, config: ConfigParser, auth_state):
+    """
+    Фикстура для автоматического логина пользователя.
+    Вход через интерфейс выполняется один раз за сессию, затем подставляются сохраненные cookies.
+    """
+    auth_state.ensure_logged_in(page, HomePage(page, config))
     return page
 
 
 @pytest.fixture
-def registered_page(page: Page, config: ConfigParser):
+def registered_page(page: Page, config: ConfigParser, settings: Settings, account_pool):
     """
     Фикстура для автоматической регистрации пользователя.
+    При registration_mode = http форма отправляется запросом, а браузер получает cookie сессии.
+    При account_pool_size > 0 аккаунт берется из пула и очищается после теста.
     """
     home_page = HomePage(page, config)
     register_page = RegisterPage(page, config)
+    email = generate_random_email()
+    password = generate_random_string(10)
+
+    if account_pool is not None:
+        email, password = account_pool.lease()
+        logger.info(f"Аккаунт получен из пула: {email}")
+        provisioner = AccountProvisioner(page.context.request, settings.base_url)
+        clean = False
+        try:
+            provisioner.login(email, password)
+            home_page.goto()
+            assert home_page.is_logged_in(), "Ошибка входа аккаунтом из пула"
+            yield email, password, page
+            clean = provisioner.reset()
+        finally:
+            account_pool.release(email, clean)
+        return
+
+    if settings.registration_mode == "http":
+        logger.info("Начало процесса регистрации через HTTP")
+        provisioner = AccountProvisioner(page.context.request, settings.base_url)
+        provisioner.register(registration_data["gender"], registration_data["first_name"],
+                             registration_data["last_name"], email, password)
+        home_page.goto()
+        assert home_page.is_logged_in(), "Ошибка регистрации: сессия не передана в браузер"
+        yield email, password, page
+        return
 
     logger.info("Начало процесса регистрации")
     home_page.goto()
     home_page.goto_register_page()
-    email = generate_random_email()
-    password = generate_random_string(10)
     register_page.register(
         gender=registration_data["gender"],
         first_name=registration_data["first_name"],
@@ -165,7 +561,7 @@ def registered_page(page: Page, config: ConfigParser):
         confirm_password=password
     )
     try:
-        expect(register_page.page.locator(register_page.success_message)).to_be_visible(timeout=5000) 
+        expect(register_page.page.locator(register_page.success_message)).to_be_visible(timeout=5000)
         assert register_page.is_success_message_visible(), "Ошибка регистрации"
         logger.info("Успешная регистрация")
     except AssertionError as e:
@@ -0,0 +1,111 @@
+"""
+Поддельные объекты Playwright для офлайн-тестов утилит: страница, контекст, браузер, ответ на запрос и перехваченный маршрут.
+Повторяют только те методы, которые вызывают утилиты фреймворка.
+"""
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.closed = False
+        self.listeners = []
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def goto(self, url):
+        self.url = url
+        for handler in self.listeners:
+            handler(self)
+
+    def evaluate(self, script):
+        self.context.storage_cleared += 1
+
+    def unroute_all(self):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.cookies_cleared = 0
+        self.storage_cleared = 0
+        self.routes = []
+        self.listeners = []
+        self.closed = False
+
+    def on(self, event, handler):
+        self.listeners.append(handler)
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        for handler in self.listeners:
+            handler(page)
+        return page
+
+    def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    def clear_permissions(self):
+        pass
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def unroute_all(self):
+        self.routes.clear()
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **options):
+        self.contexts.append(FakeContext())
+        return self.contexts[-1]
+
+
+class FakeResponse:
+    def __init__(self, url="", text="", status=200, body=b"", headers=None):
+        self.url = url
+        self.status = status
+        self.ok = status < 400
+        self.headers = headers or {}
+        self._text = text
+        self._body = body
+
+    def text(self):
+        return self._text
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, body=b"body{}"):
+        self.body = body
+        self.action = None
+
+    def abort(self, error_code):
+        self.action = ("abort", error_code)
+
+    def fallback(self):
+        self.action = ("fallback",)
+
+    def fetch(self):
+        return FakeResponse(body=self.body, headers={"content-type": "text/css", "content-encoding": "gzip"})
+
+    def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.action = ("fulfill", "network" if response is not None else "cache", status, headers, body)
@@ -0,0 +1,67 @@
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from utils.account_pool import AccountPool, create_accounts_concurrently
+
+
+def fake_accounts(count):
+    return [(f"user{index}@random.com", "secret") for index in range(count)]
+
+
+def lease_from_pool(path):
+    return AccountPool(path, fake_accounts).lease()
+
+
+def test_account_pool_leases_exclusively_across_processes(tmp_path):
+    """TC_ACCOUNT_POOL_001: Аккаунты пула выдаются воркерам без повторов, грязный аккаунт списывается."""
+    path = str(tmp_path / "pool.json")
+    pool = AccountPool(path, fake_accounts)
+    pool.fill(4)
+    pool.fill(4)
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        leased = list(executor.map(lease_from_pool, [path] * 4))
+    assert sorted(email for email, _ in leased) == [f"user{index}@random.com" for index in range(4)]
+
+    pool.release("user0@random.com", clean=True)
+    pool.release("user1@random.com", clean=False)
+    assert pool.lease()[0] == "user0@random.com"
+    with open(path, encoding="utf-8") as pool_file:
+        states = {account["email"]: account["state"] for account in json.load(pool_file)}
+    assert states["user1@random.com"] == "retired" and len(states) == 4
+    assert not os.path.exists(f"{path}.lock")
+
+
+def test_accounts_created_in_batches_per_thread():
+    """TC_ACCOUNT_POOL_002: Аккаунты регистрируются пачками в нескольких потоках."""
+    threads = set()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def register_batch(count):
+        threads.add(threading.get_ident())
+        barrier.wait()
+        return [(f"{threading.get_ident()}-{index}", "secret") for index in range(count)]
+
+    accounts = create_accounts_concurrently(7, register_batch, workers=3)
+    assert len(accounts) == 7 and len(set(accounts)) == 7
+    assert len(threads) == 3 and threading.get_ident() not in threads
+
+
+def test_pool_registers_accounts_outside_the_lock(tmp_path):
+    """TC_ACCOUNT_POOL_003: Регистрация идет без блокировки файла пула, бронь учитывается параллельным fill."""
+    path = str(tmp_path / "pool.json")
+    calls = []
+
+    def register(count):
+        calls.append(count)
+        assert not os.path.exists(f"{path}.lock")
+        AccountPool(path, register).fill(3)
+        with open(path, encoding="utf-8") as pool_file:
+            assert [account["state"] for account in json.load(pool_file)] == ["registering"]
+        return fake_accounts(count)
+
+    AccountPool(path, register).fill(3)
+    assert calls == [3]
+    with open(path, encoding="utf-8") as pool_file:
+        assert [account["state"] for account in json.load(pool_file)] == ["free"] * 3
@@ -0,0 +1,32 @@
+import pytest
+from utils.account_provisioning import AccountProvisioner
+from fakes import FakeResponse
+
+
+class FakeRequestContext:
+    def __init__(self, result_url, result_text=""):
+        self.result_url = result_url
+        self.result_text = result_text
+        self.posted = None
+
+    def get(self, url):
+        return FakeResponse(url, '<input name="__RequestVerificationToken" type="hidden" value="tok&amp;en" />')
+
+    def post(self, url, form):
+        self.posted = form
+        return FakeResponse(self.result_url, self.result_text)
+
+
+def test_account_provisioner_posts_register_form():
+    """TC_PROVISIONING_001: Регистрация через HTTP отправляет форму с токеном анти-подделки и сообщает об ошибках сервера."""
+    request_context = FakeRequestContext("https://demowebshop.tricentis.com/registerresult/1")
+    AccountProvisioner(request_context, "https://demowebshop.tricentis.com").register(
+        "male", "first_name", "last_name", "user@random.com", "secret")
+    assert request_context.posted["__RequestVerificationToken"] == "tok&en"
+    assert request_context.posted["Gender"] == "M" and request_context.posted["ConfirmPassword"] == "secret"
+
+    rejected = FakeRequestContext("https://demowebshop.tricentis.com/register",
+                                  '<div class="validation-summary-errors"><ul><li>The specified email already exists</li></ul></div>')
+    with pytest.raises(RuntimeError, match="already exists"):
+        AccountProvisioner(rejected, "https://demowebshop.tricentis.com").register(
+            "male", "first_name", "last_name", "user@random.com", "secret")
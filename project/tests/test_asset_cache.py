@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from utils.asset_cache import AssetCache
+from fakes import FakeContext, FakeRoute
+
+
+def test_asset_cache_serves_repeated_assets_and_blocks_hosts(tmp_path):
+    """TC_ASSET_CACHE_001: Статические ресурсы отдаются из кеша после первой загрузки, сторонние хосты блокируются."""
+    cache = AssetCache(str(tmp_path / "assets"), ["google-analytics.com"])
+    css = SimpleNamespace(url="https://demowebshop.tricentis.com/Themes/style.css", method="GET",
+                          resource_type="stylesheet")
+
+    route = FakeRoute()
+    cache.handle(route, css)
+    assert route.action[:2] == ("fulfill", "network")
+
+    route = FakeRoute(body=b"changed")
+    AssetCache(str(tmp_path / "assets"), stats=cache.stats).handle(route, css)
+    assert route.action == ("fulfill", "cache", 200, {"content-type": "text/css"}, b"body{}")
+
+    route = FakeRoute()
+    cache.handle(route, SimpleNamespace(url="https://ssl.google-analytics.com/ga.js", method="GET",
+                                        resource_type="script"))
+    assert route.action == ("abort", "blockedbyclient")
+
+    route = FakeRoute()
+    cache.handle(route, SimpleNamespace(url="https://demowebshop.tricentis.com/", method="GET",
+                                        resource_type="document"))
+    assert route.action == ("fallback",)
+    assert cache.stats == {"hits": 1, "misses": 1, "blocked": 1, "bytes_from_cache": 6, "bytes_from_network": 6}
+
+
+def test_asset_cache_routes_only_assets_and_blocked_hosts(tmp_path):
+    """TC_ASSET_CACHE_002: Маршрут ставится только на URL статических ресурсов и заблокированных хостов."""
+    context = FakeContext()
+    AssetCache(str(tmp_path / "assets"), ["google-analytics.com"]).install(context)
+    assets, blocked = context.routes
+
+    def routed(url):
+        return any(pattern.search(url) for pattern in context.routes)
+
+    assert routed("https://demowebshop.tricentis.com/Themes/DefaultClean/Content/styles.css")
+    assert routed("https://demowebshop.tricentis.com/content/images/thumbs/0000172.jpeg?v=2")
+    assert blocked.search("https://ssl.google-analytics.com/") and not assets.search("https://ssl.google-analytics.com/")
+    assert not routed("https://demowebshop.tricentis.com/books")
+    assert not routed("https://demowebshop.tricentis.com/addproducttocart/catalog/13/1/1")
+    assert not routed("https://notgoogle-analytics.com/")
+
+    context = FakeContext()
+    AssetCache(str(tmp_path / "assets"), asset_types=()).install(context)
+    assert context.routes == []
@@ -0,0 +1,58 @@
+import pytest
+from pages.async_pages.home_page import AsyncHomePage
+from pages.async_pages.search_results_page import AsyncSearchResultsPage
+from pages.async_pages.login_page import AsyncLoginPage
+from playwright.async_api import expect
+from data.search_data import search_terms
+from data.user import user_data
+from utils.logger import logger
+
+
+@pytest.mark.asyncio
+async def test_async_search_existing_product(async_page, config):
+    """TC_ASYNC_001: Проверка поиска существующего товара через асинхронные страницы."""
+    try:
+        home_page = AsyncHomePage(async_page, config)
+        search_results_page = AsyncSearchResultsPage(async_page, config)
+        await home_page.goto()
+        await home_page.search(search_terms["existing_product"])
+
+        await expect(async_page.locator(search_results_page.search_results)).to_be_visible(timeout=5000)
+        assert await search_results_page.has_results()
+    except Exception as e:
+        logger.error(f"Ошибка при асинхронном поиске существующего товара: {e}")
+        raise
+
+
+@pytest.mark.asyncio
+async def test_async_concurrent_flows(async_scenarios, config):
+    """TC_ASYNC_002: Независимые сценарии поиска и входа выполняются конкурентно в одном процессе."""
+    async def search(page, term):
+        home_page = AsyncHomePage(page, config)
+        search_results_page = AsyncSearchResultsPage(page, config)
+        await home_page.goto()
+        await home_page.search(term)
+        await expect(page.locator(search_results_page.no_results_message)).to_be_visible(timeout=5000)
+        return await search_results_page.get_no_results_message()
+
+    async def login(page):
+        home_page = AsyncHomePage(page, config)
+        await home_page.goto()
+        await home_page.goto_login_page()
+        await AsyncLoginPage(page, config).login(user_data["valid"]["email"], user_data["valid"]["password"])
+        await expect(page.locator(home_page.logout_link)).to_be_visible(timeout=5000)
+        return await home_page.is_logged_in()
+
+    try:
+        scenarios = [lambda page: search(page, search_terms["nonexistent_product"]) for _ in range(6)]
+        scenarios.append(login)
+        results = await async_scenarios.run(scenarios)
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        assert not errors, f"Сценарии завершились с ошибкой: {errors}"
+        assert results[:-1] == ["No products were found that matched your criteria."] * 6
+        assert results[-1] is True
+        assert async_scenarios.peak > 1, "Сценарии выполнялись последовательно"
+    except Exception as e:
+        logger.error(f"Ошибка при конкурентном выполнении асинхронных сценариев: {e}")
+        raise
@@ -0,0 +1,58 @@
+from utils.auth_state import AuthStateCache
+from fakes import FakeContext
+
+
+def test_auth_state_reused_until_rejected():
+    """TC_AUTH_STATE_001: Вход через интерфейс выполняется один раз, повторно — только после отклонения или истечения cookie."""
+    logins = []
+    cache = AuthStateCache(lambda page: logins.append(page))
+    context = FakeContext()
+    context.storage_state = lambda: {"cookies": [{"name": "NOPCOMMERCE.AUTH", "expires": -1}], "origins": []}
+    context.add_cookies = lambda cookies: context.__dict__.setdefault("added", []).extend(cookies)
+
+    assert not cache.apply(context)
+    cache.capture(context.new_page())
+    assert cache.apply(context) and context.added[0]["name"] == "NOPCOMMERCE.AUTH"
+    assert len(logins) == 1
+
+    cache.state["cookies"][0]["expires"] = 1
+    assert not cache.apply(context)
+    cache.capture(context.new_page())
+    cache.invalidate()
+    assert not cache.apply(context) and len(logins) == 2
+
+
+class FakeHomePage:
+    def __init__(self, logged_in):
+        self.logged_in = list(logged_in)
+        self.visits = 0
+
+    def goto(self):
+        self.visits += 1
+
+    def is_logged_in(self):
+        return self.logged_in.pop(0)
+
+
+def test_rejected_session_replaced_by_fresh_login():
+    """TC_AUTH_STATE_002: Отклоненная сервером сессия сбрасывается, cookies очищаются, вход выполняется заново."""
+    sessions = iter(["stale", "fresh"])
+    cache = AuthStateCache(lambda page: page.context.__dict__.update(session=next(sessions)))
+    context = FakeContext()
+    context.storage_state = lambda: {"cookies": [{"name": "NOPCOMMERCE.AUTH", "value": context.session}],
+                                     "origins": []}
+    context.add_cookies = lambda cookies: context.__dict__.setdefault("added", []).extend(cookies)
+    page = context.new_page()
+
+    cache.ensure_logged_in(page, FakeHomePage([]))
+    assert cache.logins == 1 and cache.state["cookies"][0]["value"] == "stale"
+
+    home_page = FakeHomePage([False])
+    cache.ensure_logged_in(page, home_page)
+    assert home_page.visits == 1 and context.added[0]["value"] == "stale"
+    assert context.cookies_cleared == 1 and cache.logins == 2
+    assert cache.state["cookies"][0]["value"] == "fresh"
+
+    home_page = FakeHomePage([True])
+    cache.ensure_logged_in(page, home_page)
+    assert cache.logins == 2 and context.cookies_cleared == 1 and context.added[-1]["value"] == "fresh"
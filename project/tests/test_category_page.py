@@ -23,7 +23,9 @@ def test_display_list_of_products_in_category(page, config, home_page, category_
         home_page.click_category(category["product_category"])
 
         expect(category_page.page.locator(category_page.product_grid)).to_be_visible(timeout=5000)
-        assert category_page.get_product_count() > 0, "В категории не найдено товаров"
+        products = category_page.get_products()
+        assert products, "В категории не найдено товаров"
+        assert all(product.name and product.price for product in products), f"Неполные карточки товаров: {products}"
     except Exception as e:
         logger.error(f"Ошибка при отображении списка товаров в категории: {e}")
         raise
@@ -0,0 +1,50 @@
+from utils.context_pool import BrowserContextPool
+from fakes import FakeBrowser
+
+
+def test_context_pool_reuses_and_recycles_contexts():
+    """TC_POOL_001: Контекст сбрасывается и переиспользуется, а после max_uses закрывается."""
+    browser = FakeBrowser()
+    pool = BrowserContextPool(browser, size=1, max_uses=2)
+
+    context, page = pool.acquire()
+    page.goto("https://demowebshop.tricentis.com/")
+    popup = context.new_page()
+    pool.release(context, page)
+    assert page.url == "about:blank" and popup.closed
+    assert context.cookies_cleared == 1 and context.storage_cleared == 1
+
+    reused_context, reused_page = pool.acquire()
+    assert reused_context is context and reused_page is page
+    pool.release(reused_context, reused_page)
+    assert context.closed
+
+    new_context, _ = pool.acquire()
+    assert new_context is not context and len(browser.contexts) == 2
+
+
+def test_context_pool_prepares_each_lease():
+    """TC_POOL_002: Обработчик prepare вызывается для нового контекста и заново после его сброса."""
+    browser = FakeBrowser()
+    prepared = []
+    pool = BrowserContextPool(browser, prepare=prepared.append)
+    context, page = pool.acquire()
+    pool.release(context, page)
+    assert prepared == [context, context]
+
+
+def test_context_pool_recreates_context_after_other_origins():
+    """TC_POOL_003: Контекст, вкладки которого открывали другие источники, закрывается вместо сброса."""
+    browser = FakeBrowser()
+    pool = BrowserContextPool(browser)
+
+    context, page = pool.acquire()
+    page.goto("https://demowebshop.tricentis.com/")
+    pool.release(context, page)
+    assert pool.acquire() == (context, page)
+
+    page.goto("https://demowebshop.tricentis.com/")
+    context.new_page().goto("https://example.com/")
+    pool.release(context, page)
+    assert context.closed and not pool.idle
+    assert pool.acquire()[0] is not context
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+import pytest
+from utils.har_recorder import HarSession
+from fakes import FakeRoute
+
+
+class FakeRoutingContext:
+    def __init__(self):
+        self.routes = []
+        self.har = None
+
+    def route(self, url, handler):
+        self.routes.append(handler)
+
+    def route_from_har(self, har, **options):
+        self.har = (har, options)
+
+
+def test_har_session_records_and_replays_with_unmatched_policy(tmp_path):
+    """TC_HAR_001: Трафик теста пишется в свой HAR, при воспроизведении запросы вне записи обрабатываются политикой."""
+    nodeid = "tests/test_login.py::test_logout[chromium]"
+    har_path = str(tmp_path / "test_login" / "test_logout[chromium].har")
+
+    context = FakeRoutingContext()
+    assert HarSession(str(tmp_path), "record").attach(context, nodeid) == []
+    assert context.har == (har_path, {"update": True, "update_content": "embed", "update_mode": "minimal"})
+
+    with pytest.raises(FileNotFoundError):
+        HarSession(str(tmp_path), "replay").attach(FakeRoutingContext(), nodeid)
+    with open(har_path, "w", encoding="utf-8") as har_file:
+        har_file.write("{}")
+
+    context = FakeRoutingContext()
+    HarSession(str(tmp_path), "replay", "fallthrough").attach(context, nodeid)
+    assert context.routes == [] and context.har == (har_path, {"not_found": "fallback"})
+
+    request = SimpleNamespace(method="GET", url="https://demowebshop.tricentis.com/new")
+    for policy, action in (("stub", ("fulfill", "cache", 204, None, "")), ("fail", ("abort", "internetdisconnected"))):
+        session = HarSession(str(tmp_path), "replay", policy)
+        context = FakeRoutingContext()
+        unmatched = session.attach(context, nodeid)
+        route = FakeRoute()
+        context.routes[0](route, request)
+        assert route.action == action
+        assert unmatched == ["GET https://demowebshop.tricentis.com/new"]
+        if policy == "fail":
+            with pytest.raises(AssertionError):
+                session.check(unmatched, nodeid)
+        else:
+            session.check(unmatched, nodeid)
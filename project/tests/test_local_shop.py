@@ -0,0 +1,67 @@
+import json
+import time
+from http.cookiejar import CookieJar
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+import pytest
+from utils.account_provisioning import AccountProvisioner
+from utils.local_shop import LocalShopServer
+from fakes import FakeResponse
+
+
+class UrllibRequestContext:
+    """Минимальная замена APIRequestContext поверх urllib: общий cookie jar, переходы по редиректам."""
+    def __init__(self):
+        self.opener = build_opener(HTTPCookieProcessor(CookieJar()))
+
+    def _open(self, url, data=None, headers=None):
+        try:
+            response = self.opener.open(Request(url, data=data, headers=headers or {}), timeout=5)
+        except HTTPError as error:
+            response = error
+        with response:
+            return FakeResponse(response.geturl(), response.read().decode("utf-8"), response.status)
+
+    def get(self, url):
+        return self._open(url)
+
+    def post(self, url, form=None, data=None, headers=None):
+        if form is not None:
+            data, headers = urlencode(form), {"Content-Type": "application/x-www-form-urlencoded"}
+        return self._open(url, data.encode("utf-8"), headers)
+
+
+def test_local_shop_serves_account_flows():
+    """TC_LOCAL_SHOP_001: Локальный магазин запускается быстрее секунды и проходит регистрацию, вход, корзину и очистку."""
+    started = time.perf_counter()
+    server = LocalShopServer()
+    url = server.start()
+    try:
+        assert time.perf_counter() - started < 1
+        request_context = UrllibRequestContext()
+        provisioner = AccountProvisioner(request_context, url)
+        provisioner.register("male", "first_name", "last_name", "user@random.com", "secret")
+        with pytest.raises(RuntimeError, match="already exists"):
+            AccountProvisioner(UrllibRequestContext(), url).register(
+                "male", "first_name", "last_name", "user@random.com", "secret")
+
+        home = request_context.get(f"{url}/").text()
+        assert 'class="ico-logout"' in home and "href=\"/customer/info\"" in home
+        added = json.loads(request_context.post(f"{url}/addproducttocart/details/smartphone/1", data="").text())
+        assert "shopping cart" in added["message"] and added["updatetopcartsectionhtml"] == "(1)"
+        request_context.post(f"{url}/addproducttocart/details/fiction/2", data="")
+        request_context.post(f"{url}/customer/addressadd", form={"Address.FirstName": "first_name",
+                                                                  "Address.City": "City"})
+        assert "cart-item-row" in request_context.get(f"{url}/cart").text()
+        assert provisioner.reset()
+        assert "Your Shopping Cart is empty!" in request_context.get(f"{url}/cart").text()
+
+        with pytest.raises(RuntimeError, match="Ошибка входа"):
+            AccountProvisioner(UrllibRequestContext(), url).login("user@random.com", "wrong")
+        AccountProvisioner(UrllibRequestContext(), url).login("user@random.com", "secret")
+        search = request_context.get(f"{url}/search?q=laptop").text()
+        assert "14.1-inch Laptop" in search and "Smartphone" not in search
+        assert "/login" in UrllibRequestContext().get(f"{url}/customer/orders").url
+    finally:
+        server.stop()
@@ -0,0 +1,111 @@
+from configparser import ConfigParser
+from contextlib import contextmanager
+from types import SimpleNamespace
+import pytest
+from pages.async_pages.home_page import AsyncHomePage
+from pages.base_page import IMAGES_LOADED_SCRIPT, BasePage
+from pages.category_page import CategoryPage
+from pages.home_page import HomePage
+from pages.records import PRODUCT_CARDS_SCRIPT, AddressRecord, CartRow, ProductCard
+from utils.wait_policy import WaitPolicy
+
+
+@pytest.fixture
+def page_config():
+    """
+    Фикстура минимальной конфигурации страниц для офлайн-тестов.
+    """
+    config = ConfigParser()
+    config.read_dict({"DEFAULT": {"base_url": "http://shop", "browser": "chromium", "screenshot_dir": "s/",
+                                  "actual_screenshot_dir": "s/actual/"}})
+    return config
+
+
+class FakeNavigationPage:
+    def __init__(self):
+        self.calls = []
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.calls.append(("goto", url, wait_until))
+
+    def locator(self, selector):
+        return SimpleNamespace(click=lambda timeout=None: self.calls.append(("click", selector)))
+
+    def wait_for_load_state(self, state, timeout=None):
+        self.calls.append(("load_state", state))
+
+    @contextmanager
+    def expect_navigation(self, wait_until=None, timeout=None):
+        yield
+        self.calls.append(("navigation", wait_until))
+
+
+def test_pages_wait_for_their_readiness_condition(page_config, monkeypatch):
+    """TC_PAGES_001: Переход ждет условия готовности целевой страницы, а не загрузки всех ресурсов."""
+    # Замеры поддельной страницы не должны попасть в историю ожиданий прогона
+    monkeypatch.setattr("pages.base_page.wait_policy", WaitPolicy())
+    monkeypatch.setattr(BasePage, "wait_visible",
+                        lambda self, locator, description=None, fallback=None: self.page.calls.append(("visible", locator)))
+    page = FakeNavigationPage()
+    home_page = HomePage(page, page_config)
+
+    home_page.goto()
+    home_page.goto_login_page()
+    assert page.calls == [("goto", "http://shop/", "domcontentloaded"), ("visible", "div.home-page"),
+                          ("click", home_page.login_link), ("navigation", "commit"), ("visible", "#Email"),
+                          ("load_state", "domcontentloaded")]
+    assert BasePage.wait_until == "load" and BasePage.ready_selector is None
+    assert CategoryPage.ready_selector == "div.category-page"
+
+
+def test_listing_extracted_in_one_call(page_config):
+    """TC_PAGES_002: Карточки товаров извлекаются одним вызовом evaluate_all и разбираются в типизированные записи."""
+    calls = []
+    cards = [{"name": "Fiction", "url": "http://shop/fiction", "price": "1,024.00", "can_add_to_cart": True},
+             {"name": "Health Book", "url": "http://shop/health-book", "price": "", "can_add_to_cart": False}]
+    page = SimpleNamespace(locator=lambda selector: SimpleNamespace(
+        evaluate_all=lambda script: calls.append((selector, script)) or cards))
+    category_page = CategoryPage(page, page_config)
+
+    products = category_page.get_products()
+    assert products == [ProductCard("Fiction", "http://shop/fiction", 1024.0, True),
+                        ProductCard("Health Book", "http://shop/health-book", None, False)]
+    assert category_page.get_product_name(1) == "Health Book"
+    assert calls == [("div.item-box", PRODUCT_CARDS_SCRIPT)] * 2
+
+    assert CartRow.from_dom({"item_id": "7", "name": "Smartphone", "url": "", "unit_price": "100.00",
+                             "quantity": "2"}) == CartRow(7, "Smartphone", "", 100.0, 2)
+    assert AddressRecord.from_dom({"address_id": "42", "name": "A B", "email": "", "phone": "", "address1": "",
+                                   "city": "", "country": ""}).address_id == 42
+
+
+def test_page_objects_are_declarative_and_cache_locators(page_config):
+    """TC_PAGES_003: Селекторы объявлены в классе, страницы без __dict__ разделяют настройки и кешируют локаторы."""
+    created = []
+    page = SimpleNamespace(locator=lambda selector: created.append(selector) or SimpleNamespace(selector=selector))
+    home_page, category_page = HomePage(page, page_config), CategoryPage(page, page_config)
+
+    assert HomePage.search_field == home_page.search_field == "#small-searchterms"
+    assert not hasattr(home_page, "__dict__") and home_page.settings is category_page.settings
+    assert home_page.base_url == "http://shop" and home_page.wait_scope == "chromium@shop"
+    assert home_page.locator(home_page.search_field) is home_page.locator(home_page.search_field)
+    assert created == ["#small-searchterms"]
+
+    async_page = AsyncHomePage(page, page_config)
+    assert async_page.logout_link == HomePage.logout_link and not hasattr(async_page, "__dict__")
+    with pytest.raises(AttributeError):
+        async_page.no_such_selector
+
+
+def test_screenshot_waits_for_full_load(page_config, tmp_path, monkeypatch):
+    """TC_PAGES_004: Скриншот снимается после события load и загрузки изображений, а не по готовности страницы."""
+    monkeypatch.setattr("pages.base_page.wait_policy", WaitPolicy())
+    calls = []
+    page = SimpleNamespace(wait_for_load_state=lambda state, timeout=None: calls.append(("load_state", state)),
+                           wait_for_function=lambda script, timeout=None: calls.append(("function", script)),
+                           screenshot=lambda path=None, **options: calls.append(("screenshot", path)))
+    page_config.set("DEFAULT", "actual_screenshot_dir", str(tmp_path))
+    category_page = CategoryPage(page, page_config)
+
+    path = category_page.take_screenshot("category/books.png")
+    assert calls == [("load_state", "load"), ("function", IMAGES_LOADED_SCRIPT), ("screenshot", path)]
@@ -0,0 +1,119 @@
+import asyncio
+import os
+from configparser import ConfigParser
+from types import SimpleNamespace
+import pytest
+from utils.async_runner import AsyncScenarioRunner
+from utils.browser_matrix import MatrixResults, apply_engine, parse_browsers
+from utils.parallel import merge_worker_dirs, merge_worker_logs, worker_dir, worker_log_file
+
+
+def test_worker_paths(monkeypatch):
+    """TC_PARALLEL_001: В воркере xdist лог и директория актуальных скриншотов получают идентификатор воркера."""
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    assert worker_log_file("test.log") == "test.log"
+    assert worker_dir("screenshots/actual/") == "screenshots/actual/"
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    assert worker_log_file("test.log") == "test_gw1.log"
+    assert worker_dir("screenshots/actual/") == os.path.join("screenshots/actual/", ".gw1", "")
+
+
+def test_merge_worker_results(tmp_path):
+    """TC_PARALLEL_002: Логи воркеров объединяются по времени, скриншоты переносятся в общую директорию."""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    (log_dir / "test.log").write_text("2026-01-01 10:00:00,000 - INFO - root - start\n", encoding="utf-8")
+    (log_dir / "test_gw0.log").write_text(
+        "2026-01-01 10:00:02,000 - ERROR - [gw0] root - fail\nTraceback line\n", encoding="utf-8")
+    (log_dir / "test_gw1.log").write_text(
+        "2026-01-01 10:00:01,000 - INFO - [gw1] root - one\n2026-01-01 10:00:03,000 - INFO - [gw1] root - three\n",
+        encoding="utf-8")
+
+    assert merge_worker_logs(str(log_dir), "test.log") == 2
+    lines = (log_dir / "test.log").read_text(encoding="utf-8").splitlines()
+    assert [line.split(" - ")[-1] for line in lines] == ["start", "one", "fail", "Traceback line", "three"]
+    assert sorted(os.listdir(log_dir)) == ["test.log"]
+
+    actual_dir = tmp_path / "actual"
+    (actual_dir / ".gw0" / "login_page").mkdir(parents=True)
+    (actual_dir / ".gw0" / "login_page" / "login_page_success.png").write_bytes(b"png")
+    assert merge_worker_dirs(str(actual_dir)) == 1
+    assert (actual_dir / "login_page" / "login_page_success.png").read_bytes() == b"png"
+    assert not (actual_dir / ".gw0").exists()
+
+
+class FakeAsyncPage:
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+
+class FakeAsyncContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def new_page(self):
+        return FakeAsyncPage()
+
+    async def close(self):
+        self.browser.closed += 1
+
+
+class FakeAsyncBrowser:
+    def __init__(self):
+        self.created = 0
+        self.closed = 0
+
+    async def new_context(self, **options):
+        self.created += 1
+        return FakeAsyncContext(self)
+
+
+def test_async_scenarios_run_concurrently():
+    """TC_PARALLEL_003: Асинхронные сценарии выполняются конкурентно в пределах лимита, каждый в своем контексте."""
+    browser = FakeAsyncBrowser()
+    runner = AsyncScenarioRunner(browser, concurrency=3, timeout=1000)
+
+    async def scenario(page, index):
+        await asyncio.sleep(0.01)
+        if index == 4:
+            raise RuntimeError("fail")
+        return index, page.timeout
+
+    results = asyncio.run(runner.run([lambda page, index=index: scenario(page, index) for index in range(8)]))
+
+    assert results[:4] == [(index, 1000) for index in range(4)]
+    assert isinstance(results[4], RuntimeError)
+    assert results[5:] == [(index, 1000) for index in range(5, 8)]
+    assert runner.peak == 3
+    assert browser.created == browser.closed == 8
+
+
+def test_browser_matrix_settings_and_summary():
+    """TC_PARALLEL_004: Движки матрицы получают свои директории скриншотов, результаты сводятся по тестам."""
+    assert parse_browsers(" firefox, chromium,firefox ") == ["firefox", "chromium"]
+    assert parse_browsers("") == []
+    with pytest.raises(ValueError):
+        parse_browsers("chromium,opera")
+
+    config = ConfigParser()
+    config.read_dict({"DEFAULT": {"browser": "chromium", "screenshot_dir": "screenshots/",
+                                  "actual_screenshot_dir": "screenshots/actual/"}})
+    apply_engine(config, "chromium")
+    assert config.get("DEFAULT", "screenshot_dir") == "screenshots/"
+    apply_engine(config, "webkit")
+    assert config.get("DEFAULT", "browser") == "webkit"
+    assert config.get("DEFAULT", "screenshot_dir") == os.path.join("screenshots/", "webkit", "")
+    assert config.get("DEFAULT", "actual_screenshot_dir") == os.path.join("screenshots/actual/", "webkit", "")
+    assert config.get("DEFAULT", "screenshot_namespace") == "webkit"
+
+    results = MatrixResults(["chromium", "webkit"])
+    for engine, when, outcome in (("chromium", "setup", "passed"), ("chromium", "call", "passed"),
+                                  ("webkit", "setup", "passed"), ("webkit", "call", "failed"),
+                                  ("webkit", "teardown", "passed")):
+        results.pytest_runtest_logreport(SimpleNamespace(when=when, outcome=outcome, user_properties=[
+            ("browser_engine", engine), ("matrix_key", "tests/test_login.py::test_login")]))
+    results.pytest_runtest_logreport(SimpleNamespace(when="call", outcome="passed", user_properties=[]))
+
+    assert results.rows() == [("tests/test_login.py::test_login", ["passed", "failed"])]
+    assert '<td class="failed">failed</td>' in results.html()
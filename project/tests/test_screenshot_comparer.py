@@ -0,0 +1,293 @@
+import io
+import os
+import shutil
+import pytest
+from types import SimpleNamespace
+from configparser import ConfigParser
+from PIL import Image
+from utils.baseline_index import BaselineHashIndex, BaselineRef
+from utils.blob_store import BlobStore
+from utils.capture_profile import capture_options, image_mime_type
+from utils.comparison_engine import TieredComparisonEngine
+from utils.deferred_comparer import DeferredComparisonQueue
+from utils.screenshot_buffer import screenshot_buffer
+from utils.screenshot_comparer import ScreenshotComparer, diff_screenshot_path
+
+
+SCREENSHOT_NAME = "login_page/login_page_success.png"
+
+
+@pytest.fixture
+def screenshot_dirs(tmp_path):
+    """
+    Фикстура с копией эталонного и актуального скриншотов во временной директории.
+    """
+    screenshot_dir = tmp_path / "screenshots"
+    actual_screenshot_dir = screenshot_dir / "actual"
+    for target_dir, source_dir in ((screenshot_dir, "screenshots"), (actual_screenshot_dir, "screenshots/actual")):
+        os.makedirs(target_dir / os.path.dirname(SCREENSHOT_NAME), exist_ok=True)
+        shutil.copyfile(os.path.join(source_dir, SCREENSHOT_NAME), target_dir / SCREENSHOT_NAME)
+    return str(screenshot_dir), str(actual_screenshot_dir)
+
+
+def test_baseline_index_reuses_hash(screenshot_dirs, monkeypatch):
+    """TC_COMPARER_001: Хеш эталона берётся из сохранённого индекса без повторного декодирования."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    index = BaselineHashIndex(screenshot_dir)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, baseline_index=index)
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    index.get_hash(SCREENSHOT_NAME)
+    index.save()
+
+    reloaded = BaselineHashIndex(screenshot_dir)
+    monkeypatch.setattr("utils.baseline_index.Image",
+                        SimpleNamespace(open=lambda *args, **kwargs: pytest.fail("Эталон декодирован повторно")))
+    assert ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, baseline_index=reloaded).compare_screenshots(SCREENSHOT_NAME)
+    assert reloaded.get_hash(SCREENSHOT_NAME) == index.get_hash(SCREENSHOT_NAME)
+
+
+def test_baseline_index_invalidated_on_change(screenshot_dirs):
+    """TC_COMPARER_002: Запись индекса сбрасывается, если файл эталона изменился."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    index = BaselineHashIndex(screenshot_dir)
+    original_hash = index.get_hash(SCREENSHOT_NAME)
+
+    Image.new("RGB", (1280, 720), "black").save(os.path.join(screenshot_dir, SCREENSHOT_NAME))
+    assert index.get_hash(SCREENSHOT_NAME) != original_hash
+
+
+def test_deferred_comparison_reports_mismatch(screenshot_dirs):
+    """TC_COMPARER_003: Отложенное сравнение выполняется в пуле процессов и возвращает несовпадение."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    Image.new("RGB", (1280, 720), "black").save(os.path.join(actual_screenshot_dir, SCREENSHOT_NAME))
+    queue = DeferredComparisonQueue(max_workers=1)
+    try:
+        comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, baseline_index=BaselineHashIndex(screenshot_dir),
+                                      deferred_queue=queue, test_id="test_id")
+        assert comparer.compare_screenshots(SCREENSHOT_NAME)
+
+        failures = queue.resolve("test_id")
+        assert [name for name, message in failures] == [SCREENSHOT_NAME]
+        assert os.path.exists(diff_screenshot_path(os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)))
+        assert queue.resolve("test_id") == []
+    finally:
+        queue.shutdown()
+
+
+def test_in_memory_screenshot_written_only_on_mismatch(screenshot_dirs):
+    """TC_COMPARER_004: Скриншот из памяти сравнивается без записи на диск и сохраняется только при несовпадении."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    with open(actual_path, "rb") as f:
+        matching = f.read()
+    os.remove(actual_path)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, baseline_index=BaselineHashIndex(screenshot_dir))
+
+    screenshot_buffer.put(SCREENSHOT_NAME, matching)
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    assert not os.path.exists(actual_path)
+
+    mismatching = io.BytesIO()
+    Image.new("RGB", (1280, 720), "black").save(mismatching, format="PNG")
+    screenshot_buffer.put(SCREENSHOT_NAME, mismatching.getvalue())
+    assert not comparer.compare_screenshots(SCREENSHOT_NAME)
+    assert os.path.exists(actual_path)
+
+
+def test_tiered_engine_decides_in_cheapest_tier(screenshot_dirs):
+    """TC_COMPARER_005: Идентичный скриншот решается проверкой байтов, почти идентичный — хешами."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    engine = TieredComparisonEngine(threshold=5, ambiguous_band=2)
+    baseline = BaselineRef(os.path.join(screenshot_dir, SCREENSHOT_NAME))
+
+    exact = engine.compare(os.path.join(screenshot_dir, SCREENSHOT_NAME), baseline)
+    assert exact.passed and exact.tier == "exact"
+
+    similar = engine.compare(os.path.join(actual_screenshot_dir, SCREENSHOT_NAME), baseline)
+    assert similar.passed and similar.tier == "average_hash"
+    assert set(similar.timings) == {"exact", "average_hash"}
+
+
+def test_tiered_engine_escalates_ambiguous_distance(screenshot_dirs):
+    """TC_COMPARER_006: Расстояние в неоднозначной полосе передаётся на более точные уровни."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    engine = TieredComparisonEngine(threshold=1, ambiguous_band=2)
+    baseline = BaselineRef(os.path.join(screenshot_dir, SCREENSHOT_NAME))
+
+    result = engine.compare(os.path.join(actual_screenshot_dir, SCREENSHOT_NAME), baseline)
+    assert result.tier == "ssim"
+    assert result.passed
+
+
+def test_tiles_ignore_masks_and_report_offending_tile(screenshot_dirs):
+    """TC_COMPARER_007: Изменение под маской не влияет на сравнение, изменение вне маски локализуется плиткой."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    engine = TieredComparisonEngine(threshold=5, ambiguous_band=2, tile_grid=(4, 4), tile_threshold=10)
+    baseline = BaselineRef(os.path.join(screenshot_dir, SCREENSHOT_NAME))
+    masks = ((660, 55, 450, 40),)
+
+    def changed(x, y, width, height):
+        image = Image.open(os.path.join(screenshot_dir, SCREENSHOT_NAME)).convert("RGB")
+        image.paste((0, 0, 0), (x, y, x + width, y + height))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    masked = engine.compare(changed(660, 55, 450, 40), baseline, masks)
+    assert masked.passed and masked.tier == "tiles"
+
+    unmasked = engine.compare(changed(40, 560, 200, 120), baseline, masks)
+    assert not unmasked.passed
+    assert [(row, col) for row, col, _, _ in unmasked.tiles] == [(3, 0)]
+    assert "плитки: [3,0]" in unmasked.describe()
+
+
+def test_diff_image_written_only_on_mismatch(screenshot_dirs):
+    """TC_COMPARER_008: Изображение различий и области изменений строятся только при несовпадении."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    diff_path = diff_screenshot_path(actual_path)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, masks={})
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    assert not os.path.exists(diff_path)
+
+    image = Image.open(os.path.join(screenshot_dir, SCREENSHOT_NAME)).convert("RGB")
+    image.paste((0, 0, 0), (40, 560, 240, 680))
+    image.save(actual_path)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, tile_grid=(4, 4), tile_threshold=10, masks={})
+    assert not comparer.compare_screenshots(SCREENSHOT_NAME)
+    assert os.path.exists(diff_path)
+    assert any(x <= 40 and y <= 560 and x + width >= 240 and y + height >= 680
+               for x, y, width, height in comparer.last_regions)
+
+
+def test_blob_store_deduplicates_screenshots(screenshot_dirs, tmp_path):
+    """TC_COMPARER_009: Одинаковые скриншоты хранятся одним блобом, эталон обновляется без перекодирования."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    store = BlobStore(str(tmp_path / "store"))
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    with open(actual_path, "rb") as f:
+        data = f.read()
+    os.remove(actual_path)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, keep_actual=True, blob_store=store)
+
+    for _ in range(2):
+        screenshot_buffer.put(SCREENSHOT_NAME, data)
+        assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    digest = store.manifest("actual")[SCREENSHOT_NAME]
+    assert os.path.samefile(actual_path, store.blob_path(digest))
+    assert sum(len(files) for _, _, files in os.walk(store.objects_dir)) == 1
+
+    comparer.update_snapshots = True
+    screenshot_buffer.put(SCREENSHOT_NAME, data)
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    expected_path = os.path.join(screenshot_dir, SCREENSHOT_NAME)
+    assert os.path.samefile(expected_path, actual_path)
+    assert not store.changed("baseline", SCREENSHOT_NAME, digest)
+
+    store.put(b"unused")
+    store.save()
+    assert BlobStore(store.root).prune() == 1
+
+
+def test_fast_capture_profile(screenshot_dirs):
+    """TC_COMPARER_010: Профиль fast снимает JPEG без анимаций, и такой скриншот проходит сравнение с PNG-эталоном."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    config = ConfigParser()
+    config.read("config/config.ini")
+    options = capture_options(config, "fast")
+    assert options["type"] == "jpeg" and options["animations"] == "disabled" and "clip" not in options
+    assert capture_options(config, "default") == {}
+
+    actual_jpeg = io.BytesIO()
+    Image.open(os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)).convert("RGB").save(
+        actual_jpeg, format="JPEG", quality=options["quality"])
+    assert image_mime_type(actual_jpeg.getvalue()) == "image/jpeg"
+    screenshot_buffer.put(SCREENSHOT_NAME, actual_jpeg.getvalue())
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, ambiguous_band=2, tile_grid=(4, 4),
+                                  tile_threshold=10)
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+
+
+def test_update_snapshots_copies_only_changed_baselines(screenshot_dirs, monkeypatch):
+    """TC_COMPARER_011: --update-snapshots копирует байты без декодирования и перезаписывает только измененные эталоны."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    expected_path = os.path.join(screenshot_dir, SCREENSHOT_NAME)
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    snapshot_updates = {}
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, update_snapshots=True,
+                                  baseline_index=BaselineHashIndex(screenshot_dir), snapshot_updates=snapshot_updates)
+    monkeypatch.setattr("utils.screenshot_comparer.Image",
+                        SimpleNamespace(open=lambda *args, **kwargs: pytest.fail("Скриншот декодирован")))
+
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    with open(expected_path, "rb") as expected, open(actual_path, "rb") as actual:
+        assert expected.read() == actual.read()
+    modified = os.stat(expected_path).st_mtime_ns
+
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    assert os.stat(expected_path).st_mtime_ns == modified
+
+    shutil.copyfile(actual_path, os.path.join(actual_screenshot_dir, "login_page", "new.png"))
+    assert comparer.compare_screenshots("login_page/new.png")
+    assert snapshot_updates == {"changed": [SCREENSHOT_NAME], "unchanged": [SCREENSHOT_NAME],
+                                "added": ["login_page/new.png"]}
+    assert not [name for name in os.listdir(os.path.dirname(expected_path)) if name.endswith(".tmp")]
+
+
+def test_blob_store_reuses_engine_digest(screenshot_dirs, tmp_path, monkeypatch):
+    """TC_COMPARER_012: Скриншот с диска переносится в хранилище по sha256 из движка без повторного хеширования."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    store = BlobStore(str(tmp_path / "store"))
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, blob_store=store)
+    monkeypatch.setattr("utils.blob_store.hashlib",
+                        SimpleNamespace(sha256=lambda *args: pytest.fail("Скриншот хеширован повторно")))
+
+    assert comparer.compare_screenshots(SCREENSHOT_NAME)
+    digest = store.manifest("actual")[SCREENSHOT_NAME]
+    assert os.path.samefile(actual_path, store.blob_path(digest))
+
+
+def test_lossy_actual_stored_as_png(screenshot_dirs, tmp_path):
+    """TC_COMPARER_013: JPEG профиля с потерями сохраняется по пути .png и в хранилище перекодированным в PNG."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    actual_path = os.path.join(actual_screenshot_dir, SCREENSHOT_NAME)
+    actual_jpeg = io.BytesIO()
+    Image.open(actual_path).convert("RGB").save(actual_jpeg, format="JPEG", quality=80)
+    store = BlobStore(str(tmp_path / "store"))
+    comparer = ScreenshotComparer(screenshot_dir, actual_screenshot_dir, 5, keep_actual=True, blob_store=store)
+
+    for storage in ("disk", "memory"):
+        os.remove(actual_path)
+        if storage == "disk":
+            with open(actual_path, "wb") as f:
+                f.write(actual_jpeg.getvalue())
+        else:
+            screenshot_buffer.put(SCREENSHOT_NAME, actual_jpeg.getvalue())
+        comparer.compare_screenshots(SCREENSHOT_NAME)
+        with open(actual_path, "rb") as f:
+            assert image_mime_type(f.read()) == "image/png"
+        with open(store.blob_path(store.manifest("actual")[SCREENSHOT_NAME]), "rb") as f:
+            assert image_mime_type(f.read()) == "image/png"
+
+
+def test_masks_keep_whole_image_rule(screenshot_dirs):
+    """TC_COMPARER_014: Без сетки плиток маски закрашиваются, а решение принимается по порогу изображения целиком."""
+    screenshot_dir, actual_screenshot_dir = screenshot_dirs
+    engine = TieredComparisonEngine(threshold=5, ambiguous_band=2)
+    baseline = BaselineRef(os.path.join(screenshot_dir, SCREENSHOT_NAME))
+    masks = ((660, 55, 450, 40),)
+
+    def changed(x, y, width, height):
+        image = Image.open(os.path.join(screenshot_dir, SCREENSHOT_NAME)).convert("RGB")
+        image.paste((255, 0, 0), (x, y, x + width, y + height))
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    masked = engine.compare(changed(660, 55, 450, 40), baseline, masks)
+    assert masked.passed and masked.tier == "average_hash" and masked.distance == 0
+
+    unmasked = engine.compare(changed(0, 240, 1280, 360), baseline, masks)
+    assert not unmasked.passed and unmasked.tier != "tiles" and not unmasked.tiles
@@ -0,0 +1,35 @@
+import dataclasses
+import pytest
+from utils.browser_matrix import apply_engine
+from utils.parallel import worker_dir
+from utils.settings import load_settings, parse_override
+
+
+def test_settings_are_typed_and_overridable(monkeypatch):
+    """TC_SETTINGS_001: Настройки разбираются один раз на процесс, переопределяются окружением и командной строкой."""
+    settings = load_settings()
+    assert settings is load_settings()
+    assert isinstance(settings.timeout, int) and isinstance(settings.headless, bool)
+    assert settings.actual_screenshot_dir == settings.actual_screenshot_dir.strip()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        settings.timeout = 1
+
+    environ = {"AUTOTESTS_TIMEOUT": "5000", "AUTOTESTS_BROWSERS": "webkit,chromium"}
+    overridden = load_settings(overrides=[("timeout", "7000")], environ=environ)
+    assert overridden.timeout == 7000 and overridden.browsers == ("webkit", "chromium")
+    assert overridden.config_parser().get("DEFAULT", "timeout") == "7000" and settings.timeout != 7000
+    overridden.config_parser().set("DEFAULT", "timeout", "1")
+    assert overridden.config_parser().get("DEFAULT", "timeout") == "7000"
+    assert load_settings(overrides=[("tile_threshold", "")]).tile_threshold == settings.threshold
+    for override in (("timeout", "soon"), ("timeout", ""), ("browser", "opera"), ("no_such_setting", "1")):
+        with pytest.raises(ValueError):
+            load_settings(overrides=[override])
+    with pytest.raises(ValueError):
+        parse_override("timeout")
+
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    worker = settings.for_worker()
+    assert worker.actual_screenshot_dir == worker_dir(settings.actual_screenshot_dir)
+    webkit = worker.derive(apply_engine, "webkit")
+    assert webkit.browser == "webkit" and webkit.screenshot_namespace == "webkit"
+    assert settings.browser == settings.config_parser().get("DEFAULT", "browser") != "webkit"
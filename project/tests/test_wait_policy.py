@@ -0,0 +1,37 @@
+import json
+import os
+import pytest
+from utils.wait_policy import WaitPolicy
+
+
+def test_wait_policy_adapts_to_history(tmp_path):
+    """TC_WAIT_001: Таймаут ожидания выводится из перцентиля истории, история дописывается процессами в общий файл."""
+    history_file = str(tmp_path / "wait_history.json")
+    policy = WaitPolicy(history_file, percent=95, multiplier=3, floor=2000, ceiling=30000, min_samples=5)
+    assert policy.timeout("chromium@shop", "click", "#button") == 30000
+    assert policy.timeout("chromium@shop", "click", "#button", fallback=5000) == 5000
+    assert policy.timeout("chromium@shop", "click", "#button", fallback=60000) == 30000
+
+    for elapsed in (100, 120, 110, 150, 900):
+        policy.record("chromium@shop", "click", "#button", elapsed)
+    assert policy.timeout("chromium@shop", "click", "#button") == 2700
+    for elapsed in (10, 12, 11, 15, 20):
+        policy.record("chromium@shop", "fill", "#field", elapsed)
+    assert policy.timeout("chromium@shop", "fill", "#field") == 2000
+    assert policy.timeout("chromium@shop", "fill", "#field", fallback=5000) == 2000
+    assert policy.timeout("firefox@shop", "click", "#button") == 30000
+
+    with pytest.raises(RuntimeError):
+        with policy.measure("chromium@shop", "goto", "/"):
+            raise RuntimeError("navigation failed")
+    with policy.measure("chromium@shop", "goto", "/") as timeout:
+        assert timeout == 30000
+    policy.save()
+
+    other = WaitPolicy(history_file)
+    other.record("chromium@shop", "goto", "/", 50)
+    other.save()
+    with open(history_file, encoding="utf-8") as f:
+        history = json.load(f)
+    assert len(history["chromium@shop click #button"]) == 5 and len(history["chromium@shop goto /"]) == 2
+    assert not os.path.exists(f"{history_file}.lock")
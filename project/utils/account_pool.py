@@ -0,0 +1,145 @@
+import json
+import os
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.file_lock import FileLock
+from utils.logger import logger
+
+
+class AccountPool:
+    """
+    Пул заранее зарегистрированных тестовых аккаунтов.
+
+    Аккаунты хранятся в JSON-файле и выдаются тестам в исключительную аренду.
+    Все изменения файла выполняются под межпроцессной блокировкой, поэтому пул
+    безопасно использовать из нескольких воркеров. Блокировка удерживается только
+    на чтение и запись файла, регистрация по сети выполняется без нее. fill(size)
+    регистрирует недостающие аккаунты параллельно; после теста аккаунт очищается
+    и возвращается в пул либо списывается, если очистить его не удалось.
+    """
+    def __init__(self, path, create_accounts, lease_timeout=3600):
+        self.path = path
+        self.create_accounts = create_accounts
+        self.lease_timeout = lease_timeout
+        self.lock = FileLock(f"{path}.lock")
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+
+    def _load(self):
+        """
+        Загружает аккаунты из файла пула.
+        """
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as pool_file:
+                return json.load(pool_file)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Не удалось прочитать пул аккаунтов {self.path}: {e}")
+            return []
+
+    def _save(self, accounts):
+        """
+        Атомарно сохраняет аккаунты в файл пула.
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as pool_file:
+            json.dump(accounts, pool_file, indent=1)
+        os.replace(tmp_path, self.path)
+
+    def _expire_leases(self, accounts):
+        """
+        Списывает аккаунты, аренда которых не вернулась за lease_timeout (воркер упал),
+        и снимает брони регистрации, не завершенные за то же время.
+        """
+        now = time.time()
+        for account in accounts:
+            if account["state"] == "leased" and now - account["leased_at"] > self.lease_timeout:
+                logger.warning(f"Аренда аккаунта просрочена, аккаунт списан: {account['email']}")
+                account["state"] = "retired"
+        accounts[:] = [account for account in accounts
+                       if account["state"] != "registering" or now - account["started_at"] <= self.lease_timeout]
+
+    def fill(self, size):
+        """
+        Дополняет пул до size свободных аккаунтов, регистрируя недостающие параллельно.
+        Недостающие аккаунты бронируются под блокировкой записью registering, регистрация идет
+        без блокировки, затем бронь заменяется аккаунтами. Бронь учитывается другими воркерами,
+        поэтому они не регистрируют лишние аккаунты и не ждут чужую регистрацию на блокировке.
+        """
+        reservation = uuid.uuid4().hex
+        with self.lock:
+            accounts = self._load()
+            self._expire_leases(accounts)
+            missing = size - sum(account["state"] == "free" for account in accounts) - sum(
+                account["count"] for account in accounts if account["state"] == "registering")
+            if missing > 0:
+                accounts.append({"state": "registering", "reservation": reservation, "count": missing,
+                                 "owner": self.owner, "started_at": time.time()})
+            self._save(accounts)
+        if missing <= 0:
+            return
+
+        logger.info(f"Регистрация аккаунтов для пула: {missing}")
+        created = []
+        try:
+            created = self.create_accounts(missing)
+        finally:
+            with self.lock:
+                accounts = [account for account in self._load() if account.get("reservation") != reservation]
+                accounts.extend({"email": email, "password": password, "state": "free", "uses": 0}
+                                for email, password in created)
+                self._save(accounts)
+
+    def lease(self):
+        """
+        Выдает свободный аккаунт в исключительную аренду. Если свободных нет, регистрирует новый.
+        Возвращает (email, password).
+        """
+        with self.lock:
+            accounts = self._load()
+            self._expire_leases(accounts)
+            account = next((account for account in accounts if account["state"] == "free"), None)
+            if account is not None:
+                account.update(state="leased", owner=self.owner, leased_at=time.time())
+                self._save(accounts)
+                return account["email"], account["password"]
+
+        email, password = self.create_accounts(1)[0]
+        with self.lock:
+            accounts = self._load()
+            accounts.append({"email": email, "password": password, "state": "leased", "uses": 0,
+                             "owner": self.owner, "leased_at": time.time()})
+            self._save(accounts)
+        return email, password
+
+    def release(self, email, clean):
+        """
+        Возвращает аккаунт в пул после теста или списывает его, если он остался грязным.
+        """
+        with self.lock:
+            accounts = self._load()
+            for account in accounts:
+                if account.get("email") == email:
+                    account["uses"] += 1
+                    account["state"] = "free" if clean else "retired"
+                    account.pop("owner", None)
+                    account.pop("leased_at", None)
+                    if not clean:
+                        logger.info(f"Аккаунт списан из пула: {email}")
+            self._save(accounts)
+
+
+def create_accounts_concurrently(count, register_batch, workers=4):
+    """
+    Регистрирует count аккаунтов в workers потоках. register_batch(n) выполняется в потоке,
+    запускает в нем свой экземпляр sync_playwright и возвращает список (email, password).
+    Потоки используются и для одного аккаунта: в основном потоке sync_playwright уже запущен.
+    """
+    workers = max(1, min(workers, count))
+    batches = [count // workers + (1 if index < count % workers else 0) for index in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [account for batch in executor.map(register_batch, batches) for account in batch]
@@ -0,0 +1,116 @@
+import html
+import re
+from urllib.parse import urlencode
+
+from utils.logger import logger
+
+
+class AccountProvisioner:
+    """
+    Регистрация, вход и очистка тестовых аккаунтов HTTP-запросами без заполнения форм в браузере.
+
+    Форма регистрации отправляется через APIRequestContext контекста браузера
+    (page.context.request): он использует общее с контекстом хранилище cookies,
+    поэтому cookie анти-подделки из GET-запроса уходит вместе с POST, а cookie
+    сессии после регистрации сразу доступны странице.
+    """
+    REGISTER_PATH = "register"
+    LOGIN_PATH = "login"
+    TOKEN_PATTERN = re.compile(r'name="__RequestVerificationToken"[^>]*value="([^"]*)"')
+    ERROR_PATTERN = re.compile(r'<div class="validation-summary-errors">(.*?)</div>', re.S)
+    CART_ITEM_PATTERN = re.compile(r'name="removefromcart"[^>]*value="(\d+)"')
+    ADDRESS_PATTERN = re.compile(r"customer/addressdelete/(\d+)")
+    ORDER_PATTERN = re.compile(r'class="[^"]*order-item')
+    GENDERS = {"male": "M", "female": "F"}
+
+    def __init__(self, request_context, base_url):
+        self.request = request_context
+        self.base_url = base_url.rstrip("/")
+        self.register_url = f"{self.base_url}/{self.REGISTER_PATH}"
+
+    def _get(self, url):
+        """
+        Выполняет GET-запрос и возвращает HTML страницы.
+        """
+        response = self.request.get(url)
+        if not response.ok:
+            raise RuntimeError(f"Страница недоступна: {response.status} {url}")
+        return response.text()
+
+    def _token(self, url=None):
+        """
+        Загружает форму и возвращает токен анти-подделки, если форма его содержит.
+        """
+        match = self.TOKEN_PATTERN.search(self._get(url or self.register_url))
+        return html.unescape(match.group(1)) if match else None
+
+    def register(self, gender, first_name, last_name, email, password):
+        """
+        Регистрирует пользователя. Вызывает RuntimeError, если сервер не подтвердил регистрацию.
+        """
+        form = {
+            "Gender": self.GENDERS.get(gender, ""),
+            "FirstName": first_name,
+            "LastName": last_name,
+            "Email": email,
+            "Password": password,
+            "ConfirmPassword": password,
+            "register-button": "Register",
+        }
+        token = self._token()
+        if token is not None:
+            form["__RequestVerificationToken"] = token
+
+        response = self.request.post(self.register_url, form=form)
+        if "registerresult" in response.url.lower():
+            logger.info(f"Пользователь зарегистрирован через HTTP: {email}")
+            return
+        errors = self.ERROR_PATTERN.search(response.text())
+        details = re.sub(r"<[^>]+>", " ", errors.group(1)).split() if errors else [f"HTTP {response.status}"]
+        raise RuntimeError(f"Ошибка регистрации через HTTP: {' '.join(details)}")
+
+    def login(self, email, password):
+        """
+        Выполняет вход пользователя отправкой формы входа.
+        """
+        login_url = f"{self.base_url}/{self.LOGIN_PATH}"
+        form = {"Email": email, "Password": password, "RememberMe": "false"}
+        token = self._token(login_url)
+        if token is not None:
+            form["__RequestVerificationToken"] = token
+        response = self.request.post(login_url, form=form)
+        if not response.ok or f"/{self.LOGIN_PATH}" in response.url.lower():
+            raise RuntimeError(f"Ошибка входа через HTTP: {email}")
+        logger.info(f"Вход выполнен через HTTP: {email}")
+
+    def _clear_items(self, path):
+        """
+        Удаляет все позиции корзины или списка желаний отправкой формы обновления.
+        """
+        url = f"{self.base_url}/{path}"
+        item_ids = self.CART_ITEM_PATTERN.findall(self._get(url))
+        if not item_ids:
+            return
+        fields = [("removefromcart", item_id) for item_id in item_ids] + [("updatecart", "Update")]
+        self.request.post(url, data=urlencode(fields),
+                          headers={"Content-Type": "application/x-www-form-urlencoded"})
+
+    def reset(self):
+        """
+        Очищает корзину, список желаний и адреса текущего пользователя.
+        Возвращает True, если после очистки аккаунт чист и у него нет заказов.
+        """
+        try:
+            self._clear_items("cart")
+            self._clear_items("wishlist")
+            addresses_url = f"{self.base_url}/customer/addresses"
+            for address_id in set(self.ADDRESS_PATTERN.findall(self._get(addresses_url))):
+                self.request.get(f"{self.base_url}/customer/addressdelete/{address_id}")
+
+            return not (self.CART_ITEM_PATTERN.search(self._get(f"{self.base_url}/cart"))
+                        or self.CART_ITEM_PATTERN.search(self._get(f"{self.base_url}/wishlist"))
+                        or self.ADDRESS_PATTERN.search(self._get(addresses_url))
+                        or self.ORDER_PATTERN.search(self._get(f"{self.base_url}/customer/orders")))
+        except Exception as e:
+            logger.warning(f"Не удалось очистить аккаунт: {e}")
+            return False
@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+import re
+import time
+from urllib.parse import urlsplit
+
+from utils.logger import logger
+
+ASSET_TYPES = ("stylesheet", "script", "font", "image")
+# URL стилей, скриптов, изображений и шрифтов: только они перехватываются обработчиком кеша
+ASSET_URL_PATTERN = re.compile(r"^[^?#]*\.(?:css|js|png|jpe?g|gif|svg|webp|ico|bmp|woff2?|ttf|otf|eot)(?:[?#].*)?$",
+                               re.IGNORECASE)
+# Заголовки описывают передачу исходного ответа и неверны для тела, отдаваемого из кеша
+SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+
+def parse_hosts(value):
+    """
+    Разбирает список хостов через запятую.
+    """
+    return [host.strip().lower() for host in (value or "").split(",") if host.strip()]
+
+
+def host_pattern(hosts):
+    """
+    Возвращает регулярное выражение URL хостов hosts и их поддоменов.
+    """
+    names = "|".join(re.escape(host) for host in hosts)
+    return re.compile(rf"^[a-z][a-z0-9+.-]*://(?:[^/?#]*\.)?(?:{names})(?::\d+)?(?:[/?#]|$)", re.IGNORECASE)
+
+
+def empty_stats():
+    """
+    Возвращает нулевые счетчики кеша статических ресурсов.
+    """
+    return {"hits": 0, "misses": 0, "blocked": 0, "bytes_from_cache": 0, "bytes_from_network": 0}
+
+
+class AssetCache:
+    """
+    Маршрутизация запросов контекста браузера через локальный кеш статических ресурсов.
+
+    Обработчик page.route ставится на контекст только для URL статических ресурсов и
+    заблокированных хостов: документы и XHR идут в браузер без перехвата. GET-запросы стилей,
+    скриптов, шрифтов и изображений при первом обращении загружаются из сети и сохраняются на диск
+    (<cache_dir>/<sha256[:2]>/<sha256>.json и .bin), последующие отдаются из кеша без сети.
+    Запросы к заблокированным хостам (аналитика, сторонние счетчики) и их поддоменам
+    отклоняются. Остальные перехваченные запросы передаются дальше без изменений. Записи старше
+    max_age секунд загружаются заново. Счетчики stats можно передать общими для нескольких кешей процесса.
+    """
+    def __init__(self, cache_dir, blocked_hosts=(), max_age=86400, asset_types=ASSET_TYPES, stats=None):
+        self.cache_dir = cache_dir
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.max_age = max_age
+        self.asset_types = tuple(asset_types)
+        self.stats = empty_stats() if stats is None else stats
+
+    def _entry_path(self, url):
+        """
+        Возвращает путь к записи кеша для URL без расширения.
+        """
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], digest)
+
+    def _is_blocked(self, url):
+        """
+        Проверяет, относится ли URL к заблокированному хосту или его поддомену.
+        """
+        host = (urlsplit(url).hostname or "").lower()
+        return any(host == blocked or host.endswith(f".{blocked}") for blocked in self.blocked_hosts)
+
+    def _load(self, url):
+        """
+        Возвращает (метаданные, тело) свежей записи кеша или None.
+        """
+        entry_path = self._entry_path(url)
+        try:
+            with open(f"{entry_path}.json", "r", encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+            if time.time() - meta["stored_at"] > self.max_age:
+                return None
+            with open(f"{entry_path}.bin", "rb") as body_file:
+                return meta, body_file.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _store(self, url, status, headers, body):
+        """
+        Атомарно сохраняет ответ в кеш: сначала тело, затем метаданные, по которым запись читается.
+        """
+        entry_path = self._entry_path(url)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        meta = {"url": url, "status": status, "stored_at": time.time(),
+                "headers": {name: value for name, value in headers.items() if name.lower() not in SKIPPED_HEADERS}}
+        for extension, data, mode in ((".bin", body, "wb"), (".json", json.dumps(meta), "w")):
+            tmp_path = f"{entry_path}{extension}.{os.getpid()}.tmp"
+            with open(tmp_path, mode) as entry_file:
+                entry_file.write(data)
+            os.replace(tmp_path, f"{entry_path}{extension}")
+
+    def handle(self, route, request):
+        """
+        Обработчик page.route: блокирует, отдает из кеша или загружает и кеширует запрос.
+        """
+        url = request.url
+        if self._is_blocked(url):
+            self.stats["blocked"] += 1
+            route.abort("blockedbyclient")
+            return
+        if request.method != "GET" or request.resource_type not in self.asset_types:
+            route.fallback()
+            return
+
+        cached = self._load(url)
+        if cached is not None:
+            meta, body = cached
+            self.stats["hits"] += 1
+            self.stats["bytes_from_cache"] += len(body)
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        response = route.fetch()
+        body = response.body()
+        self.stats["misses"] += 1
+        self.stats["bytes_from_network"] += len(body)
+        if response.ok:
+            try:
+                self._store(url, response.status, response.headers, body)
+            except OSError as e:
+                logger.warning(f"Не удалось сохранить ресурс в кеш {url}: {e}")
+        route.fulfill(response=response, body=body)
+
+    def install(self, context):
+        """
+        Устанавливает обработчик на запросы статических ресурсов и заблокированных хостов контекста.
+        Остальные запросы Playwright не передает в Python.
+        """
+        if self.asset_types:
+            context.route(ASSET_URL_PATTERN, self.handle)
+        if self.blocked_hosts:
+            context.route(host_pattern(self.blocked_hosts), self.handle)
+
+
+def cache_summary(stats):
+    """
+    Возвращает строку отчета о кеше статических ресурсов по счетчикам stats.
+    """
+    total = stats["hits"] + stats["misses"]
+    rate = stats["hits"] / total * 100 if total else 0.0
+    return (f"попаданий {stats['hits']} из {total} ({rate:.1f}%), заблокировано запросов {stats['blocked']}, "
+            f"из кеша {stats['bytes_from_cache'] // 1024} КБ, из сети {stats['bytes_from_network'] // 1024} КБ")
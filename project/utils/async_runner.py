@@ -0,0 +1,52 @@
+import asyncio
+
+from utils.logger import logger
+
+
+class AsyncScenarioRunner:
+    """
+    Запуск независимых асинхронных сценариев на одном цикле событий.
+
+    Сценарий — корутинная функция scenario(page), работающая с асинхронными
+    страницами из pages/async_pages. Каждый сценарий получает свой контекст
+    браузера, поэтому cookies и хранилища сценариев не пересекаются. Одновременно
+    выполняется не больше concurrency сценариев: один процесс и один браузер
+    обслуживают десятки потоков действий без процесса на каждый поток.
+    """
+    def __init__(self, browser, concurrency=8, context_options=None, timeout=None):
+        self.browser = browser
+        self.concurrency = concurrency
+        self.context_options = context_options or {}
+        self.timeout = timeout
+        self.active = 0
+        self.peak = 0
+
+    async def _run(self, scenario, semaphore):
+        """
+        Выполняет сценарий в новом контексте браузера и закрывает контекст после него.
+        """
+        async with semaphore:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            context = await self.browser.new_context(**self.context_options)
+            try:
+                page = await context.new_page()
+                if self.timeout is not None:
+                    page.set_default_timeout(self.timeout)
+                return await scenario(page)
+            finally:
+                self.active -= 1
+                await context.close()
+
+    async def run(self, scenarios):
+        """
+        Выполняет сценарии конкурентно и возвращает их результаты в исходном порядке.
+        Исключение сценария не прерывает остальные: оно возвращается на месте результата.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(*(self._run(scenario, semaphore) for scenario in scenarios),
+                                       return_exceptions=True)
+        failed = sum(isinstance(result, BaseException) for result in results)
+        logger.info(f"Выполнено асинхронных сценариев: {len(results)}, с ошибкой: {failed}, "
+                    f"одновременно не более: {self.peak}")
+        return results
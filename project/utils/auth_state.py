@@ -0,0 +1,83 @@
+import time
+
+from utils.logger import logger
+
+
+class AuthStateCache:
+    """
+    Кеш состояния авторизации (storage_state) на сессию тестов.
+
+    Вход через интерфейс выполняется один раз: login(page) логинит пользователя на
+    переданной странице, после чего cookies и localStorage контекста сохраняются и
+    подставляются в контексты следующих тестов. Кеш живет в процессе, поэтому при
+    параллельном запуске каждый воркер логинится один раз.
+    """
+    def __init__(self, login):
+        self.login = login
+        self.state = None
+        self.logins = 0
+
+    def _expired(self):
+        """
+        Проверяет, истек ли срок действия сохраненных cookies.
+        """
+        now = time.time()
+        return any(0 < cookie.get("expires", -1) < now for cookie in self.state["cookies"])
+
+    def apply(self, context):
+        """
+        Подставляет сохраненные cookies в контекст. Возвращает False, если состояния нет или оно истекло.
+        """
+        if self.state is None:
+            return False
+        if self._expired():
+            logger.info("Сохраненная сессия истекла")
+            self.state = None
+            return False
+        context.add_cookies(self.state["cookies"])
+        return True
+
+    def restore_storage(self, page):
+        """
+        Восстанавливает localStorage для текущего origin страницы.
+        """
+        if self.state is None:
+            return
+        for origin in self.state.get("origins", []):
+            if page.url.startswith(origin["origin"]) and origin.get("localStorage"):
+                page.evaluate("items => items.forEach(item => localStorage.setItem(item.name, item.value))",
+                              origin["localStorage"])
+
+    def capture(self, page):
+        """
+        Выполняет вход через интерфейс на странице и сохраняет состояние ее контекста.
+        """
+        self.login(page)
+        self.logins += 1
+        self.state = page.context.storage_state()
+        logger.info("Состояние авторизации сохранено для сессии")
+
+    def invalidate(self):
+        """
+        Сбрасывает сохраненное состояние, например, если сервер отклонил cookie.
+        """
+        self.state = None
+
+    def ensure_logged_in(self, page, home_page):
+        """
+        Авторизует страницу: подставляет сохраненную сессию и проверяет ее на главной странице.
+        Если состояния нет или сервер отклонил сессию, состояние сбрасывается, cookies контекста
+        очищаются и выполняется вход через интерфейс с сохранением нового состояния.
+        home_page — страница с методами goto() и is_logged_in().
+        """
+        if self.apply(page.context):
+            home_page.goto()
+            self.restore_storage(page)
+            if home_page.is_logged_in():
+                logger.info("Вход выполнен по сохраненной сессии")
+                return
+            logger.warning("Сохраненная сессия отклонена сервером, выполняется вход через интерфейс")
+            self.invalidate()
+            page.context.clear_cookies()
+
+        self.capture(page)
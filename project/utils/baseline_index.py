@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+
+import imagehash
+from PIL import Image
+
+from utils.file_lock import FileLock
+from utils.logger import logger
+
+
+def file_digest(path):
+    """
+    Возвращает sha256 содержимого файла.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class BaselineHashIndex:
+    """
+    Манифест хешей эталонных скриншотов, сохраняемый на диске.
+
+    Запись манифеста привязана к имени скриншота и отпечатку содержимого файла
+    (размер, mtime и sha256), поэтому эталон декодируется только при первом
+    обращении или после изменения файла.
+    """
+    VERSION = 2
+
+    def __init__(self, screenshot_dir, index_file=".baseline_index.json"):
+        self.screenshot_dir = screenshot_dir
+        self.index_path = os.path.join(screenshot_dir, index_file)
+        self.entries = self._load()
+        self.dirty = False
+
+    def _load(self):
+        """
+        Загружает манифест с диска. Повреждённый или устаревший манифест игнорируется.
+        """
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as index_file:
+                data = json.load(index_file)
+            if data.get("version") != self.VERSION:
+                logger.info(f"Версия индекса эталонов устарела, индекс будет перестроен: {self.index_path}")
+                return {}
+            return data.get("entries", {})
+        except (OSError, ValueError) as e:
+            logger.warning(f"Не удалось прочитать индекс эталонов {self.index_path}: {e}")
+            return {}
+
+    def _entry(self, screenshot_name):
+        """
+        Возвращает актуальную запись манифеста для эталона, сбрасывая хеши, если файл изменился.
+        """
+        path = os.path.join(self.screenshot_dir, screenshot_name)
+        stat = os.stat(path)
+        entry = self.entries.get(screenshot_name)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry
+
+        digest = file_digest(path)
+        if entry is None or entry["sha256"] != digest:
+            entry = {"sha256": digest, "hashes": {}}
+        entry["size"] = stat.st_size
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self.entries[screenshot_name] = entry
+        self.dirty = True
+        return entry
+
+    def get_value(self, screenshot_name, key, compute):
+        """
+        Возвращает строковое значение эталона по ключу. compute(image) вызывается только при отсутствии значения в манифесте.
+        """
+        entry = self._entry(screenshot_name)
+        value = entry["hashes"].get(key)
+        if value is None:
+            path = os.path.join(self.screenshot_dir, screenshot_name)
+            with Image.open(path) as image:
+                value = str(compute(image))
+            entry["hashes"][key] = value
+            self.dirty = True
+        return value
+
+    def get_hash(self, screenshot_name, algorithm="average_hash"):
+        """
+        Возвращает хеш эталонного скриншота, вычисляя его только при отсутствии в манифесте.
+        """
+        return imagehash.hex_to_hash(self.get_value(screenshot_name, algorithm, getattr(imagehash, algorithm)))
+
+    def digest(self, screenshot_name):
+        """
+        Возвращает sha256 содержимого эталона.
+        """
+        return self._entry(screenshot_name)["sha256"]
+
+    def baseline(self, screenshot_name):
+        """
+        Возвращает ссылку на эталон, хеши которой берутся из манифеста.
+        """
+        return BaselineRef(os.path.join(self.screenshot_dir, screenshot_name), screenshot_name, self)
+
+    def update(self, screenshot_name, hashes=None):
+        """
+        Обновляет запись после перезаписи эталона, сохраняя уже известные хеши нового содержимого.
+        """
+        self.entries.pop(screenshot_name, None)
+        entry = self._entry(screenshot_name)
+        for algorithm, value in (hashes or {}).items():
+            entry["hashes"][algorithm] = str(value)
+        self.dirty = True
+
+    def invalidate(self, screenshot_name):
+        """
+        Удаляет запись эталона из манифеста.
+        """
+        if self.entries.pop(screenshot_name, None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """
+        Атомарно сохраняет манифест на диск, если он изменился.
+        """
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            with FileLock(f"{self.index_path}.lock"):
+                # Записи других воркеров, сохраненные после загрузки индекса, не теряются
+                entries = self._load()
+                entries.update(self.entries)
+                tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as index_file:
+                    json.dump({"version": self.VERSION, "entries": entries}, index_file, indent=1, sort_keys=True)
+                os.replace(tmp_path, self.index_path)
+            self.dirty = False
+            logger.info(f"Индекс эталонов сохранён: {self.index_path}")
+        except OSError as e:
+            logger.error(f"Ошибка при сохранении индекса эталонов: {e}")
+
+
+class BaselineRef:
+    """
+    Ссылка на эталонный скриншот для движка сравнения.
+
+    sha256 и хеши берутся из индекса эталонов, если он передан, иначе вычисляются
+    при первом обращении. Изображение декодируется только по запросу.
+    """
+    def __init__(self, path, screenshot_name=None, index=None, digest=None, hashes=None):
+        self.path = path
+        self.screenshot_name = screenshot_name
+        self.index = index
+        self._digest = digest
+        self._hashes = dict(hashes or {})
+        self._image = None
+
+    def digest(self):
+        """
+        Возвращает sha256 содержимого эталона.
+        """
+        if self._digest is None:
+            self._digest = self.index.digest(self.screenshot_name) if self.index is not None else file_digest(self.path)
+        return self._digest
+
+    def value(self, key, compute):
+        """
+        Возвращает строковое значение эталона по ключу (хеш, хеши плиток), вычисляя его через compute(image).
+        """
+        if key not in self._hashes:
+            if self.index is not None:
+                self._hashes[key] = self.index.get_value(self.screenshot_name, key, compute)
+            else:
+                self._hashes[key] = str(compute(self.image()))
+        return self._hashes[key]
+
+    def hash(self, algorithm):
+        """
+        Возвращает хеш эталона для указанного алгоритма imagehash.
+        """
+        return imagehash.hex_to_hash(self.value(algorithm, getattr(imagehash, algorithm)))
+
+    def image(self):
+        """
+        Возвращает декодированное изображение эталона.
+        """
+        if self._image is None:
+            with Image.open(self.path) as image:
+                image.load()
+                self._image = image
+        return self._image
+
+    def detach(self, algorithms=()):
+        """
+        Возвращает независимую от индекса копию ссылки, пригодную для передачи в другой процесс.
+        В копию попадают все уже известные значения и хеши указанных алгоритмов.
+        """
+        for algorithm in algorithms:
+            self.hash(algorithm)
+        return BaselineRef(self.path, self.screenshot_name, digest=self.digest(), hashes=self._hashes)
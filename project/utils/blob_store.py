@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import shutil
+
+from utils.file_lock import FileLock
+from utils.logger import logger
+
+
+class BlobStore:
+    """
+    Контентно-адресуемое хранилище скриншотов.
+
+    Содержимое файла хранится один раз в objects/<sha256[:2]>/<sha256[2:]>.png,
+    а манифесты manifests/<namespace>.json связывают имя скриншота с хешем.
+    Файлы в screenshots/ материализуются жесткими ссылками на блоб (при
+    невозможности ссылки — копией), поэтому одинаковые скриншоты не пишутся
+    повторно. Файлы, связанные с блобом, заменяются только атомарно.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+        self.manifests = {}
+        self.dirty = set()
+
+    def blob_path(self, digest):
+        """
+        Возвращает путь к блобу по его sha256.
+        """
+        return os.path.join(self.objects_dir, digest[:2], f"{digest[2:]}.png")
+
+    def has(self, digest):
+        """
+        Проверяет, есть ли блоб в хранилище.
+        """
+        return os.path.exists(self.blob_path(digest))
+
+    def put(self, data, digest=None):
+        """
+        Сохраняет байты в хранилище и возвращает их sha256. Существующий блоб не перезаписывается.
+        digest — уже известный sha256 байтов, чтобы не хешировать их повторно.
+        """
+        if digest is None:
+            digest = hashlib.sha256(data).hexdigest()
+        blob_path = self.blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = f"{blob_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, blob_path)
+        return digest
+
+    def put_file(self, path, digest=None):
+        """
+        Переносит файл в хранилище без перезаписи содержимого: файл становится ссылкой на блоб.
+        digest — уже известный sha256 содержимого, чтобы не читать файл повторно. Возвращает sha256.
+        """
+        if digest is None:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        blob_path = self.blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            try:
+                os.link(path, blob_path)
+            except OSError:
+                shutil.copyfile(path, blob_path)
+        self.materialize(digest, path)
+        return digest
+
+    def materialize(self, digest, target):
+        """
+        Создает файл target с содержимым блоба: жесткой ссылкой или копией, атомарно.
+        Возвращает False, если target уже указывает на этот блоб.
+        """
+        blob_path = self.blob_path(digest)
+        if os.path.exists(target) and os.path.samefile(target, blob_path):
+            return False
+        os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            shutil.copyfile(blob_path, tmp_path)
+        os.replace(tmp_path, target)
+        return True
+
+    def manifest(self, namespace):
+        """
+        Возвращает манифест имя -> sha256 для пространства имен (baseline, actual).
+        """
+        if namespace not in self.manifests:
+            path = os.path.join(self.manifests_dir, f"{namespace}.json")
+            entries = {}
+            if os.path.exists(path):
+                try:
+                    with open(path, "r", encoding="utf-8") as manifest_file:
+                        entries = json.load(manifest_file)
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Не удалось прочитать манифест хранилища {path}: {e}")
+            self.manifests[namespace] = entries
+        return self.manifests[namespace]
+
+    def changed(self, namespace, screenshot_name, digest):
+        """
+        Проверяет, отличается ли содержимое от записанного в манифесте.
+        """
+        return self.manifest(namespace).get(screenshot_name) != digest
+
+    def store(self, namespace, screenshot_name, data, target, digest=None):
+        """
+        Сохраняет байты скриншота, записывает их в манифест и материализует файл target.
+        Возвращает sha256 содержимого.
+        """
+        digest = self.put(data, digest)
+        self.materialize(digest, target)
+        if self.changed(namespace, screenshot_name, digest):
+            self.manifest(namespace)[screenshot_name] = digest
+            self.dirty.add(namespace)
+        return digest
+
+    def store_file(self, namespace, screenshot_name, path, digest=None):
+        """
+        Переносит уже записанный файл скриншота в хранилище и записывает его в манифест.
+        """
+        digest = self.put_file(path, digest)
+        if self.changed(namespace, screenshot_name, digest):
+            self.manifest(namespace)[screenshot_name] = digest
+            self.dirty.add(namespace)
+        return digest
+
+    def save(self):
+        """
+        Атомарно сохраняет измененные манифесты. Под блокировкой манифест перечитывается
+        с диска и дополняется своими записями, чтобы параллельные воркеры не теряли записи друг друга.
+        """
+        try:
+            os.makedirs(self.manifests_dir, exist_ok=True)
+            for namespace in sorted(self.dirty):
+                path = os.path.join(self.manifests_dir, f"{namespace}.json")
+                with FileLock(f"{path}.lock"):
+                    entries = self.manifests.pop(namespace)
+                    merged = self.manifest(namespace)
+                    merged.update(entries)
+                    tmp_path = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as manifest_file:
+                        json.dump(merged, manifest_file, indent=1, sort_keys=True)
+                    os.replace(tmp_path, path)
+            self.dirty.clear()
+        except OSError as e:
+            logger.error(f"Ошибка при сохранении манифестов хранилища: {e}")
+
+    def prune(self):
+        """
+        Удаляет блобы, на которые не ссылается ни один манифест. Возвращает число удаленных блобов.
+        """
+        if os.path.isdir(self.manifests_dir):
+            for file_name in os.listdir(self.manifests_dir):
+                if file_name.endswith(".json"):
+                    self.manifest(file_name[:-len(".json")])
+        referenced = {digest for entries in self.manifests.values() for digest in entries.values()}
+        removed = 0
+        if not os.path.isdir(self.objects_dir):
+            return removed
+        for prefix in os.listdir(self.objects_dir):
+            for file_name in os.listdir(os.path.join(self.objects_dir, prefix)):
+                if file_name.endswith(".png") and f"{prefix}{file_name[:-len('.png')]}" not in referenced:
+                    os.remove(os.path.join(self.objects_dir, prefix, file_name))
+                    removed += 1
+        if removed:
+            logger.info(f"Удалено неиспользуемых блобов скриншотов: {removed}")
+        return removed
@@ -0,0 +1,92 @@
+import html
+import os
+
+ENGINES = ("chromium", "firefox", "webkit")
+OUTCOME_ORDER = {"passed": 0, "skipped": 1, "failed": 2}
+
+
+def parse_browsers(value):
+    """
+    Разбирает список движков матрицы "chromium,firefox,webkit". Пустая строка — матрица выключена.
+    """
+    engines = []
+    for engine in (part.strip().lower() for part in (value or "").split(",")):
+        if not engine:
+            continue
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported browser: {engine}")
+        if engine not in engines:
+            engines.append(engine)
+    return engines
+
+
+def apply_engine(config, engine):
+    """
+    Настраивает конфигурацию на движок матрицы. Основной движок (browser из config.ini) сохраняет
+    прежние директории эталонов и актуальных скриншотов, остальные получают поддиректорию движка
+    и собственное пространство имен в хранилище скриншотов.
+    """
+    if engine == config.get("DEFAULT", "browser"):
+        return
+    config.set("DEFAULT", "browser", engine)
+    for key in ("screenshot_dir", "actual_screenshot_dir"):
+        config.set("DEFAULT", key, os.path.join(config.get("DEFAULT", key).strip(), engine, ""))
+    namespace = config.get("DEFAULT", "screenshot_namespace", fallback="")
+    config.set("DEFAULT", "screenshot_namespace", f"{namespace}-{engine}" if namespace else engine)
+
+
+def matrix_key(item, param="browser_engine"):
+    """
+    Возвращает идентификатор теста без движка: по нему результаты движков сводятся в одну строку.
+    """
+    params = [str(value) for name, value in item.callspec.params.items() if name != param]
+    base = item.nodeid.split("[")[0]
+    return f"{base}[{'-'.join(params)}]" if params else base
+
+
+class MatrixResults:
+    """
+    Сводка результатов кросс-браузерного прогона: строка на тест, столбец на движок.
+    Итог теста на движке — худший из результатов его этапов (setup, call, teardown).
+    Объект регистрируется плагином pytest и получает отчеты через pytest_runtest_logreport,
+    в том числе отчеты воркеров xdist в управляющем процессе.
+    """
+    def __init__(self, engines):
+        self.engines = engines
+        self.results = {}
+
+    def add(self, report):
+        """
+        Учитывает отчет этапа теста, если тест выполнялся в матрице.
+        """
+        properties = dict(report.user_properties)
+        engine = properties.get("browser_engine")
+        if engine is None:
+            return
+        outcomes = self.results.setdefault(properties["matrix_key"], {})
+        outcomes[engine] = max(outcomes.get(engine, "passed"), report.outcome, key=OUTCOME_ORDER.get)
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Хук pytest: учитывает каждый опубликованный отчет этапа теста.
+        """
+        self.add(report)
+
+    def rows(self):
+        """
+        Возвращает строки сводки: (тест, [результат на каждом движке]), без результата — "-".
+        """
+        return [(key, [outcomes.get(engine, "-") for engine in self.engines])
+                for key, outcomes in sorted(self.results.items())]
+
+    def html(self):
+        """
+        Возвращает сводку в виде HTML-таблицы для отчета.
+        """
+        header = "".join(f"<th>{engine}</th>" for engine in self.engines)
+        body = "".join(
+            f"<tr><td>{html.escape(key)}</td>"
+            + "".join(f'<td class="{outcome}">{outcome}</td>' for outcome in outcomes) + "</tr>"
+            for key, outcomes in self.rows())
+        return (f'<h2>Кросс-браузерная матрица</h2><table id="browser-matrix"><tr><th>Test</th>{header}</tr>'
+                f"{body}</table>")
@@ -0,0 +1,39 @@
+PROFILE_SECTION_PREFIX = "CAPTURE_"
+JPEG_MAGIC = b"\xff\xd8"
+
+
+def capture_options(config, profile):
+    """
+    Возвращает параметры page.screenshot для профиля захвата из секции [CAPTURE_<PROFILE>].
+
+    Профиль default без секции соответствует полноразмерному PNG окна браузера.
+    Поддерживаемые ключи: type (png/jpeg), quality, scale (css/device),
+    animations (disabled/allow), caret (hide/initial), full_page, clip (x, y, width, height).
+    """
+    section = f"{PROFILE_SECTION_PREFIX}{profile.upper()}"
+    if not config.has_section(section):
+        if profile != "default":
+            raise ValueError(f"Профиль захвата не найден в конфигурации: {profile}")
+        return {}
+
+    options = {}
+    for key in ("type", "scale", "animations", "caret"):
+        value = config.get(section, key, fallback="").strip()
+        if value:
+            options[key] = value
+    if options.get("type") == "jpeg" and config.get(section, "quality", fallback="").strip():
+        options["quality"] = config.getint(section, "quality")
+    if config.getboolean(section, "full_page", fallback=False):
+        options["full_page"] = True
+    clip = config.get(section, "clip", fallback="").strip()
+    if clip:
+        x, y, width, height = (float(value) for value in clip.split(","))
+        options["clip"] = {"x": x, "y": y, "width": width, "height": height}
+    return options
+
+
+def image_mime_type(data):
+    """
+    Возвращает MIME-тип снятого скриншота по сигнатуре байтов.
+    """
+    return "image/jpeg" if data[:2] == JPEG_MAGIC else "image/png"
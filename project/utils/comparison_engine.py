@@ -0,0 +1,221 @@
+import hashlib
+import io
+import time
+from dataclasses import dataclass, field
+
+import imagehash
+import numpy as np
+from PIL import Image
+
+from utils.image_metrics import (apply_masks, mask_image, pack_bits, ssim, tile_geometry, tile_hashes,
+                                 to_grayscale_array, unpack_bits)
+
+
+HASH_ALGORITHMS = ("average_hash", "phash", "dhash")
+TILE_HASH_SIZE = 8
+
+
+def parse_tile_grid(value):
+    """
+    Разбирает сетку плиток из конфигурации ("4x4"). Пустое значение отключает сравнение по плиткам.
+    """
+    if not value or not value.strip():
+        return None
+    rows, cols = value.lower().split("x")
+    return int(rows), int(cols)
+
+
+def mask_signature(masks):
+    """
+    Возвращает строковое представление масок для ключей значений эталона.
+    """
+    return ";".join(",".join(str(value) for value in mask) for mask in masks)
+
+
+def tile_key(grid, masks):
+    """
+    Возвращает ключ значения эталона для хешей плиток с учетом сетки и масок.
+    """
+    return f"tiles:{grid[0]}x{grid[1]}:{mask_signature(masks)}"
+
+
+def hash_key(algorithm, masks):
+    """
+    Возвращает ключ значения эталона для хеша изображения целиком; без масок — имя алгоритма.
+    """
+    return f"{algorithm}:{mask_signature(masks)}" if masks else algorithm
+
+
+@dataclass
+class ComparisonResult:
+    """
+    Результат сравнения скриншота: решение, уровень, на котором оно принято, и время каждого уровня.
+    digest — sha256 актуального скриншота, посчитанный на уровне exact.
+    """
+    passed: bool
+    tier: str
+    distance: float = None
+    timings: dict = field(default_factory=dict)
+    tiles: list = field(default_factory=list)
+    digest: str = None
+
+    def describe(self):
+        """
+        Возвращает описание результата для логов и отчета.
+        """
+        timings = ", ".join(f"{tier}: {seconds * 1000:.1f} мс" for tier, seconds in self.timings.items())
+        description = f"уровень: {self.tier}, расстояние: {self.distance}, время: {timings}"
+        if self.tiles:
+            tiles = "; ".join(f"[{row},{col}] x={x} y={y} {width}x{height} расстояние {distance}"
+                              for row, col, distance, (x, y, width, height) in self.tiles)
+            description += f", плитки: {tiles}"
+        return description
+
+
+class TieredComparisonEngine:
+    """
+    Многоуровневое сравнение скриншотов: от дешёвых проверок к точным.
+
+    1. exact — совпадение sha256 байтов скриншота и эталона;
+    2. average_hash — расстояние Хэмминга aHash;
+    3. phash_dhash — расстояния pHash и dHash;
+    4. ssim — векторизованный SSIM по блокам.
+
+    Следующий уровень выполняется, только если расстояние попало в неоднозначную
+    полосу threshold ± ambiguous_band. При ambiguous_band = 0 решение принимает aHash.
+    Маски скриншота закрашиваются на обоих изображениях, правило решения при этом не меняется.
+
+    Если задана сетка tile_grid, уровни 2-4 заменяет уровень tiles: aHash каждой плитки
+    сетки по изображению с закрашенными масками и порогом tile_threshold.
+    Неоднозначные плитки проверяются SSIM, в результат попадают отличающиеся плитки.
+    """
+    def __init__(self, threshold, ambiguous_band=0, ssim_threshold=0.98, tile_grid=None, tile_threshold=None):
+        self.threshold = threshold
+        self.ambiguous_band = ambiguous_band
+        self.ssim_threshold = ssim_threshold
+        self.tile_grid = tile_grid
+        self.tile_threshold = threshold if tile_threshold is None else tile_threshold
+
+    def _decide(self, distance, threshold=None):
+        """
+        Возвращает True/False для однозначного расстояния и None для неоднозначного.
+        """
+        threshold = self.threshold if threshold is None else threshold
+        if distance < threshold - self.ambiguous_band:
+            return True
+        if distance >= threshold + self.ambiguous_band:
+            return False
+        return None
+
+    def _baseline_tiles(self, baseline, grid, masks):
+        """
+        Возвращает размер эталона и хеши его плиток. Значение кешируется в индексе эталонов.
+        """
+        def compute(image):
+            array = apply_masks(to_grayscale_array(image), masks)
+            return f"{image.width}x{image.height}:{pack_bits(tile_hashes(array, *grid, TILE_HASH_SIZE))}"
+
+        size, bits = baseline.value(tile_key(grid, masks), compute).split(":")
+        return size, unpack_bits(bits, (*grid, TILE_HASH_SIZE * TILE_HASH_SIZE))
+
+    def _baseline_hash(self, baseline, algorithm, masks):
+        """
+        Возвращает хеш эталона с закрашенными масками. Значение кешируется в индексе эталонов.
+        """
+        return imagehash.hex_to_hash(baseline.value(
+            hash_key(algorithm, masks), lambda image: getattr(imagehash, algorithm)(mask_image(image, masks))))
+
+    def prepare(self, baseline, masks=()):
+        """
+        Вычисляет значения эталона, нужные для сравнения, и возвращает независимую копию ссылки
+        для передачи в пул процессов.
+        """
+        if self.tile_grid:
+            self._baseline_tiles(baseline, self.tile_grid, masks)
+        else:
+            for algorithm in HASH_ALGORITHMS:
+                self._baseline_hash(baseline, algorithm, masks)
+        return baseline.detach()
+
+    def _compare_tiles(self, actual_image, baseline, grid, masks, timings):
+        """
+        Сравнивает изображения по плиткам сетки grid с учетом масок.
+        """
+        started = time.perf_counter()
+        size, expected_bits = self._baseline_tiles(baseline, grid, masks)
+        if size != f"{actual_image.width}x{actual_image.height}":
+            timings["tiles"] = time.perf_counter() - started
+            return ComparisonResult(False, "tiles", None, timings)
+        actual_array = apply_masks(to_grayscale_array(actual_image), masks)
+        distances = (tile_hashes(actual_array, *grid, TILE_HASH_SIZE) != expected_bits).sum(axis=2)
+        timings["tiles"] = time.perf_counter() - started
+
+        tile_width, tile_height = tile_geometry(actual_array.shape, *grid, TILE_HASH_SIZE)
+        offending, ambiguous = [], []
+        for (row, col), distance in np.ndenumerate(distances):
+            decision = self._decide(distance, self.tile_threshold)
+            tile = (row, col, int(distance), (col * tile_width, row * tile_height, tile_width, tile_height))
+            if decision is False:
+                offending.append(tile)
+            elif decision is None:
+                ambiguous.append(tile)
+        max_distance = int(distances.max())
+        if offending or not ambiguous:
+            return ComparisonResult(not offending, "tiles", max_distance, timings, offending)
+
+        started = time.perf_counter()
+        expected_array = apply_masks(to_grayscale_array(baseline.image()), masks)
+        for tile in ambiguous:
+            x, y, width, height = tile[3]
+            similarity = ssim(expected_array[y:y + height, x:x + width], actual_array[y:y + height, x:x + width])
+            if similarity < self.ssim_threshold:
+                offending.append(tile)
+        timings["ssim"] = time.perf_counter() - started
+        return ComparisonResult(not offending, "ssim", max_distance, timings, offending)
+
+    def compare(self, actual, baseline, masks=()):
+        """
+        Сравнивает актуальный скриншот (путь или байты) с эталоном (BaselineRef).
+        masks — прямоугольники (x, y, width, height), исключаемые из сравнения.
+        """
+        timings = {}
+        started = time.perf_counter()
+        if not isinstance(actual, bytes):
+            with open(actual, "rb") as f:
+                actual = f.read()
+        digest = hashlib.sha256(actual).hexdigest()
+        timings["exact"] = time.perf_counter() - started
+        if digest == baseline.digest():
+            return ComparisonResult(True, "exact", 0, timings, digest=digest)
+        result = self._compare_images(actual, baseline, masks, timings)
+        result.digest = digest
+        return result
+
+    def _compare_images(self, actual, baseline, masks, timings):
+        """
+        Сравнивает декодированный актуальный скриншот с эталоном на уровнях выше exact.
+        """
+        actual_image = Image.open(io.BytesIO(actual))
+        if self.tile_grid:
+            return self._compare_tiles(actual_image, baseline, self.tile_grid, masks, timings)
+
+        actual_image = mask_image(actual_image, masks)
+        started = time.perf_counter()
+        distance = self._baseline_hash(baseline, "average_hash", masks) - imagehash.average_hash(actual_image)
+        decision = self._decide(distance)
+        timings["average_hash"] = time.perf_counter() - started
+        if decision is not None:
+            return ComparisonResult(decision, "average_hash", int(distance), timings)
+
+        started = time.perf_counter()
+        distances = [self._baseline_hash(baseline, algorithm, masks) - getattr(imagehash, algorithm)(actual_image)
+                     for algorithm in ("phash", "dhash")]
+        decisions = {self._decide(value) for value in distances}
+        timings["phash_dhash"] = time.perf_counter() - started
+        if len(decisions) == 1 and None not in decisions:
+            return ComparisonResult(decisions.pop(), "phash_dhash", int(max(distances)), timings)
+
+        started = time.perf_counter()
+        similarity = ssim(to_grayscale_array(mask_image(baseline.image(), masks)), to_grayscale_array(actual_image))
+        timings["ssim"] = time.perf_counter() - started
+        return ComparisonResult(similarity >= self.ssim_threshold, "ssim", round(similarity, 4), timings)
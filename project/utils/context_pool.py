@@ -0,0 +1,129 @@
+from urllib.parse import urlsplit
+
+from utils.logger import logger
+
+
+def url_origin(url):
+    """
+    Возвращает источник (схема и хост) HTTP-адреса или None для about:blank, data: и подобных.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class BrowserContextPool:
+    """
+    Пул прогретых контекстов браузера.
+
+    Вместо создания контекста на каждый тест контекст возвращается в пул и сбрасывается:
+    очищаются cookies, localStorage/sessionStorage и разрешения, закрываются лишние
+    вкладки, страница переходит на about:blank. Хранилище очищается только для источника
+    текущей страницы, поэтому пул запоминает источники, открытые во вкладках контекста:
+    если тест уходил на другой источник, контекст закрывается вместо сброса. После
+    max_uses тестов контекст закрывается, чтобы ограничить рост памяти браузера. Пул создается на процесс,
+    поэтому при параллельном запуске у каждого воркера свой пул. prepare(context)
+    вызывается для нового контекста и после каждого сброса: сброс снимает все маршруты,
+    и общие обработчики (кеш ресурсов) устанавливаются заново.
+    """
+    def __init__(self, browser, size=1, max_uses=20, context_options=None, prepare=None):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self.context_options = context_options or {}
+        self.prepare = prepare
+        self.idle = []
+        self.uses = {}
+        self.origins = {}
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self):
+        """
+        Возвращает контекст и его страницу: свободный из пула или новый.
+        """
+        if self.idle:
+            context, page = self.idle.pop()
+            self.reused += 1
+            return context, page
+        context = self.browser.new_context(**self.context_options)
+        self.uses[id(context)] = 0
+        self._track_origins(context)
+        self.created += 1
+        if self.prepare is not None:
+            self.prepare(context)
+        return context, context.new_page()
+
+    def _track_origins(self, context):
+        """
+        Запоминает источники документов, открытых во всех вкладках контекста.
+        """
+        origins = self.origins[id(context)] = set()
+
+        def record(frame):
+            origin = url_origin(frame.url)
+            if origin is not None:
+                origins.add(origin)
+
+        context.on("page", lambda page: page.on("framenavigated", record))
+
+    def _reset(self, context, page):
+        """
+        Сбрасывает состояние контекста перед следующим тестом. Возвращает False, если тест
+        открывал другие источники, чье хранилище со страницы не очистить: контекст нужно закрыть.
+        """
+        origin = url_origin(page.url)
+        visited = self.origins[id(context)]
+        if visited - {origin}:
+            logger.info(f"Контекст открывал другие источники ({', '.join(sorted(visited))}), он будет закрыт")
+            return False
+        for extra_page in context.pages:
+            if extra_page is not page:
+                extra_page.close()
+        context.unroute_all()
+        page.unroute_all()
+        if origin is not None:
+            page.evaluate("() => { localStorage.clear(); sessionStorage.clear(); }")
+        context.clear_cookies()
+        context.clear_permissions()
+        page.goto("about:blank")
+        visited.clear()
+        if self.prepare is not None:
+            self.prepare(context)
+        return True
+
+    def release(self, context, page):
+        """
+        Возвращает контекст в пул после теста. Контекст закрывается, если он исчерпал
+        лимит использований, пул заполнен или сброс не удался.
+        """
+        self.uses[id(context)] += 1
+        if self.uses[id(context)] < self.max_uses and len(self.idle) < self.size and not page.is_closed():
+            try:
+                if self._reset(context, page):
+                    self.idle.append((context, page))
+                    return
+            except Exception as e:
+                logger.warning(f"Не удалось сбросить контекст браузера, он будет закрыт: {e}")
+        self._close(context)
+
+    def _close(self, context):
+        """
+        Закрывает контекст и забывает счетчик его использований.
+        """
+        self.uses.pop(id(context), None)
+        self.origins.pop(id(context), None)
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Ошибка при закрытии контекста браузера: {e}")
+
+    def close(self):
+        """
+        Закрывает все свободные контексты пула.
+        """
+        while self.idle:
+            context, _ = self.idle.pop()
+            self._close(context)
+        logger.info(f"Пул контекстов: создано {self.created}, переиспользовано {self.reused}")
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor, wait as wait_futures
+
+
+class DeferredComparisonQueue:
+    """
+    Очередь отложенных сравнений скриншотов.
+
+    Декодирование и хеширование выполняются в пуле процессов, пока тест продолжает
+    работать с браузером. Сравнения теста дожидаются до публикации его отчета, поэтому
+    несовпадение скриншота роняет сам тест.
+    """
+    def __init__(self, max_workers=None, timeout=60):
+        self.executor = ProcessPoolExecutor(max_workers=max_workers)
+        self.timeout = timeout
+        self.pending = {}
+
+    def submit(self, test_id, screenshot_name, evaluate, fn, *args):
+        """
+        Ставит сравнение в очередь. evaluate(result) возвращает текст ошибки или None.
+        """
+        future = self.executor.submit(fn, *args)
+        self.pending.setdefault(test_id, []).append((screenshot_name, future, evaluate))
+        return future
+
+    def resolve(self, test_id):
+        """
+        Дожидается сравнений теста не дольше timeout секунд и возвращает список ошибок
+        (имя скриншота, текст). Незавершенное за timeout сравнение отменяется и считается ошибкой.
+        """
+        checks = self.pending.pop(test_id, [])
+        if not checks:
+            return []
+        _, not_done = wait_futures([future for _, future, _ in checks], timeout=self.timeout)
+        failures = []
+        for screenshot_name, future, evaluate in checks:
+            if future in not_done:
+                future.cancel()
+                message = f"Сравнение скриншотов не завершилось за {self.timeout} с"
+            else:
+                error = future.exception()
+                message = f"Ошибка при сравнении скриншотов: {error}" if error else evaluate(future.result())
+            if message:
+                failures.append((screenshot_name, message))
+        return failures
+
+    def shutdown(self):
+        """
+        Останавливает пул процессов.
+        """
+        self.executor.shutdown(cancel_futures=True)
@@ -0,0 +1,42 @@
+import os
+import socket
+import time
+
+from utils.logger import logger
+
+
+class FileLock:
+    """
+    Межпроцессная блокировка на основе атомарного создания lock-файла.
+    Файл старше stale_after секунд считается оставленным упавшим процессом.
+    """
+    def __init__(self, path, timeout=300, stale_after=600):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, f"{socket.gethostname()}:{os.getpid()}".encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_after:
+                        logger.warning(f"Удалена устаревшая блокировка: {self.path}")
+                        os.remove(self.path)
+                        continue
+                except OSError:
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Не удалось получить блокировку: {self.path}")
+                time.sleep(0.05)
+
+    def __exit__(self, *exc_info):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
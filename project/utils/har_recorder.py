@@ -0,0 +1,79 @@
+import os
+import re
+
+from utils.logger import logger
+
+HAR_POLICIES = ("fail", "fallthrough", "stub")
+UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.\[\]-]+")
+
+
+class HarSession:
+    """
+    Запись и воспроизведение сетевого трафика тестов через HAR-файлы.
+
+    У каждого теста своя запись <har_dir>/<модуль>/<тест>.har. В режиме record трафик
+    записывается route_from_har(update=True); файл сохраняется при закрытии контекста,
+    поэтому в этом режиме контексты не переиспользуются. В режиме replay ответы отдаются
+    из записи, а запросы, которых в ней нет, обрабатываются политикой policy:
+    fail — запрос отклоняется и тест завершается ошибкой, fallthrough — запрос уходит
+    в сеть (или к ранее установленным обработчикам), stub — отдается пустой ответ 204.
+    """
+    def __init__(self, har_dir, mode, policy="fail"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported HAR mode: {mode}")
+        if policy not in HAR_POLICIES:
+            raise ValueError(f"Unsupported HAR unmatched policy: {policy}")
+        self.har_dir = har_dir
+        self.mode = mode
+        self.policy = policy
+
+    def path(self, nodeid):
+        """
+        Возвращает путь к HAR-записи теста по его nodeid.
+        """
+        module, _, name = nodeid.partition("::")
+        module = os.path.splitext(os.path.basename(module))[0]
+        return os.path.join(self.har_dir, module, f"{UNSAFE_NAME_CHARS.sub('_', name)}.har")
+
+    def attach(self, context, nodeid):
+        """
+        Подключает запись или воспроизведение HAR к контексту теста.
+        Возвращает список, в который собираются запросы, отсутствующие в записи.
+        """
+        har_path = self.path(nodeid)
+        unmatched = []
+        if self.mode == "record":
+            os.makedirs(os.path.dirname(har_path), exist_ok=True)
+            context.route_from_har(har_path, update=True, update_content="embed", update_mode="minimal")
+            logger.info(f"Запись трафика в HAR: {har_path}")
+            return unmatched
+
+        if not os.path.exists(har_path):
+            raise FileNotFoundError(f"HAR-запись теста не найдена: {har_path}. Запишите ее с --har-record")
+        if self.policy != "fallthrough":
+            # Обработчик установлен раньше HAR и получает только запросы, не найденные в записи
+            context.route("**/*", lambda route, request: self._unmatched(route, request, unmatched))
+        context.route_from_har(har_path, not_found="fallback")
+        logger.info(f"Воспроизведение трафика из HAR: {har_path}")
+        return unmatched
+
+    def _unmatched(self, route, request, unmatched):
+        """
+        Обрабатывает запрос, отсутствующий в записи, по политике stub или fail.
+        """
+        unmatched.append(f"{request.method} {request.url}")
+        if self.policy == "stub":
+            route.fulfill(status=204, body="")
+        else:
+            route.abort("internetdisconnected")
+
+    def check(self, unmatched, nodeid):
+        """
+        Сообщает о запросах теста, которых нет в записи. При политике fail вызывает AssertionError.
+        """
+        if not unmatched:
+            return
+        details = "\n".join(f"  {request}" for request in unmatched)
+        if self.policy == "fail":
+            raise AssertionError(f"Запросы отсутствуют в HAR-записи {self.path(nodeid)}:\n{details}")
+        logger.warning(f"Запросы отсутствуют в HAR-записи {self.path(nodeid)}, отданы заглушки:\n{details}")
@@ -0,0 +1,163 @@
+import numpy as np
+from PIL import ImageDraw
+
+
+def to_grayscale_array(image):
+    """
+    Преобразует изображение PIL в массив яркости float32.
+    """
+    return np.asarray(image.convert("L"), dtype=np.float32)
+
+
+def _blocks(array, block):
+    """
+    Обрезает массив до кратного размера и разбивает его на блоки block x block без копирования.
+    """
+    height = array.shape[0] // block * block
+    width = array.shape[1] // block * block
+    return array[:height, :width].reshape(height // block, block, width // block, block)
+
+
+def ssim(expected, actual, block=8):
+    """
+    Возвращает среднее SSIM по неперекрывающимся блокам двух массивов яркости одного размера.
+    """
+    if expected.shape != actual.shape:
+        return 0.0
+    expected_blocks = _blocks(expected, block)
+    actual_blocks = _blocks(actual, block)
+
+    mean_expected = expected_blocks.mean(axis=(1, 3))
+    mean_actual = actual_blocks.mean(axis=(1, 3))
+    var_expected = (expected_blocks ** 2).mean(axis=(1, 3)) - mean_expected ** 2
+    var_actual = (actual_blocks ** 2).mean(axis=(1, 3)) - mean_actual ** 2
+    covariance = (expected_blocks * actual_blocks).mean(axis=(1, 3)) - mean_expected * mean_actual
+
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    ssim_map = ((2 * mean_expected * mean_actual + c1) * (2 * covariance + c2)) / (
+        (mean_expected ** 2 + mean_actual ** 2 + c1) * (var_expected + var_actual + c2))
+    return float(ssim_map.mean())
+
+
+def apply_masks(array, masks, fill=0):
+    """
+    Возвращает копию массива, в которой прямоугольники масок (x, y, width, height) закрашены значением fill.
+    """
+    if not masks:
+        return array
+    masked = array.copy()
+    for x, y, width, height in masks:
+        masked[y:y + height, x:x + width] = fill
+    return masked
+
+
+def mask_image(image, masks):
+    """
+    Возвращает копию изображения PIL, в которой прямоугольники масок (x, y, width, height) закрашены черным.
+    """
+    if not masks:
+        return image
+    masked = image.convert("RGB")
+    draw = ImageDraw.Draw(masked)
+    for x, y, width, height in masks:
+        draw.rectangle((x, y, x + width - 1, y + height - 1), fill=0)
+    return masked
+
+
+def tile_geometry(shape, rows, cols, hash_size=8):
+    """
+    Возвращает размер плитки (ширина, высота) в пикселях для сетки rows x cols.
+    """
+    block_height = shape[0] // (rows * hash_size)
+    block_width = shape[1] // (cols * hash_size)
+    return block_width * hash_size, block_height * hash_size
+
+
+def tile_hashes(array, rows, cols, hash_size=8, tolerance=2):
+    """
+    Вычисляет aHash каждой плитки сетки rows x cols за один векторизованный проход.
+    Бит установлен, если яркость ячейки выше средней по плитке больше чем на tolerance:
+    так шум сжатия на однотонных плитках не переключает биты.
+    Возвращает булев массив формы (rows, cols, hash_size * hash_size).
+    """
+    block_height = array.shape[0] // (rows * hash_size)
+    block_width = array.shape[1] // (cols * hash_size)
+    cells = array[:rows * hash_size * block_height, :cols * hash_size * block_width].reshape(
+        rows, hash_size, block_height, cols, hash_size, block_width).mean(axis=(2, 5)).transpose(0, 2, 1, 3)
+    bits = cells > cells.mean(axis=(2, 3), keepdims=True) + tolerance
+    return bits.reshape(rows, cols, hash_size * hash_size)
+
+
+def pack_bits(bits):
+    """
+    Упаковывает булев массив хешей плиток в hex-строку.
+    """
+    return np.packbits(bits.ravel()).tobytes().hex()
+
+
+def unpack_bits(value, shape):
+    """
+    Распаковывает hex-строку, полученную pack_bits, в булев массив указанной формы.
+    """
+    bits = np.unpackbits(np.frombuffer(bytes.fromhex(value), dtype=np.uint8))
+    return bits[:int(np.prod(shape))].reshape(shape).astype(bool)
+
+
+def changed_pixels(expected, actual, tolerance=16, masks=()):
+    """
+    Возвращает булеву карту пикселей, у которых хотя бы один канал RGBA отличается больше чем на tolerance.
+    Области масок в карту не попадают.
+    """
+    difference = np.abs(expected.astype(np.int16) - actual.astype(np.int16)).max(axis=2) > tolerance
+    return apply_masks(difference, masks, fill=False)
+
+
+def changed_regions(changed, cell=16):
+    """
+    Возвращает прямоугольники (x, y, width, height) связных областей изменений.
+
+    Карта изменений сжимается до сетки ячеек cell x cell, затем метки соседних ячеек
+    (8-связность) объединяются векторизованным распространением максимума.
+    """
+    rows = -(-changed.shape[0] // cell)
+    cols = -(-changed.shape[1] // cell)
+    padded = np.zeros((rows * cell, cols * cell), dtype=bool)
+    padded[:changed.shape[0], :changed.shape[1]] = changed
+    cells = padded.reshape(rows, cell, cols, cell).any(axis=(1, 3))
+    if not cells.any():
+        return []
+
+    labels = np.where(cells, np.arange(1, cells.size + 1).reshape(cells.shape), 0)
+    while True:
+        bordered = np.pad(labels, 1)
+        neighbours = np.max([bordered[dy:dy + rows, dx:dx + cols] for dy in range(3) for dx in range(3)], axis=0)
+        spread = np.where(cells, neighbours, 0)
+        if np.array_equal(spread, labels):
+            break
+        labels = spread
+
+    regions = []
+    for label in np.unique(labels[cells]):
+        cell_rows, cell_cols = np.nonzero(labels == label)
+        x, y = cell_cols.min() * cell, cell_rows.min() * cell
+        width = min((cell_cols.max() + 1) * cell, changed.shape[1]) - x
+        height = min((cell_rows.max() + 1) * cell, changed.shape[0]) - y
+        regions.append((int(x), int(y), int(width), int(height)))
+    return sorted(regions, key=lambda region: (region[1], region[0]))
+
+
+def diff_overlay(expected, changed, regions, border=2):
+    """
+    Строит изображение различий: приглушенный эталон, измененные пиксели красным и рамки областей.
+    expected — массив RGBA эталона, результат — массив RGBA uint8.
+    """
+    overlay = expected.copy()
+    overlay[..., :3] = (expected[..., :3] * 0.3 + 255 * 0.7).astype(np.uint8)
+    overlay[..., 3] = 255
+    overlay[changed] = (255, 0, 0, 255)
+    for x, y, width, height in regions:
+        for top, bottom, left, right in ((y, y + border, x, x + width), (y + height - border, y + height, x, x + width),
+                                         (y, y + height, x, x + border), (y, y + height, x + width - border, x + width)):
+            overlay[max(top, 0):bottom, max(left, 0):right] = (255, 0, 255, 255)
+    return overlay
@@ -0,0 +1,790 @@
+import argparse
+import html
+import itertools
+import json
+import os
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from data.local_shop import categories, countries, products, seed_customers
+from utils.logger import logger
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+STYLES = """
+body { font-family: Arial, sans-serif; font-size: 14px; margin: 0; color: #444; }
+.header { height: 120px; padding: 0 20px; border-bottom: 1px solid #ddd; }
+.header-links { float: right; padding-top: 55px; }
+.header-links ul { list-style: none; margin: 0; padding: 0; }
+.header-links li { display: inline-block; margin-left: 12px; }
+.search-box { float: left; padding-top: 55px; }
+.top-menu { list-style: none; margin: 0; padding: 10px 20px; background: #eee; }
+.top-menu li { display: inline-block; margin-right: 16px; }
+.master-wrapper-content { padding: 20px; }
+.bar-notification { position: fixed; top: 0; left: 0; right: 0; padding: 10px; background: #4bb07a; color: #fff; }
+.product-grid .item-box { display: inline-block; width: 200px; margin: 0 10px 10px 0; vertical-align: top; }
+.field-validation-error, .validation-summary-errors, .message-error { color: #e4434b; }
+.step { margin-bottom: 20px; }
+"""
+
+SCRIPT = """
+function shopPost(url, body) {
+    return fetch(url, {method: 'POST', headers: {'Content-Type': 'application/x-www-form-urlencoded'},
+                       body: body || ''}).then(function (response) { return response.json(); });
+}
+function addProduct(url) {
+    shopPost(url).then(function (data) {
+        var bar = document.getElementById('bar-notification');
+        bar.querySelector('.content').innerHTML = data.message;
+        bar.style.display = 'block';
+        document.querySelector('.header-links .cart-qty').textContent = data.updatetopcartsectionhtml;
+        document.querySelector('.header-links .wishlist-qty').textContent = data.updatetopwishlistsectionhtml;
+    });
+}
+function showStep(id) {
+    document.getElementById(id).style.display = 'block';
+}
+function confirmOrder() {
+    var data = new URLSearchParams(new FormData(document.getElementById('checkout-form')));
+    shopPost('/checkout/confirm', data.toString()).then(function (data) { location.href = data.redirect; });
+}
+"""
+
+
+class Redirect(Exception):
+    """
+    Перенаправление на другую страницу магазина.
+    """
+    def __init__(self, location):
+        super().__init__(location)
+        self.location = location
+
+
+class LocalShopState:
+    """
+    Состояние локального магазина в памяти: покупатели, сессии, корзины, адреса и заказы.
+    Все изменения выполняются под одной блокировкой, обработчики запросов работают в потоках.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.customers = {}
+        self.sessions = {}
+        self.guests = {}
+        for customer in seed_customers:
+            self.add_customer(**customer)
+
+    def add_customer(self, email, password, first_name, last_name, gender=""):
+        """
+        Создает покупателя с пустыми корзиной, списком желаний, адресами и заказами.
+        """
+        self.customers[email.lower()] = {
+            "email": email, "password": password, "first_name": first_name, "last_name": last_name,
+            "gender": gender, "cart": [], "wishlist": [], "addresses": [], "orders": [],
+        }
+
+    def customer(self, session_id):
+        """
+        Возвращает покупателя сессии или None для гостя.
+        """
+        email = self.sessions.get(session_id)
+        return self.customers.get(email) if email else None
+
+    def basket(self, session_id):
+        """
+        Возвращает корзину и список желаний сессии: покупателя или гостя.
+        """
+        customer = self.customer(session_id)
+        if customer is None:
+            customer = self.guests.setdefault(session_id, {"cart": [], "wishlist": []})
+        return customer
+
+
+def quantity(items):
+    """
+    Возвращает количество товаров в корзине или списке желаний.
+    """
+    return sum(item["quantity"] for item in items)
+
+
+def add_item(items, slug, item_id):
+    """
+    Добавляет товар в корзину или список желаний, увеличивая количество уже добавленного.
+    """
+    for item in items:
+        if item["slug"] == slug:
+            item["quantity"] += 1
+            return
+    items.append({"id": item_id, "slug": slug, "quantity": 1})
+
+
+class LocalShopHandler(BaseHTTPRequestHandler):
+    """
+    Обработчик запросов локального магазина. Разметка повторяет селекторы pages/*.py.
+    """
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalShop/1.0"
+
+    ROUTES = [
+        (re.compile(r"^/$"), "home"),
+        (re.compile(r"^/login$"), "login"),
+        (re.compile(r"^/logout$"), "logout"),
+        (re.compile(r"^/register$"), "register"),
+        (re.compile(r"^/registerresult/\d+$"), "register_result"),
+        (re.compile(r"^/search$"), "search"),
+        (re.compile(r"^/cart$"), "cart"),
+        (re.compile(r"^/wishlist$"), "wishlist"),
+        (re.compile(r"^/addproducttocart/catalog/(?P<slug>[\w-]+)$"), "add_from_catalog"),
+        (re.compile(r"^/addproducttocart/details/(?P<slug>[\w-]+)/(?P<kind>[12])$"), "add_from_details"),
+        (re.compile(r"^/onepagecheckout$"), "checkout"),
+        (re.compile(r"^/checkout/confirm$"), "checkout_confirm"),
+        (re.compile(r"^/checkout/completed/?$"), "checkout_completed"),
+        (re.compile(r"^/customer/info$"), "customer_info"),
+        (re.compile(r"^/customer/changepassword$"), "change_password"),
+        (re.compile(r"^/customer/orders$"), "orders"),
+        (re.compile(r"^/orderdetails/(?P<order_id>\d+)$"), "order_details"),
+        (re.compile(r"^/customer/addresses$"), "addresses"),
+        (re.compile(r"^/customer/addressadd$"), "address_edit"),
+        (re.compile(r"^/customer/addressedit/(?P<address_id>\d+)$"), "address_edit"),
+        (re.compile(r"^/customer/addressdelete/(?P<address_id>\d+)$"), "address_delete"),
+        (re.compile(r"^/content/styles\.css$"), "styles"),
+        (re.compile(r"^/scripts/shop\.js$"), "script"),
+        (re.compile(r"^/(?P<slug>[\w-]+)$"), "catalog"),
+    ]
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def _dispatch(self):
+        """
+        Разбирает запрос, находит обработчик страницы и отправляет ответ.
+        """
+        url = urlsplit(self.path)
+        self.query = {name: values[-1] for name, values in parse_qs(url.query, keep_blank_values=True).items()}
+        self.form = {}
+        if self.command == "POST":
+            length = int(self.headers.get("Content-Length") or 0)
+            self.form = parse_qs(self.rfile.read(length).decode("utf-8"), keep_blank_values=True)
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        self.session_id = cookie["sid"].value if "sid" in cookie else None
+        self.new_session = self.session_id is None
+        if self.new_session:
+            self.session_id = secrets.token_hex(16)
+
+        try:
+            for pattern, name in self.ROUTES:
+                match = pattern.match(url.path.lower())
+                if match:
+                    status, content_type, body = getattr(self, f"page_{name}")(**match.groupdict())
+                    break
+            else:
+                status, content_type, body = self.not_found()
+        except Redirect as redirect:
+            self._send(302, "text/html; charset=utf-8", b"", {"Location": redirect.location})
+            return
+        self._send(status, content_type, body.encode("utf-8") if isinstance(body, str) else body)
+
+    def _send(self, status, content_type, body, headers=None):
+        """
+        Отправляет ответ с cookie сессии для нового посетителя.
+        """
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if content_type.startswith(("text/css", "application/javascript")):
+            self.send_header("Cache-Control", "max-age=3600")
+        if self.new_session:
+            self.send_header("Set-Cookie", f"sid={self.session_id}; Path=/; HttpOnly")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def field(self, name):
+        """
+        Возвращает значение поля отправленной формы.
+        """
+        return self.form.get(name, [""])[-1]
+
+    def customer(self, required=False):
+        """
+        Возвращает текущего покупателя. Для страниц аккаунта гость перенаправляется на вход.
+        """
+        customer = self.state.customer(self.session_id)
+        if customer is None and required:
+            raise Redirect("/login")
+        return customer
+
+    # --- разметка ---
+
+    def layout(self, title, content, status=200):
+        """
+        Возвращает страницу с шапкой, поиском, меню категорий и панелью уведомлений.
+        """
+        customer = self.customer()
+        basket = self.state.basket(self.session_id)
+        if customer is None:
+            account_links = ('<li><a href="/register" class="ico-register">Register</a></li>'
+                             '<li><a href="/login" class="ico-login">Log in</a></li>')
+        else:
+            account_links = (f'<li><a href="/customer/info" class="account">{html.escape(customer["email"])}</a></li>'
+                             '<li><a href="/logout" class="ico-logout">Log out</a></li>')
+        menu = "".join(f'<li><a href="/{slug}">{html.escape(name)}</a></li>' for slug, name in categories.items())
+        page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Demo Web Shop. {html.escape(title)}</title>
+<link rel="stylesheet" href="/content/styles.css"><script src="/scripts/shop.js"></script></head>
+<body>
+<div class="header">
+<div class="search-box"><form action="/search" method="get">
+<input type="text" id="small-searchterms" name="q" class="search-box-text">
+<input type="submit" class="button-1 search-box-button" value="Search"></form></div>
+<div class="header-links"><ul>{account_links}
+<li id="topcartlink"><a href="/cart" class="ico-cart"><span class="cart-label">Shopping cart</span>
+<span class="cart-qty">({quantity(basket["cart"])})</span></a></li>
+<li><a href="/wishlist" class="ico-wishlist"><span class="cart-label">Wishlist</span>
+<span class="wishlist-qty">({quantity(basket["wishlist"])})</span></a></li>
+</ul></div>
+</div>
+<ul class="top-menu">{menu}</ul>
+<div id="bar-notification" class="bar-notification" style="display: none"><p class="content"></p></div>
+<div class="master-wrapper-content"><div class="page-title"><h1>{html.escape(title)}</h1></div>
+{content}
+</div>
+</body></html>"""
+        return status, "text/html; charset=utf-8", page
+
+    def token(self):
+        """
+        Возвращает скрытое поле токена анти-подделки, как в формах demowebshop.
+        """
+        return f'<input name="__RequestVerificationToken" type="hidden" value="{self.session_id}">'
+
+    @staticmethod
+    def field_error(name, message):
+        """
+        Возвращает сообщение валидации поля или пустую строку.
+        """
+        if not message:
+            return ""
+        return (f'<span class="field-validation-error" data-valmsg-for="{name}">'
+                f'<span>{html.escape(message)}</span></span>')
+
+    @staticmethod
+    def summary_errors(messages):
+        """
+        Возвращает общий блок ошибок формы или пустую строку.
+        """
+        if not messages:
+            return ""
+        items = "".join(f"<li>{html.escape(message)}</li>" for message in messages)
+        return f'<div class="validation-summary-errors"><ul>{items}</ul></div>'
+
+    @staticmethod
+    def product_grid(slugs, with_buttons=False):
+        """
+        Возвращает сетку товаров.
+        """
+        items = []
+        for slug in slugs:
+            product = products[slug]
+            button = (f'<input type="button" value="Add to cart" class="button-2 product-box-add-to-cart-button" '
+                      f'onclick="addProduct(\'/addproducttocart/catalog/{slug}\')">' if with_buttons else "")
+            items.append(f'<div class="item-box"><div class="product-item">'
+                         f'<h2 class="product-title"><a href="/{slug}">{html.escape(product["name"])}</a></h2>'
+                         f'<div class="prices"><span class="price actual-price">{product["price"]}</span></div>'
+                         f'{button}</div></div>')
+        return f'<div class="product-grid">{"".join(items)}</div>'
+
+    def account_navigation(self, active):
+        """
+        Возвращает меню аккаунта: ссылка текущей страницы активна, остальные — inactive.
+        """
+        links = [("/customer/info", "Customer info"), ("/customer/addresses", "Addresses"),
+                 ("/customer/orders", "Orders"), ("/customer/changepassword", "Change password")]
+        items = "".join(f'<li><a href="{href}" class="{"active" if href == active else "inactive"}">{title}</a></li>'
+                        for href, title in links)
+        return f'<div class="block block-account-navigation"><ul class="list">{items}</ul></div>'
+
+    def country_options(self, selected=""):
+        """
+        Возвращает варианты выпадающего списка стран.
+        """
+        return "".join(f'<option value="{html.escape(country)}"{" selected" if country == selected else ""}>'
+                       f"{html.escape(country)}</option>" for country in countries)
+
+    # --- страницы ---
+
+    def not_found(self):
+        return self.layout("Page not found", '<div class="page-body">The page you requested was not found.</div>', 404)
+
+    def page_styles(self):
+        return 200, "text/css; charset=utf-8", STYLES
+
+    def page_script(self):
+        return 200, "application/javascript; charset=utf-8", SCRIPT
+
+    def page_home(self):
+        featured = ["computing-and-internet", "smartphone", "141-inch-laptop", "blue-jeans"]
+        return self.layout("Welcome to our store", f'<div class="page home-page">{self.product_grid(featured)}</div>')
+
+    def page_catalog(self, slug):
+        if slug in categories:
+            slugs = [product_slug for product_slug, product in products.items() if product["category"] == slug]
+            return self.layout(categories[slug],
+                               f'<div class="page category-page">{self.product_grid(slugs, with_buttons=True)}</div>')
+        if slug in products:
+            product = products[slug]
+            content = f"""<div class="product-essential">
+<div class="product-name"><h1>{html.escape(product["name"])}</h1></div>
+<div class="product-price"><span>{product["price"]}</span></div>
+<div class="add-to-cart"><input type="button" value="Add to cart" class="button-1 add-to-cart-button"
+ onclick="addProduct('/addproducttocart/details/{slug}/1')"></div>
+<div class="add-to-wishlist"><input type="button" value="Add to wishlist" class="button-2 add-to-wishlist-button"
+ onclick="addProduct('/addproducttocart/details/{slug}/2')"></div>
+</div>"""
+            return self.layout(product["name"], content)
+        return self.not_found()
+
+    def page_search(self):
+        term = self.query.get("q", "").strip().lower()
+        slugs = [slug for slug, product in products.items() if term in product["name"].lower()]
+        if not slugs:
+            content = '<strong class="result">No products were found that matched your criteria.</strong>'
+        else:
+            content = self.product_grid(slugs)
+        return self.layout("Search", f'<div class="search-results">{content}</div>')
+
+    def page_login(self):
+        error = ""
+        if self.command == "POST":
+            email = self.field("Email").strip()
+            with self.state.lock:
+                customer = self.state.customers.get(email.lower())
+                if customer is not None and customer["password"] == self.field("Password"):
+                    self.state.sessions[self.session_id] = customer["email"].lower()
+                    raise Redirect("/")
+            reason = "No customer account found" if customer is None else "The credentials provided are incorrect"
+            error = ('<div class="message-error"><div class="validation-summary-errors">'
+                     '<span>Login was unsuccessful. Please correct the errors and try again.</span>'
+                     f"<ul><li>{reason}</li></ul></div></div>")
+        content = f"""<div class="returning-wrapper"><form method="post" action="/login">{error}{self.token()}
+<div class="inputs"><label for="Email">Email:</label><input id="Email" name="Email" type="text" class="email"></div>
+<div class="inputs"><label for="Password">Password:</label><input id="Password" name="Password" type="password"></div>
+<div class="inputs"><input id="RememberMe" name="RememberMe" type="checkbox" value="true"></div>
+<div class="buttons"><input type="submit" class="button-1 login-button" value="Log in"></div>
+</form></div>"""
+        return self.layout("Welcome, Please Sign In!", content)
+
+    def page_logout(self):
+        with self.state.lock:
+            self.state.sessions.pop(self.session_id, None)
+        raise Redirect("/")
+
+    def page_register(self):
+        values = {name: "" for name in ("FirstName", "LastName", "Email")}
+        errors, summary = {}, []
+        if self.command == "POST":
+            values = {name: self.field(name).strip() for name in values}
+            password, confirm = self.field("Password"), self.field("ConfirmPassword")
+            if not values["FirstName"]:
+                errors["FirstName"] = "First name is required."
+            if not values["LastName"]:
+                errors["LastName"] = "Last name is required."
+            if not values["Email"]:
+                errors["Email"] = "Email is required."
+            elif not EMAIL_PATTERN.match(values["Email"]):
+                errors["Email"] = "Wrong email"
+            if not password:
+                errors["Password"] = "Password is required."
+            if not confirm:
+                errors["ConfirmPassword"] = "Password is required."
+            elif password != confirm:
+                errors["ConfirmPassword"] = "The password and confirmation password do not match."
+            if not errors:
+                with self.state.lock:
+                    if values["Email"].lower() in self.state.customers:
+                        summary.append("The specified email already exists")
+                    else:
+                        self.state.add_customer(values["Email"], password, values["FirstName"], values["LastName"],
+                                                self.field("Gender"))
+                        self.state.sessions[self.session_id] = values["Email"].lower()
+                        raise Redirect("/registerresult/1")
+
+        def text_field(name, label, kind="text"):
+            value = html.escape(values.get(name, ""))
+            return (f'<div class="inputs"><label for="{name}">{label}:</label>'
+                    f'<input id="{name}" name="{name}" type="{kind}" value="{value if kind == "text" else ""}">'
+                    f"{self.field_error(name, errors.get(name))}</div>")
+
+        content = f"""<form method="post" action="/register">{self.summary_errors(summary)}{self.token()}
+<div class="gender"><input id="gender-male" name="Gender" type="radio" value="M"><label for="gender-male">Male</label>
+<input id="gender-female" name="Gender" type="radio" value="F"><label for="gender-female">Female</label></div>
+{text_field("FirstName", "First name")}{text_field("LastName", "Last name")}{text_field("Email", "Email")}
+{text_field("Password", "Password", "password")}{text_field("ConfirmPassword", "Confirm password", "password")}
+<div class="buttons"><input type="submit" id="register-button" name="register-button"
+ class="button-1 register-next-step-button" value="Register"></div>
+</form>"""
+        return self.layout("Register", content)
+
+    def page_register_result(self):
+        content = ('<div class="result">Your registration completed</div>'
+                   '<div class="buttons"><input type="button" class="button-1 register-continue-button" '
+                   'value="Continue" onclick="location.href=\'/\'"></div>')
+        return self.layout("Register", content)
+
+    def basket_json(self, basket, message):
+        """
+        Возвращает ответ добавления товара: уведомление и новые счетчики шапки.
+        """
+        body = json.dumps({"success": True, "message": message,
+                           "updatetopcartsectionhtml": f"({quantity(basket['cart'])})",
+                           "updatetopwishlistsectionhtml": f"({quantity(basket['wishlist'])})"})
+        return 200, "application/json; charset=utf-8", body
+
+    def page_add_from_catalog(self, slug):
+        return self.page_add_from_details(slug, "1")
+
+    def page_add_from_details(self, slug, kind):
+        if slug not in products:
+            return self.not_found()
+        with self.state.lock:
+            basket = self.state.basket(self.session_id)
+            if kind == "1":
+                add_item(basket["cart"], slug, next(self.state.ids))
+                message = 'The product has been added to your <a href="/cart">shopping cart</a>'
+            else:
+                add_item(basket["wishlist"], slug, next(self.state.ids))
+                message = 'The product has been added to your <a href="/wishlist">wishlist</a>'
+            return self.basket_json(basket, message)
+
+    def item_rows(self, items, wishlist=False):
+        """
+        Возвращает строки таблицы корзины или списка желаний.
+        """
+        rows = []
+        for item in items:
+            product = products[item["slug"]]
+            add_to_cart = (f'<td class="add-to-cart"><input type="checkbox" name="addtocart" value="{item["id"]}"></td>'
+                           if wishlist else "")
+            rows.append(f'<tr class="cart-item-row">'
+                        f'<td class="remove-from-cart"><input type="checkbox" name="removefromcart" value="{item["id"]}"></td>'
+                        f'{add_to_cart}<td class="product"><a href="/{item["slug"]}" class="product-name">'
+                        f'{html.escape(product["name"])}</a></td>'
+                        f'<td class="unit-price"><span class="product-unit-price">{product["price"]}</span></td>'
+                        f'<td class="qty"><input name="itemquantity{item["id"]}" value="{item["quantity"]}" '
+                        f'class="qty-input"></td></tr>')
+        return "".join(rows)
+
+    def page_cart(self):
+        warning = ""
+        with self.state.lock:
+            cart = self.state.basket(self.session_id)["cart"]
+            if self.command == "POST":
+                if self.field("checkout"):
+                    if self.field("termsofservice"):
+                        raise Redirect("/onepagecheckout")
+                    warning = '<div class="terms-of-service-warning">Please accept the terms of service</div>'
+                elif "updatecart" in self.form:
+                    removed = set(self.form.get("removefromcart", []))
+                    cart[:] = [item for item in cart if str(item["id"]) not in removed]
+            rows = self.item_rows(cart)
+        if not rows:
+            content = '<div class="order-summary-content">Your Shopping Cart is empty!</div>'
+        else:
+            content = f"""<div class="order-summary-content"><form method="post" action="/cart">{warning}
+<table class="cart"><tbody>{rows}</tbody></table>
+<div class="common-buttons"><input type="submit" name="updatecart" value="Update shopping cart"
+ class="button-2 update-cart-button"></div>
+<div class="terms-of-service"><input id="termsofservice" type="checkbox" name="termsofservice" value="on">
+<label for="termsofservice">I agree with the terms of service</label></div>
+<div class="checkout-buttons"><button type="submit" id="checkout" name="checkout" value="checkout"
+ class="button-1 checkout-button">Checkout</button></div>
+</form></div>"""
+        return self.layout("Shopping cart", content)
+
+    def page_wishlist(self):
+        with self.state.lock:
+            basket = self.state.basket(self.session_id)
+            wishlist = basket["wishlist"]
+            if self.command == "POST":
+                if "addtocartbutton" in self.form:
+                    selected = set(self.form.get("addtocart", []))
+                    for item in [item for item in wishlist if str(item["id"]) in selected]:
+                        add_item(basket["cart"], item["slug"], next(self.state.ids))
+                        wishlist.remove(item)
+                    raise Redirect("/cart")
+                if "updatecart" in self.form:
+                    removed = set(self.form.get("removefromcart", []))
+                    wishlist[:] = [item for item in wishlist if str(item["id"]) not in removed]
+            rows = self.item_rows(wishlist, wishlist=True)
+        if not rows:
+            content = '<div class="wishlist-content">The wishlist is empty!</div>'
+        else:
+            content = f"""<div class="wishlist-content"><form method="post" action="/wishlist">
+<table class="cart"><tbody>{rows}</tbody></table>
+<div class="buttons"><input type="submit" name="updatecart" value="Update wishlist"
+ class="button-2 update-wishlist-button">
+<input type="submit" name="addtocartbutton" value="Add to cart" class="button-2 wishlist-add-to-cart-button"></div>
+</form></div>"""
+        return self.layout("Wishlist", content)
+
+    def address_fields(self, prefix):
+        """
+        Возвращает поля адреса формы оформления заказа.
+        """
+        return (f'<select id="{prefix}_CountryId" name="{prefix}.CountryId">{self.country_options()}</select>'
+                + "".join(f'<input id="{prefix}_{name}" name="{prefix}.{name}" type="text">'
+                          for name in ("City", "Address1", "ZipPostalCode", "PhoneNumber")))
+
+    def page_checkout(self):
+        self.customer(required=True)
+        steps = [
+            ("opc-shipping_method", "Shipping method", "shipping-method-next-step-button", "opc-payment_method"),
+            ("opc-payment_method", "Payment method", "payment-method-next-step-button", "opc-payment_info"),
+            ("opc-payment_info", "Payment information", "payment-info-next-step-button", "opc-confirm_order"),
+        ]
+        middle = "".join(f'<li id="{step_id}" class="step" style="display: none"><h2>{title}</h2>'
+                         f'<input type="button" class="button-1 {button}" value="Continue" '
+                         f'onclick="showStep(\'{next_step}\')"></li>'
+                         for step_id, title, button, next_step in steps)
+        content = f"""<form id="checkout-form"><ol class="opc">
+<li id="opc-billing" class="step"><h2>Billing address</h2>{self.address_fields("BillingNewAddress")}
+<div id="billing-buttons-container" class="buttons"><input type="button" class="button-1 new-address-next-step-button"
+ value="Continue" onclick="showStep('opc-shipping')"></div></li>
+<li id="opc-shipping" class="step" style="display: none"><h2>Shipping address</h2>
+<select id="shipping-address-select" name="shipping_address_id"><option value="">New Address</option></select>
+{self.address_fields("ShippingNewAddress")}
+<div id="shipping-buttons-container" class="buttons"><input type="button" class="button-1 new-address-next-step-button"
+ value="Continue" onclick="showStep('opc-shipping_method')"></div></li>
+{middle}
+<li id="opc-confirm_order" class="step" style="display: none"><h2>Confirm order</h2>
+<input type="button" class="button-1 confirm-order-next-step-button" value="Confirm" onclick="confirmOrder()"></li>
+</ol></form>"""
+        return self.layout("Checkout", content)
+
+    def page_checkout_confirm(self):
+        with self.state.lock:
+            customer = self.customer(required=True)
+            order_id = next(self.state.ids)
+            customer["orders"].append({"id": order_id, "items": list(customer["cart"]),
+                                       "city": self.field("BillingNewAddress.City")})
+            customer["cart"].clear()
+        body = json.dumps({"success": True, "redirect": "/checkout/completed/"})
+        return 200, "application/json; charset=utf-8", body
+
+    def page_checkout_completed(self):
+        customer = self.customer(required=True)
+        order_id = customer["orders"][-1]["id"] if customer["orders"] else 0
+        content = f"""<div class="section order-completed"><div class="title">
+<strong>Your order has been successfully processed!</strong></div>
+<ul class="details"><li>Order number: {order_id}</li></ul></div>"""
+        return self.layout("Thank you", content)
+
+    def page_customer_info(self):
+        customer = self.customer(required=True)
+        values = {"FirstName": customer["first_name"], "LastName": customer["last_name"], "Email": customer["email"]}
+        errors = {}
+        if self.command == "POST":
+            values = {name: self.field(name).strip() for name in values}
+            if not values["FirstName"]:
+                errors["FirstName"] = "First name is required."
+            if not values["LastName"]:
+                errors["LastName"] = "Last name is required."
+            if not values["Email"]:
+                errors["Email"] = "Email is required."
+            elif not EMAIL_PATTERN.match(values["Email"]):
+                errors["Email"] = "Wrong email"
+            if not errors:
+                with self.state.lock:
+                    customer.update(first_name=values["FirstName"], last_name=values["LastName"])
+                    if values["Email"].lower() != customer["email"].lower():
+                        self.state.customers.pop(customer["email"].lower())
+                        customer["email"] = values["Email"]
+                        self.state.customers[values["Email"].lower()] = customer
+                        self.state.sessions[self.session_id] = values["Email"].lower()
+        fields = "".join(f'<div class="inputs"><label for="{name}">{name}:</label>'
+                         f'<input id="{name}" name="{name}" type="text" value="{html.escape(value)}">'
+                         f"{self.field_error(name, errors.get(name))}</div>" for name, value in values.items())
+        content = f"""{self.account_navigation("/customer/info")}
+<form method="post" action="/customer/info">{self.token()}{fields}
+<div class="buttons"><input type="submit" class="button-1 save-customer-info-button" value="Save"></div></form>"""
+        return self.layout("My account - Customer info", content)
+
+    def page_change_password(self):
+        customer = self.customer(required=True)
+        result, summary, mismatch = "", [], ""
+        if self.command == "POST":
+            new_password = self.field("NewPassword")
+            if new_password != self.field("ConfirmNewPassword"):
+                mismatch = self.field_error("ConfirmNewPassword",
+                                            "The new password and confirmation password do not match.")
+            elif self.field("OldPassword") != customer["password"]:
+                summary.append("Old password doesn't match")
+            else:
+                with self.state.lock:
+                    customer["password"] = new_password
+                result = '<div class="result">Password was changed</div>'
+        content = f"""{self.account_navigation("/customer/changepassword")}{result}
+<form method="post" action="/customer/changepassword">{self.summary_errors(summary)}{self.token()}
+<div class="inputs"><input id="OldPassword" name="OldPassword" type="password"></div>
+<div class="inputs"><input id="NewPassword" name="NewPassword" type="password"></div>
+<div class="inputs"><input id="ConfirmNewPassword" name="ConfirmNewPassword" type="password">{mismatch}</div>
+<div class="buttons"><input type="submit" class="button-1 change-password-button" value="Change password"></div>
+</form>"""
+        return self.layout("My account - Change password", content)
+
+    def page_orders(self):
+        customer = self.customer(required=True)
+        orders = "".join(f"""<div class="section order-item"><div class="title"><strong>Order Number: {order["id"]}</strong></div>
+<input type="button" value="Details" class="button-2 order-details-button"
+ onclick="location.href='/orderdetails/{order["id"]}'"></div>""" for order in customer["orders"])
+        content = f"""{self.account_navigation("/customer/orders")}
+<div class="order-list">{orders or "No orders"}</div>"""
+        return self.layout("My account - Orders", content)
+
+    def page_order_details(self, order_id):
+        customer = self.customer(required=True)
+        order = next((order for order in customer["orders"] if str(order["id"]) == order_id), None)
+        if order is None:
+            return self.not_found()
+        items = "".join(f'<li>{html.escape(products[item["slug"]]["name"])}</li>' for item in order["items"])
+        return self.layout(f"Order information #{order_id}", f'<div class="order-details"><ul>{items}</ul></div>')
+
+    def page_addresses(self):
+        customer = self.customer(required=True)
+        items = "".join(f"""<div class="section address-item">
+<div class="title"><strong>{html.escape(address["FirstName"])} {html.escape(address["LastName"])}</strong></div>
+<ul class="info"><li class="email">Email: {html.escape(address["Email"])}</li>
+<li class="phone">Phone number: {html.escape(address["PhoneNumber"])}</li>
+<li class="address1">{html.escape(address["Address1"])}</li>
+<li class="city-state-zip">{html.escape(address["City"])}, {html.escape(address["ZipPostalCode"])}</li>
+<li class="country">{html.escape(address["CountryId"])}</li></ul>
+<div class="buttons"><input type="button" class="button-2 edit-address-button" value="Edit"
+ onclick="location.href='/customer/addressedit/{address["id"]}'">
+<input type="button" class="button-2 delete-address-button" value="Delete"
+ onclick="location.href='/customer/addressdelete/{address["id"]}'"></div></div>""" for address in customer["addresses"])
+        content = f"""{self.account_navigation("/customer/addresses")}
+<div class="address-list">{items or "No addresses"}</div>
+<div class="add-button"><input type="button" class="button-1 add-address-button" value="Add new"
+ onclick="location.href='/customer/addressadd'"></div>"""
+        return self.layout("My account - Addresses", content)
+
+    def page_address_edit(self, address_id=None):
+        customer = self.customer(required=True)
+        names = ("FirstName", "LastName", "Email", "CountryId", "City", "Address1", "ZipPostalCode", "PhoneNumber")
+        address = next((address for address in customer["addresses"] if str(address["id"]) == address_id), None)
+        if address_id is not None and address is None:
+            return self.not_found()
+        if self.command == "POST":
+            values = {name: self.field(f"Address.{name}").strip() for name in names}
+            with self.state.lock:
+                if address is None:
+                    customer["addresses"].append(dict(values, id=next(self.state.ids)))
+                else:
+                    address.update(values)
+            raise Redirect("/customer/addresses")
+        values = address or {}
+        fields = "".join(
+            f'<div class="inputs"><select id="Address_CountryId" name="Address.CountryId">'
+            f'{self.country_options(values.get(name, ""))}</select></div>' if name == "CountryId" else
+            f'<div class="inputs"><input id="Address_{name}" name="Address.{name}" type="text" '
+            f'value="{html.escape(values.get(name, ""))}"></div>' for name in names)
+        action = f"/customer/addressedit/{address_id}" if address_id else "/customer/addressadd"
+        content = f"""<form method="post" action="{action}">{self.token()}{fields}
+<div class="buttons"><input type="submit" class="button-1 save-address-button" value="Save"></div></form>"""
+        return self.layout("My account - Add new address" if address is None else "My account - Edit address", content)
+
+    def page_address_delete(self, address_id):
+        customer = self.customer(required=True)
+        with self.state.lock:
+            customer["addresses"][:] = [address for address in customer["addresses"]
+                                        if str(address["id"]) != address_id]
+        raise Redirect("/customer/addresses")
+
+
+class LocalShopServer:
+    """
+    Локальный магазин-заменитель demowebshop для быстрых прогонов без сети.
+
+    Реализует страницы и запросы, которые используют page objects: вход, регистрацию,
+    поиск, категории, товар, корзину, список желаний, шаги оформления заказа, заказы
+    и адреса. Состояние хранится в памяти и живет, пока работает сервер. Сервер
+    многопоточный, с keep-alive, и запускается за миллисекунды в фоновом потоке.
+    """
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), LocalShopHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = LocalShopState()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Запускает сервер в фоновом потоке и возвращает его адрес.
+        """
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="local-shop", daemon=True)
+        self.thread.start()
+        logger.info(f"Локальный магазин запущен: {self.url}")
+        return self.url
+
+    def stop(self):
+        """
+        Останавливает сервер и освобождает порт.
+        """
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+
+def apply_local_shop(config, url):
+    """
+    Направляет конфигурацию на локальный магазин: base_url и отдельные эталоны скриншотов,
+    поскольку разметка магазина-заменителя отличается от demowebshop.
+    """
+    config.set("DEFAULT", "base_url", url)
+    for key in ("screenshot_dir", "actual_screenshot_dir"):
+        config.set("DEFAULT", key, os.path.join(config.get("DEFAULT", key).strip(), "local", ""))
+    config.set("DEFAULT", "screenshot_namespace", "local")
+    # Аккаунты пула зарегистрированы на demowebshop, а в локальном магазине регистрация мгновенная
+    config.set("DEFAULT", "account_pool_size", "0")
+
+
+def main():
+    """
+    Запускает локальный магазин из командной строки: python -m utils.local_shop --port 8080.
+    """
+    parser = argparse.ArgumentParser(description="Local stand-in for demowebshop.tricentis.com")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+    server = LocalShopServer(args.host, args.port)
+    print(f"Serving on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
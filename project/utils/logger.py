@@ -1,16 +1,22 @@
 import logging
 import os
+from utils.parallel import worker_id, worker_log_file
 
 def setup_logger(log_file="test.log", level=logging.INFO):
     """
     Настраивает логгер.
+    В воркере pytest-xdist пишет в отдельный файл (test_gw0.log) и добавляет идентификатор воркера в записи.
     """
     log_dir = "logs"  
     if not os.path.exists(log_dir):
-        os.makedirs(log_dir)  
-    log_file_path = os.path.join(log_dir, log_file)  
-
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+        os.makedirs(log_dir, exist_ok=True)  
+    log_file_path = os.path.join(log_dir, worker_log_file(log_file))  
+
+    worker = worker_id()
+    if worker is None:
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    else:
+        formatter = logging.Formatter(f'%(asctime)s - %(levelname)s - [{worker}] %(name)s - %(message)s')
 
     file_handler = logging.FileHandler(log_file_path, mode='w')
     file_handler.setFormatter(formatter)
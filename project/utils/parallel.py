@@ -0,0 +1,95 @@
+import glob
+import heapq
+import os
+import re
+import shutil
+
+WORKER_ENV = "PYTEST_XDIST_WORKER"
+RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3} ")
+
+
+def worker_id():
+    """
+    Возвращает идентификатор воркера pytest-xdist (gw0, gw1, ...) или None в однопроцессном запуске.
+    """
+    return os.environ.get(WORKER_ENV)
+
+
+def is_xdist_controller(config):
+    """
+    Проверяет, что процесс — управляющий процесс pytest-xdist, распределяющий тесты по воркерам.
+    """
+    return not hasattr(config, "workerinput") and getattr(config.option, "dist", "no") != "no"
+
+
+def worker_log_file(log_file):
+    """
+    Возвращает имя лог-файла процесса: test.log в однопроцессном запуске, test_gw0.log в воркере.
+    """
+    worker = worker_id()
+    if worker is None:
+        return log_file
+    name, extension = os.path.splitext(log_file)
+    return f"{name}_{worker}{extension}"
+
+
+def worker_dir(directory):
+    """
+    Возвращает поддиректорию воркера для актуальных скриншотов или саму директорию вне xdist.
+    """
+    worker = worker_id()
+    if worker is None:
+        return directory
+    return os.path.join(directory, f".{worker}", "")
+
+
+def _records(path):
+    """
+    Читает записи лога: строка с меткой времени начинает запись, остальные (трассировки) относятся к ней.
+    """
+    record = []
+    with open(path, "r", encoding="utf-8", errors="replace") as log_file:
+        for line in log_file:
+            if RECORD_START.match(line) and record:
+                yield "".join(record)
+                record = []
+            record.append(line)
+    if record:
+        yield "".join(record)
+
+
+def merge_worker_logs(log_dir, log_file):
+    """
+    Дописывает в общий лог записи логов воркеров, упорядоченные по времени, и удаляет логи воркеров.
+    Возвращает число объединенных файлов.
+    """
+    name, extension = os.path.splitext(log_file)
+    worker_logs = sorted(glob.glob(os.path.join(log_dir, f"{name}_gw*{extension}")))
+    if not worker_logs:
+        return 0
+    with open(os.path.join(log_dir, log_file), "a", encoding="utf-8") as merged:
+        for record in heapq.merge(*(_records(path) for path in worker_logs), key=lambda record: record[:23]):
+            merged.write(record)
+    for path in worker_logs:
+        os.remove(path)
+    return len(worker_logs)
+
+
+def merge_worker_dirs(directory):
+    """
+    Переносит актуальные скриншоты из поддиректорий воркеров в общую директорию.
+    Возвращает число перенесенных файлов.
+    """
+    moved = 0
+    for worker_path in glob.glob(os.path.join(directory, ".gw*")):
+        for root, _, files in os.walk(worker_path):
+            for file_name in files:
+                if file_name.endswith(".tmp"):
+                    continue
+                source = os.path.join(root, file_name)
+                target = os.path.join(directory, os.path.relpath(source, worker_path))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                os.replace(source, target)
+                moved += 1
+        shutil.rmtree(worker_path, ignore_errors=True)
+    return moved
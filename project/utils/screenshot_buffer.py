@@ -0,0 +1,52 @@
+import os
+
+
+class ScreenshotBuffer:
+    """
+    Хранит байты снятых скриншотов в памяти до их сравнения с эталоном.
+    """
+    def __init__(self):
+        self._images = {}
+
+    def put(self, screenshot_name, data):
+        """
+        Сохраняет байты скриншота.
+        """
+        self._images[screenshot_name] = data
+
+    def pop(self, screenshot_name):
+        """
+        Возвращает и удаляет байты скриншота или None, если скриншот снят на диск.
+        """
+        return self._images.pop(screenshot_name, None)
+
+    def write(self, screenshot_name, path):
+        """
+        Записывает скриншот из памяти на диск, если он ещё не был сравнён.
+        """
+        data = self.pop(screenshot_name)
+        if data is None:
+            return False
+        write_screenshot(path, data)
+        return True
+
+    def clear(self):
+        """
+        Очищает буфер.
+        """
+        self._images.clear()
+
+
+def write_screenshot(path, data):
+    """
+    Записывает байты скриншота в файл, создавая директории.
+    Файл заменяется атомарно, чтобы не изменить блоб хранилища, на который он может ссылаться.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+screenshot_buffer = ScreenshotBuffer()
@@ -1,59 +1,248 @@
+import hashlib
+import io
 import os
+import numpy as np
 from PIL import Image
-import imagehash
 import logging
+from utils.baseline_index import BaselineRef, file_digest
+from utils.comparison_engine import TieredComparisonEngine
+from utils.capture_profile import JPEG_MAGIC, image_mime_type
+from utils.image_metrics import changed_pixels, changed_regions, diff_overlay
+from data.screenshot_masks import screenshot_masks
+from utils.screenshot_buffer import screenshot_buffer, write_screenshot
+
+
+def diff_screenshot_path(actual_screenshot_path):
+    """
+    Возвращает путь к изображению различий для актуального скриншота.
+    """
+    return f"{os.path.splitext(actual_screenshot_path)[0]}_diff.png"
+
+
+def png_bytes(data):
+    """
+    Возвращает скриншот в PNG: снятый профилем с потерями перекодируется, PNG возвращается как есть.
+    Эталоны и актуальные скриншоты хранятся по путям .png, поэтому их содержимое всегда PNG.
+    """
+    if image_mime_type(data) == "image/png":
+        return data
+    with Image.open(io.BytesIO(data)) as image:
+        encoded = io.BytesIO()
+        image.save(encoded, format="PNG")
+    return encoded.getvalue()
 
 
 class ScreenshotComparer:
     """
     Класс для сравнения скриншотов на основе алгоритма хеширования изображений.
+    Само сравнение выполняет многоуровневый движок TieredComparisonEngine.
     """
-    def __init__(self, screenshot_dir, actual_screenshot_dir, threshold, update_snapshots=False):
+    def __init__(self, screenshot_dir, actual_screenshot_dir, threshold, update_snapshots=False, baseline_index=None,
+                 deferred_queue=None, test_id=None, keep_actual=False, ambiguous_band=0, ssim_threshold=0.98,
+                 tile_grid=None, tile_threshold=None, masks=None, blob_store=None, snapshot_updates=None,
+                 namespace=""):
         self.screenshot_dir = screenshot_dir
         self.actual_screenshot_dir = actual_screenshot_dir
         self.threshold = threshold
         self.update_snapshots = update_snapshots
+        self.baseline_index = baseline_index
+        self.deferred_queue = deferred_queue
+        self.test_id = test_id
+        self.keep_actual = keep_actual
+        self.blob_store = blob_store
+        self.snapshot_updates = snapshot_updates
+        self.namespace = namespace
+        self.masks = screenshot_masks if masks is None else masks
+        self.engine = TieredComparisonEngine(threshold, ambiguous_band, ssim_threshold, tile_grid, tile_threshold)
+        self.last_result = None
+        self.last_regions = []
         self.logger = logging.getLogger(__name__)
 
+    def _baseline(self, screenshot_name, expected_screenshot_path):
+        """
+        Возвращает ссылку на эталон, по возможности связанную с индексом эталонов.
+        """
+        if self.baseline_index is not None:
+            return self.baseline_index.baseline(screenshot_name)
+        return BaselineRef(expected_screenshot_path, screenshot_name)
+
+    def _evaluate(self, result):
+        """
+        Логирует результат движка сравнения. Возвращает текст ошибки или None.
+        """
+        self.last_result = result
+        if result.passed:
+            self.logger.info(f"Скриншоты похожи ({result.describe()})")
+            return None
+        message = f"Скриншоты отличаются ({result.describe()})"
+        self.logger.warning(message)
+        return message
+
+    def _store_namespace(self, kind):
+        """
+        Возвращает пространство имен хранилища: baseline/actual или, для движка матрицы, baseline-firefox.
+        """
+        return f"{kind}-{self.namespace}" if self.namespace else kind
+
+    def _store_actual(self, screenshot_name, actual_screenshot_path, actual_bytes, failed, digest=None):
+        """
+        Записывает актуальный скриншот из памяти на диск при несовпадении или по запросу артефактов.
+        При включенном хранилище блобов скриншот, снятый на диск, заменяется ссылкой на блоб;
+        digest из результата сравнения избавляет от повторного чтения и хеширования скриншота.
+        Скриншот профиля с потерями (JPEG) перекодируется в PNG, как и эталон.
+        """
+        if actual_bytes is None:
+            if not os.path.exists(actual_screenshot_path):
+                return
+            with open(actual_screenshot_path, "rb") as f:
+                lossy = image_mime_type(f.read(len(JPEG_MAGIC))) != "image/png"
+            if not lossy:
+                if self.blob_store is not None:
+                    self.blob_store.store_file(self._store_namespace("actual"), screenshot_name,
+                                               actual_screenshot_path, digest)
+                return
+            with open(actual_screenshot_path, "rb") as f:
+                actual_bytes = f.read()
+        elif not (failed or self.keep_actual):
+            return
+
+        if image_mime_type(actual_bytes) != "image/png":
+            actual_bytes, digest = png_bytes(actual_bytes), None
+        if self.blob_store is not None:
+            self.blob_store.store(self._store_namespace("actual"), screenshot_name, actual_bytes,
+                                  actual_screenshot_path, digest)
+        else:
+            write_screenshot(actual_screenshot_path, actual_bytes)
+
+    def _write_baseline(self, screenshot_name, expected_screenshot_path, actual_screenshot_path, actual_bytes):
+        """
+        Записывает актуальный скриншот как эталон без декодирования: копируются исходные байты,
+        и только если содержимое отличается от текущего эталона. Запись атомарная
+        (временный файл и переименование). Возвращает added, changed или unchanged.
+        """
+        if actual_bytes is None:
+            with open(actual_screenshot_path, "rb") as f:
+                actual_bytes = f.read()
+        actual_bytes = png_bytes(actual_bytes)
+
+        status = "added"
+        if os.path.exists(expected_screenshot_path):
+            current_digest = (self.baseline_index.digest(screenshot_name) if self.baseline_index is not None
+                              else file_digest(expected_screenshot_path))
+            if current_digest == hashlib.sha256(actual_bytes).hexdigest():
+                status = "unchanged"
+            else:
+                status = "changed"
+
+        if status != "unchanged":
+            if self.blob_store is not None:
+                self.blob_store.store(self._store_namespace("baseline"), screenshot_name, actual_bytes, expected_screenshot_path)
+            else:
+                write_screenshot(expected_screenshot_path, actual_bytes)
+            if self.baseline_index is not None:
+                self.baseline_index.update(screenshot_name)
+        if self.snapshot_updates is not None:
+            self.snapshot_updates.setdefault(status, []).append(
+                f"{self.namespace}/{screenshot_name}" if self.namespace else screenshot_name)
+        return status
+
+    def _write_diff(self, baseline, actual_screenshot_path, actual_bytes, masks):
+        """
+        Сохраняет изображение различий рядом с актуальным скриншотом и возвращает области изменений.
+        Вызывается только при несовпадении.
+        """
+        try:
+            actual_source = io.BytesIO(actual_bytes) if actual_bytes is not None else actual_screenshot_path
+            with Image.open(actual_source) as actual_image:
+                actual = np.asarray(actual_image.convert("RGBA"))
+            expected = np.asarray(baseline.image().convert("RGBA"))
+            if expected.shape != actual.shape:
+                self.logger.warning(f"Размеры скриншотов различаются: {expected.shape[1::-1]} и {actual.shape[1::-1]}")
+                return []
+            changed = changed_pixels(expected, actual, masks=masks)
+            regions = changed_regions(changed)
+            diff_path = diff_screenshot_path(actual_screenshot_path)
+            os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+            Image.fromarray(diff_overlay(expected, changed, regions)).save(diff_path)
+            self.logger.info(f"Изображение различий сохранено: {diff_path}")
+            return regions
+        except Exception as e:
+            self.logger.error(f"Ошибка при построении изображения различий: {e}")
+            return []
+
+    def _report_failure(self, message, baseline, actual_screenshot_path, actual_bytes, masks):
+        """
+        Дополняет текст ошибки областями изменений из изображения различий.
+        """
+        self.last_regions = self._write_diff(baseline, actual_screenshot_path, actual_bytes, masks)
+        if not self.last_regions:
+            return message
+        regions = "; ".join(f"x={x} y={y} {width}x{height}" for x, y, width, height in self.last_regions)
+        self.logger.warning(f"Области изменений: {regions}")
+        return f"{message}, области изменений: {regions}"
+
+    def _defer(self, screenshot_name, baseline, actual_screenshot_path, actual_bytes, masks):
+        """
+        Ставит сравнение в очередь пула процессов. Хеши эталона передаются в процесс готовыми.
+        """
+        def evaluate(result):
+            message = self._evaluate(result)
+            self._store_actual(screenshot_name, actual_screenshot_path, actual_bytes, message is not None, result.digest)
+            if message is not None:
+                message = self._report_failure(message, baseline, actual_screenshot_path, actual_bytes, masks)
+            return message
+
+        actual = actual_bytes if actual_bytes is not None else actual_screenshot_path
+        self.deferred_queue.submit(self.test_id, screenshot_name, evaluate, self.engine.compare,
+                                   actual, self.engine.prepare(baseline, masks), masks)
+        self.logger.info(f"Сравнение скриншота отложено: {screenshot_name}")
+        return True
+
     def compare_screenshots(self, screenshot_name):
         """
         Сравнивает два скриншота (эталонный и актуальный).
         """
         expected_screenshot_path = os.path.join(self.screenshot_dir, screenshot_name)
         actual_screenshot_path = os.path.join(self.actual_screenshot_dir, screenshot_name)
+        actual_bytes = screenshot_buffer.pop(screenshot_name)
+        self.last_regions = []
 
         try:
+            diff_path = diff_screenshot_path(actual_screenshot_path)
+            if os.path.exists(diff_path):
+                os.remove(diff_path)
             if not os.path.exists(expected_screenshot_path):
                 self.logger.warning(f"Ожидаемый скриншот не найден: {expected_screenshot_path}")
                 if self.update_snapshots:
-                  os.makedirs(os.path.dirname(expected_screenshot_path), exist_ok=True)
-                  actual_image = Image.open(actual_screenshot_path)
-                  actual_image.save(expected_screenshot_path)
+                  self._write_baseline(screenshot_name, expected_screenshot_path, actual_screenshot_path, actual_bytes)
                   self.logger.info(f"Эталонный скриншот создан: {expected_screenshot_path}")
                   return True
                 else:
+                    self._store_actual(screenshot_name, actual_screenshot_path, actual_bytes, failed=True)
                     return False 
 
-            expected_image = Image.open(expected_screenshot_path)
-            actual_image = Image.open(actual_screenshot_path)
-
-            expected_hash = imagehash.average_hash(expected_image)
-            actual_hash = imagehash.average_hash(actual_image)
-
-            hamming_distance = expected_hash - actual_hash
-
             if self.update_snapshots:
-                actual_image.save(expected_screenshot_path) 
-                self.logger.info(f"Эталонный скриншот обновлен: {expected_screenshot_path}")
+                if self._write_baseline(screenshot_name, expected_screenshot_path, actual_screenshot_path,
+                                        actual_bytes) == "unchanged":
+                    self.logger.info(f"Эталонный скриншот не изменился: {expected_screenshot_path}")
+                else:
+                    self.logger.info(f"Эталонный скриншот обновлен: {expected_screenshot_path}")
                 return True 
 
-            if hamming_distance < self.threshold:
-                self.logger.info(f"Скриншоты похожи (расстояние Хэмминга: {hamming_distance})")
-                return True
-            else:
-                self.logger.warning(f"Скриншоты отличаются (расстояние Хэмминга: {hamming_distance})")
-                return False
+            baseline = self._baseline(screenshot_name, expected_screenshot_path)
+            masks = tuple(self.masks.get(screenshot_name, ()))
+            if self.deferred_queue is not None:
+                return self._defer(screenshot_name, baseline, actual_screenshot_path, actual_bytes, masks)
+
+            actual = actual_bytes if actual_bytes is not None else actual_screenshot_path
+            result = self.engine.compare(actual, baseline, masks)
+            message = self._evaluate(result)
+            self._store_actual(screenshot_name, actual_screenshot_path, actual_bytes, message is not None, result.digest)
+            if message is not None:
+                self._report_failure(message, baseline, actual_screenshot_path, actual_bytes, masks)
+            return message is None
         except Exception as e:
             self.logger.error(f"Ошибка при сравнении скриншотов: {e}")
+            self._store_actual(screenshot_name, actual_screenshot_path, actual_bytes, failed=True)
             return False
 
@@ -0,0 +1,204 @@
+import copy
+import os
+from configparser import ConfigParser
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+
+from utils.browser_matrix import ENGINES, parse_browsers
+from utils.comparison_engine import parse_tile_grid
+from utils.har_recorder import HAR_POLICIES
+from utils.parallel import worker_dir
+
+CONFIG_FILE = "config/config.ini"
+ENV_PREFIX = "AUTOTESTS_"
+SCREENSHOT_STORAGES = ("disk", "memory")
+REGISTRATION_MODES = ("ui", "http")
+# Значения, которые разбираются не по типу поля
+VALUE_PARSERS = {"browsers": lambda value: tuple(parse_browsers(value)), "tile_grid": parse_tile_grid}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Типизированные настройки [DEFAULT] из config.ini.
+
+    Разбираются и проверяются один раз на процесс (load_settings), после чего передаются
+    фикстурам готовыми значениями. Объект неизменяемый: настройки движка матрицы, локального
+    магазина или воркера xdist получаются производными копиями (derive, replace, for_worker).
+    Исходный ConfigParser хранится скрытым полем _parser; страницам и профилям захвата
+    выдается его копия (config_parser).
+    """
+    base_url: str = "https://demowebshop.tricentis.com"
+    browser: str = "chromium"
+    browsers: tuple = ()
+    headless: bool = True
+    screenshot_dir: str = "screenshots/"
+    actual_screenshot_dir: str = "screenshots/actual/"
+    screenshot_storage: str = "disk"
+    screenshot_namespace: str = ""
+    capture_profile: str = "default"
+    keep_actual_screenshots: bool = False
+    threshold: int = 5
+    ambiguous_band: int = 0
+    ssim_threshold: float = 0.98
+    tile_grid: tuple = None
+    tile_threshold: int = None
+    baseline_index_file: str = ".baseline_index.json"
+    blob_store_dir: str = ""
+    timeout: int = 30000
+    adaptive_waits: bool = True
+    wait_history_file: str = ".wait_history.json"
+    wait_percentile: float = 95
+    wait_multiplier: float = 3
+    wait_floor: int = 2000
+    wait_min_samples: int = 5
+    wait_history_size: int = 100
+    context_pool_size: int = 1
+    context_max_uses: int = 20
+    async_concurrency: int = 8
+    asset_cache_dir: str = ""
+    asset_cache_max_age: int = 86400
+    blocked_hosts: str = ""
+    har_dir: str = "hars/"
+    har_unmatched: str = "fail"
+    registration_mode: str = "ui"
+    account_pool_size: int = 0
+    account_pool_workers: int = 4
+    account_pool_file: str = ".account_pool.json"
+    _parser: ConfigParser = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def names(cls):
+        """
+        Возвращает имена настроек, которые задаются в config.ini и переопределяются.
+        """
+        return tuple(item.name for item in fields(cls) if item.name != "_parser")
+
+    @classmethod
+    def from_parser(cls, parser):
+        """
+        Разбирает и проверяет [DEFAULT] конфигурации. Отсутствующие ключи получают значения по умолчанию.
+        """
+        section = parser["DEFAULT"]
+        values = {}
+        for item in fields(cls):
+            if item.name == "_parser" or item.name not in section:
+                continue
+            values[item.name] = _convert(item.name, item.type, section[item.name], optional=item.default is None)
+        if values.get("tile_threshold") is None:
+            values["tile_threshold"] = values.get("threshold", cls.threshold)
+        settings = cls(_parser=parser, **values)
+        settings.validate()
+        return settings
+
+    def validate(self):
+        """
+        Проверяет допустимость значений настроек.
+        """
+        choices = {"browser": ENGINES, "screenshot_storage": SCREENSHOT_STORAGES, "har_unmatched": HAR_POLICIES,
+                   "registration_mode": REGISTRATION_MODES}
+        for name, allowed in choices.items():
+            if getattr(self, name) not in allowed:
+                raise ValueError(f"{name} = {getattr(self, name)}: допустимо {', '.join(allowed)}")
+        if self.capture_profile != "default" and not self._parser.has_section(f"CAPTURE_{self.capture_profile.upper()}"):
+            raise ValueError(f"capture_profile = {self.capture_profile}: профиль не найден в конфигурации")
+        for name in ("timeout", "wait_floor", "wait_min_samples", "wait_history_size", "context_max_uses",
+                     "async_concurrency", "account_pool_workers"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"{name} = {getattr(self, name)}: значение должно быть положительным")
+        if not 0 < self.wait_percentile <= 100:
+            raise ValueError(f"wait_percentile = {self.wait_percentile}: значение должно быть в (0, 100]")
+
+    def config_parser(self):
+        """
+        Возвращает копию конфигурации в виде ConfigParser. Изменения копии не влияют на настройки.
+        """
+        return copy.deepcopy(self._parser)
+
+    def derive(self, apply, *args):
+        """
+        Возвращает настройки, полученные применением apply(parser, *args) к копии конфигурации.
+        """
+        parser = self.config_parser()
+        apply(parser, *args)
+        return Settings.from_parser(parser)
+
+    def replace(self, **values):
+        """
+        Возвращает настройки с измененными значениями (значения задаются как в config.ini).
+        """
+        return self.derive(_set_values, values.items())
+
+    def for_worker(self):
+        """
+        Возвращает настройки процесса: у каждого воркера xdist своя директория актуальных скриншотов,
+        объединяемая в конце сессии.
+        """
+        return self.replace(actual_screenshot_dir=worker_dir(self.actual_screenshot_dir))
+
+
+def _convert(name, kind, raw, optional=False):
+    """
+    Приводит строковое значение из конфигурации к типу настройки.
+    Пустое числовое значение допустимо только для необязательной настройки (None по умолчанию).
+    """
+    value = raw.strip()
+    try:
+        if name in VALUE_PARSERS:
+            return VALUE_PARSERS[name](value)
+        if kind is bool:
+            return ConfigParser.BOOLEAN_STATES[value.lower()]
+        if kind in (int, float):
+            if not value and optional:
+                return None
+            return kind(value)
+        return value
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"{name} = {raw!r}: ожидается {getattr(kind, '__name__', kind)} ({e})") from e
+
+
+def _set_values(parser, values):
+    """
+    Записывает значения в [DEFAULT], проверяя имена настроек.
+    """
+    names = Settings.names()
+    for name, value in values:
+        if name not in names:
+            raise ValueError(f"Неизвестная настройка: {name}")
+        parser.set("DEFAULT", name, str(value))
+
+
+def parse_override(value):
+    """
+    Разбирает переопределение настройки "name=value" из командной строки.
+    """
+    name, separator, raw = value.partition("=")
+    if not separator:
+        raise ValueError(f"Переопределение настройки должно иметь вид name=value: {value}")
+    return name.strip().lower(), raw
+
+
+def env_overrides(environ):
+    """
+    Возвращает переопределения из переменных окружения AUTOTESTS_<NAME> (AUTOTESTS_TIMEOUT=10000).
+    """
+    return tuple(sorted((name[len(ENV_PREFIX):].lower(), value)
+                        for name, value in environ.items() if name.startswith(ENV_PREFIX)))
+
+
+def load_settings(path=CONFIG_FILE, overrides=(), environ=None):
+    """
+    Возвращает настройки из config.ini с переопределениями: сначала переменные окружения,
+    затем overrides из командной строки. Результат кешируется на процесс.
+    """
+    environ = os.environ if environ is None else environ
+    return _load_settings(path, env_overrides(environ) + tuple(overrides))
+
+
+@lru_cache(maxsize=None)
+def _load_settings(path, overrides):
+    parser = ConfigParser()
+    if not parser.read(path, encoding="utf-8"):
+        raise FileNotFoundError(f"Файл конфигурации не найден: {path}")
+    _set_values(parser, overrides)
+    return Settings.from_parser(parser)
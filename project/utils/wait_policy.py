@@ -0,0 +1,147 @@
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+
+from utils.file_lock import FileLock
+from utils.logger import logger
+
+
+def percentile(samples, percent):
+    """
+    Возвращает перцентиль выборки методом ближайшего ранга.
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(len(ordered) * percent / 100))
+    return ordered[rank - 1]
+
+
+class WaitPolicy:
+    """
+    Адаптивные таймауты ожиданий по истории наблюдаемых задержек.
+
+    Для каждого ожидания (область, действие, селектор) запоминаются длительности успешных
+    ожиданий в миллисекундах; история хранится в history_file и дополняется после каждого
+    прогона. Таймаут ожидания — перцентиль percent истории, умноженный на multiplier,
+    но не меньше floor и не больше ceiling (настроенный timeout). Пока у ожидания меньше
+    min_samples замеров, используется таймаут, который действовал бы без политики: fallback
+    вызова (например, таймаут проверок expect) или ceiling. Неудачные ожидания в историю не попадают, чтобы сломанный тест
+    не увеличивал таймауты остальных. На ключ хранится не больше window последних замеров.
+    """
+    def __init__(self, history_file=None, percent=95, multiplier=3.0, floor=2000, ceiling=30000,
+                 min_samples=5, window=100, enabled=True):
+        self.configure(history_file, percent, multiplier, floor, ceiling, min_samples, window, enabled)
+
+    def configure(self, history_file, percent=95, multiplier=3.0, floor=2000, ceiling=30000,
+                  min_samples=5, window=100, enabled=True):
+        """
+        Задает параметры политики и загружает историю задержек.
+        """
+        self.history_file = history_file
+        self.percent = percent
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.window = window
+        self.enabled = enabled
+        self.history = self._load() if history_file else {}
+        self.new_samples = {}
+
+    @staticmethod
+    def key(scope, action, selector):
+        """
+        Возвращает ключ ожидания в истории.
+        """
+        return f"{scope} {action} {selector}"
+
+    def _load(self):
+        """
+        Загружает историю задержек. Поврежденный или отсутствующий файл — пустая история.
+        """
+        try:
+            with open(self.history_file, "r", encoding="utf-8") as history_file:
+                return json.load(history_file)
+        except (OSError, ValueError):
+            return {}
+
+    def adaptive(self, scope, action, selector):
+        """
+        Проверяет, достаточно ли истории ожидания для адаптивного таймаута.
+        """
+        return self.enabled and len(self.history.get(self.key(scope, action, selector), [])) >= self.min_samples
+
+    def timeout(self, scope, action, selector, fallback=None):
+        """
+        Возвращает таймаут ожидания в миллисекундах. fallback — таймаут без достаточной истории.
+        """
+        if not self.adaptive(scope, action, selector):
+            return self.ceiling if fallback is None else min(fallback, self.ceiling)
+        samples = self.history[self.key(scope, action, selector)]
+        adaptive = percentile(samples, self.percent) * self.multiplier
+        return min(self.ceiling, max(self.floor, math.ceil(adaptive)))
+
+    def record(self, scope, action, selector, elapsed):
+        """
+        Добавляет замер успешного ожидания в историю.
+        """
+        key = self.key(scope, action, selector)
+        elapsed = round(elapsed, 1)
+        self.history[key] = (self.history.get(key, []) + [elapsed])[-self.window:]
+        self.new_samples.setdefault(key, []).append(elapsed)
+
+    @contextmanager
+    def measure(self, scope, action, selector, fallback=None):
+        """
+        Контекстный менеджер ожидания: возвращает таймаут и записывает длительность,
+        если ожидание завершилось успешно.
+        """
+        adaptive = self.adaptive(scope, action, selector)
+        timeout = self.timeout(scope, action, selector, fallback)
+        started = time.perf_counter()
+        try:
+            yield timeout
+        except Exception:
+            elapsed = (time.perf_counter() - started) * 1000
+            if adaptive and timeout < self.ceiling and elapsed >= timeout:
+                logger.warning(f"Ожидание '{action} {selector}' прервано адаптивным таймаутом {timeout} мс "
+                               f"(p{self.percent} истории × {self.multiplier})")
+            raise
+        self.record(scope, action, selector, (time.perf_counter() - started) * 1000)
+
+    def save(self):
+        """
+        Добавляет замеры прогона к истории в файле. Файл обновляется под межпроцессной
+        блокировкой, поэтому воркеры xdist дописывают замеры, не теряя чужие.
+        """
+        if not self.history_file or not self.new_samples:
+            return
+        directory = os.path.dirname(self.history_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with FileLock(f"{self.history_file}.lock"):
+            history = self._load()
+            for key, samples in self.new_samples.items():
+                history[key] = (history.get(key, []) + samples)[-self.window:]
+            tmp_path = f"{self.history_file}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as history_file:
+                json.dump(history, history_file, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.history_file)
+        logger.info(f"История ожиданий сохранена: {sum(map(len, self.new_samples.values()))} замеров, "
+                    f"{len(self.new_samples)} ожиданий")
+        self.history = history
+        self.new_samples = {}
+
+
+def configure_wait_policy(policy, settings):
+    """
+    Настраивает политику ожиданий по типизированным настройкам (utils.settings.Settings).
+    """
+    policy.configure(settings.wait_history_file or None, percent=settings.wait_percentile,
+                     multiplier=settings.wait_multiplier, floor=settings.wait_floor, ceiling=settings.timeout,
+                     min_samples=settings.wait_min_samples, window=settings.wait_history_size,
+                     enabled=settings.adaptive_waits)
+
+
+wait_policy = WaitPolicy()